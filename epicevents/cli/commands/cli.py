@@ -1,41 +1,85 @@
+import click
 import typer
-from cli.commands import (
-    login,
-    collaborator,
-    client,
-    contract,
-    event
-)
-from cli.utils.callbacks import permissions_callback
-
-
-app = typer.Typer()
-app.add_typer(
-    login.app,
-    name='login',
-    help="Login. Options are prompted if omitted."
-)
-app.add_typer(
-    collaborator.app,
-    name='collaborator',
-    callback=permissions_callback,
-    help="Collaborator commands."
-)
-app.add_typer(
-    client.app,
-    name='client',
-    callback=permissions_callback,
-    help="Client commands."
-)
-app.add_typer(
-    contract.app,
-    name='contract',
-    callback=permissions_callback,
-    help="Contract commands."
-)
-app.add_typer(
-    event.app,
-    name='event',
-    callback=permissions_callback,
-    help="Event commands."
-)
+from importlib import import_module
+from typer.core import TyperGroup
+
+
+# Sub commands are imported only when invoked.
+# name: (module, help, check permissions)
+COMMANDS = {
+    'login': (
+        'cli.commands.login',
+        "Login. Options are prompted if omitted.",
+        False
+    ),
+    'collaborator': (
+        'cli.commands.collaborator',
+        "Collaborator commands.",
+        True
+    ),
+    'client': (
+        'cli.commands.client',
+        "Client commands.",
+        True
+    ),
+    'contract': (
+        'cli.commands.contract',
+        "Contract commands.",
+        True
+    ),
+    'event': (
+        'cli.commands.event',
+        "Event commands.",
+        True
+    ),
+}
+
+
+def load_command(name):
+    """Import the module of a sub command and build its click group"""
+    module_name, help_text, check_permissions = COMMANDS[name]
+    module = import_module(module_name)
+    options = {}
+    if check_permissions:
+        from cli.utils.callbacks import permissions_callback
+        options['callback'] = permissions_callback
+    wrapper = typer.Typer(add_completion=False)
+    wrapper.add_typer(module.app, name=name, help=help_text, **options)
+    return typer.main.get_command(wrapper).commands[name]
+
+
+class LazyGroup(TyperGroup):
+    """Group listing all sub commands without importing them"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._listing = False
+        self._loaded = {}
+
+    def list_commands(self, ctx):
+        return sorted(COMMANDS)
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in COMMANDS:
+            return None
+        if self._listing:
+            # only the help text is needed to list the commands
+            return click.Command(cmd_name, help=COMMANDS[cmd_name][1])
+        if cmd_name not in self._loaded:
+            self._loaded[cmd_name] = load_command(cmd_name)
+        return self._loaded[cmd_name]
+
+    def format_help(self, ctx, formatter):
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+
+app = typer.Typer(cls=LazyGroup)
+
+
+@app.callback()
+def main():
+    pass
@@ -1,16 +1,33 @@
 import typer
 from typing import List
 from typing_extensions import Annotated
-from django.db.models import Value as V
-from django.db.models.functions import Concat
+from django.db import transaction
 from django.core.exceptions import ObjectDoesNotExist
-from guardian.shortcuts import assign_perm, remove_perm
 from orm.models import Client, Compagny
-from cli.utils.console import console
+from cli.utils.console import console, print_changed
 from cli.utils.callbacks import validate_callback
 from cli.utils.prompt import prompt_for
-from cli.utils.table import create_table
+from cli.utils.table import create_table, print_table
+from cli.utils.pagination import paginate
+from cli.utils.formats import OutputFormat, write_rows
+from cli.utils.options import (
+    Fields,
+    Format,
+    Limit,
+    Mine,
+    Page,
+    ImportFile,
+    ImportFormat,
+    BatchSize
+)
+from cli.utils.importer import import_file, BATCH_SIZE
 from cli.utils.user import get_user
+from cli.utils.permissions import (
+    get_checker,
+    assign_object_perm,
+    filter_changeable,
+    reassign_perm
+)
 
 
 app = typer.Typer()
@@ -27,6 +44,11 @@ def view(
             help="Filter client assigned to me",
         )
     ] = False,
+    mine: Mine = False,
+    limit: Limit = None,
+    page: Page = 1,
+    output_format: Format = OutputFormat.table,
+    fields: Fields = None,
 ):
     """
     View list of all clients.
@@ -45,10 +67,14 @@ def view(
         queryset = Client.objects.filter(**querydict)
     else:
         queryset = Client.objects.all()
+    if mine:
+        queryset = filter_changeable(user, queryset, 'change_client')
 
-    if queryset:
-        table = create_table(queryset)
-        console.print(table)
+    queryset = paginate(queryset, limit, page)
+    if output_format is not OutputFormat.table:
+        write_rows(queryset, output_format, columns=fields)
+    elif queryset.exists():
+        print_table(queryset, columns=fields)
     else:
         console.print('[red]No client found.')
 
@@ -109,7 +135,7 @@ def add(
     compagny, created = Compagny.objects.get_or_create(
         name=compagny
     )
-    new_client = Client.objects.create(
+    new_client = Client(
         first_name=first_name,
         last_name=last_name,
         email=email,
@@ -117,7 +143,9 @@ def add(
         compagny=compagny,
         contact=user
     )
-    assign_perm('change_client', user, new_client)
+    # email and phone are already checked unique by their validators
+    new_client.save(force_insert=True, validate_unique=False)
+    assign_object_perm('change_client', user, new_client)
     console.print("[green]Client successfully created.")
     table = create_table(new_client)
     console.print(table)
@@ -196,20 +224,14 @@ def change(
         console.print('[red]Token has expired. Please log in again.')
         raise typer.Exit()
     try:
-        client = Client.objects.annotate(
-            full_name=Concat(
-                'first_name',
-                V(' '),
-                'last_name'
-            )
-        ).get(
+        client = Client.objects.get(
             full_name=' '.join(client)
         )
     except ObjectDoesNotExist:
         console.print("[red]Client not found.")
         raise typer.Exit()
 
-    if not user.has_perm('change_client', client):
+    if not get_checker(user).has_perm('change_client', client):
         console.print("[red]You are not allowed.")
         raise typer.Exit()
 
@@ -228,17 +250,24 @@ def change(
             )
 
     if fields_to_change:
-        for key, value in fields_to_change.items():
-            if key == 'contact':
-                remove_perm('change_client', user, client)
-                assign_perm('change_client', value, client)
-                if client.contracts.all().exists():
-                    for contract in client.contracts.all():
-                        remove_perm('change_contract', user, contract)
-                        assign_perm('change_contract', value, contract)
-            setattr(client, key, value)
-        client.save()
-        console.print('[green]Client successfully updated.')
+        # the command is the outermost block, no savepoint is needed
+        with transaction.atomic(savepoint=False):
+            for key, value in fields_to_change.items():
+                if key == 'contact' and value.id != client.contact_id:
+                    # move the permissions of the client and its contracts
+                    reassign_perm(
+                        'change_client',
+                        Client.objects.filter(id=client.id),
+                        value
+                    )
+                    reassign_perm(
+                        'change_contract',
+                        client.contracts.all(),
+                        value
+                    )
+                setattr(client, key, value)
+            changed = client.save_dirty_fields(validate_unique=False)
+        print_changed('Client', changed)
     else:
         console.print(
             '[orange3]Client has not changed.'
@@ -247,3 +276,32 @@ def change(
 
     table = create_table(client)
     console.print(table)
+
+
+@app.command(name='import')
+def import_clients(
+    file: ImportFile,
+    input_format: ImportFormat = None,
+    batch_size: BatchSize = BATCH_SIZE,
+):
+    """
+    Import clients from a file.
+    Columns are first_name, last_name, email, phone and compagny.
+    I become the contact of the clients.
+    """
+    user = get_user()
+    if not user:
+        console.print('[red]Token has expired. Please log in again.')
+        raise typer.Exit()
+
+    imported, rejected = import_file(
+        file,
+        'client',
+        user,
+        input_format,
+        batch_size
+    )
+    console.print(f'[green]{imported} clients successfully imported.')
+    if rejected:
+        console.print(f'[red]{rejected} rows rejected.')
+        raise typer.Exit(1)
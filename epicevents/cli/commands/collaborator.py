@@ -1,8 +1,6 @@
 import typer
 from typing import List
 from typing_extensions import Annotated
-from django.db.models import Value as V
-from django.db.models.functions import Concat
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import make_password
 from django.core.exceptions import ObjectDoesNotExist
@@ -11,10 +9,13 @@ from cli.utils.sentry import (
     capture_user_update,
     capture_user_deleted
 )
-from cli.utils.console import console
+from cli.utils.console import console, print_changed
 from cli.utils.callbacks import validate_callback
 from cli.utils.prompt import prompt_for
-from cli.utils.table import create_table
+from cli.utils.table import create_table, print_table
+from cli.utils.pagination import paginate
+from cli.utils.formats import OutputFormat, write_rows
+from cli.utils.options import Fields, Format, Limit, Page
 from cli.utils.user import get_user
 
 
@@ -23,14 +24,21 @@ app = typer.Typer()
 
 
 @app.command()
-def view():
+def view(
+    limit: Limit = None,
+    page: Page = 1,
+    output_format: Format = OutputFormat.table,
+    fields: Fields = None,
+):
     """
     View list of all collaborators.
     """
     queryset = User.objects.all().exclude(is_superuser=True)
-    if queryset:
-        table = create_table(queryset)
-        console.print(table)
+    queryset = paginate(queryset, limit, page)
+    if output_format is not OutputFormat.table:
+        write_rows(queryset, output_format, columns=fields)
+    elif queryset.exists():
+        print_table(queryset, columns=fields)
     else:
         console.print("[red]No user found.")
 
@@ -189,13 +197,7 @@ def change(
         console.print('[red]Token has expired. Please log in again.')
         raise typer.Exit()
     try:
-        collaborator = User.objects.annotate(
-            full_name=Concat(
-                'first_name',
-                V(' '),
-                'last_name'
-            )
-        ).get(
+        collaborator = User.objects.get(
             full_name=' '.join(collaborator)
         )
     except ObjectDoesNotExist:
@@ -217,19 +219,27 @@ def change(
             )
 
     if fields_to_change:
+        department_changed = False
         for key, value in fields_to_change.items():
             if key == "department":
-                collaborator.groups.clear()
-                collaborator.groups.add(value)
+                department_changed = value != collaborator.department
+                if department_changed:
+                    collaborator.groups.clear()
+                    collaborator.groups.add(value)
             elif key == "password":
+                # a new salted hash differs even for the same password
+                if collaborator.check_password(value):
+                    continue
                 value = make_password(value)
             setattr(collaborator, key, value)
-        collaborator.save()
-        console.print('[green]User successfully updated.')
+        changed = collaborator.save_dirty_fields()
+        if department_changed:
+            changed.add('department')
+        print_changed('User', changed)
 
         # sentry capture user updated
-        fields = list(fields_to_change.keys())
-        capture_user_update(user, collaborator, fields)
+        if changed:
+            capture_user_update(user, collaborator, sorted(changed))
     else:
         console.print(
             '[orange3]Collaborator has not changed.'
@@ -255,13 +265,7 @@ def delete(
         console.print('[red]Token has expired. Please log in again.')
         raise typer.Exit()
     try:
-        collaborator = User.objects.annotate(
-            full_name=Concat(
-                'first_name',
-                V(' '),
-                'last_name'
-            )
-        ).get(
+        collaborator = User.objects.get(
             full_name=' '.join(collaborator)
         )
     except ObjectDoesNotExist:
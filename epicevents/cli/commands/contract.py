@@ -1,20 +1,68 @@
 import typer
+from enum import Enum
+from decimal import Decimal
+from typing import Optional
 from typing_extensions import Annotated
+from rich.table import Table
+from django.db.models import Count, Sum, Q
 from django.core.exceptions import ObjectDoesNotExist
-from guardian.shortcuts import assign_perm, remove_perm
 from uuid import UUID
 from cli.utils.sentry import capture_contract_signed
-from cli.utils.console import console
+from cli.utils.console import console, print_changed
 from cli.utils.callbacks import validate_callback
 from cli.utils.prompt import prompt_for
-from cli.utils.table import create_table
+from cli.utils.table import create_table, print_table
+from cli.utils.pagination import paginate_by_cursor
+from cli.utils.formats import OutputFormat, write_rows
+from cli.utils.options import (
+    Fields,
+    Format,
+    PageSize,
+    After,
+    Limit,
+    Mine,
+    ImportFile,
+    ImportFormat,
+    BatchSize
+)
+from cli.utils.importer import import_file, BATCH_SIZE
 from cli.utils.user import get_user
+from cli.utils.permissions import (
+    get_checker,
+    assign_object_perm,
+    filter_changeable,
+    reassign_perm
+)
 from orm.models import Contract
+from orm.departments import get_department
 
 
 app = typer.Typer()
 
 
+class SummaryBy(str, Enum):
+    client = 'client'
+    contact = 'contact'
+
+
+# fields grouped by for each --by choice, the id keeps homonyms apart
+SUMMARY_GROUPS = {
+    SummaryBy.client: ('client', 'client__full_name'),
+    SummaryBy.contact: ('client__contact', 'client__contact__full_name'),
+}
+
+CENT = Decimal('0.01')
+
+# aggregates of the summary, computed by the database
+SUMMARY_AGGREGATES = {
+    'contracts': Count('id'),
+    'signed': Count('id', filter=Q(signed=True)),
+    'unpaid': Count('id', filter=Q(balance__gt=0)),
+    'total': Sum('price'),
+    'outstanding': Sum('balance'),
+}
+
+
 @app.command()
 def view(
     ctx: typer.Context,
@@ -58,6 +106,11 @@ def view(
             help="Filter contract not paid",
         )
     ] = False,
+    mine: Mine = False,
+    page_size: PageSize = None,
+    after: After = None,
+    output_format: Format = OutputFormat.table,
+    fields: Fields = None,
 ):
     """
     View list of all contract.
@@ -96,14 +149,114 @@ def view(
         queryset = Contract.objects.filter(**querydict)
     else:
         queryset = Contract.objects.all()
+    if mine:
+        # management can change every contract
+        queryset = filter_changeable(
+            user,
+            queryset,
+            'change_contract',
+            all_groups=['management']
+        )
 
-    if queryset:
-        table = create_table(queryset)
-        console.print(table)
+    queryset, next_cursor = paginate_by_cursor(
+        queryset,
+        ('created', 'id'),
+        page_size,
+        after
+    )
+    if output_format is not OutputFormat.table:
+        write_rows(queryset, output_format, columns=fields)
+        if next_cursor:
+            typer.echo(f'Next page : --after {next_cursor}', err=True)
+    elif queryset.exists():
+        print_table(queryset, columns=fields)
+        if next_cursor:
+            console.print(f'Next page : --after {next_cursor}')
     else:
         console.print('[red]No contract found.')
 
 
+@app.command()
+def summary(
+    assigned: Annotated[
+        bool,
+        typer.Option(
+            "--assigned",
+            "-a",
+            help="Only contracts assigned to me",
+        )
+    ] = False,
+    by: Annotated[
+        Optional[SummaryBy],
+        typer.Option(
+            "--by",
+            help="Show the sums per client or per contact",
+        )
+    ] = None,
+    limit: Limit = None,
+):
+    """
+    View totals and outstanding balance of contracts.
+    """
+    user = get_user()
+    if not user:
+        console.print('[red]Token has expired. Please log in again.')
+        raise typer.Exit()
+
+    queryset = Contract.objects.all()
+    if assigned:
+        queryset = queryset.filter(client__contact=user)
+
+    totals = queryset.aggregate(**SUMMARY_AGGREGATES)
+    if not totals['contracts']:
+        console.print('[red]No contract found.')
+        raise typer.Exit()
+    table = Table(title='Contracts summary', header_style='blue')
+    add_summary_columns(table)
+    table.add_row('ALL', *get_summary_values(totals))
+    console.print(table)
+
+    if by is None:
+        return
+    group_id, group_name = SUMMARY_GROUPS[by]
+    # GROUP BY the id and the name, largest outstanding balance first
+    rows = queryset.values(group_id, group_name).annotate(
+        **SUMMARY_AGGREGATES
+    ).order_by('-outstanding', group_name, group_id)
+    if limit is not None:
+        rows = rows[:limit]
+    table = Table(title=f'Contracts per {by.value}', header_style='blue')
+    add_summary_columns(table, by.value.upper())
+    for row in rows:
+        table.add_row(str(row[group_name] or '-'), *get_summary_values(row))
+    console.print(table)
+
+
+def add_summary_columns(table, first_header=''):
+    """Add the columns of the summary tables"""
+    table.add_column(first_header, justify='center')
+    for header in [
+        'CONTRACTS', 'SIGNED', 'UNPAID', 'TOTAL', 'PAID', 'OUTSTANDING'
+    ]:
+        table.add_column(header, justify='center')
+
+
+def get_summary_values(aggregates):
+    """Get the summary values of a row of aggregates as strings.
+    Sums are rounded to the cent, SQLite sums the amounts as floats.
+    """
+    total = (aggregates['total'] or Decimal(0)).quantize(CENT)
+    outstanding = (aggregates['outstanding'] or Decimal(0)).quantize(CENT)
+    return [
+        str(aggregates['contracts']),
+        str(aggregates['signed']),
+        str(aggregates['unpaid']),
+        str(total),
+        str(total - outstanding),
+        str(outstanding),
+    ]
+
+
 @app.command()
 def add(
     client: Annotated[
@@ -116,12 +269,12 @@ def add(
         )
     ],
     price: Annotated[
-        float,
+        str,
         typer.Option(
             "--price",
             prompt=True,
             help="Contract's price",
-            min=0
+            callback=validate_callback
         )
     ],
 ):
@@ -141,7 +294,11 @@ def add(
         balance=price,
         signed=signed,
     )
-    assign_perm('change_contract', new_contract.client.contact, new_contract)
+    assign_object_perm(
+        'change_contract',
+        new_contract.client.contact,
+        new_contract
+    )
 
     # sentry capture contract signed
     if new_contract.signed:
@@ -218,8 +375,8 @@ def change(
         raise typer.Exit()
 
     if (
-        user.groups.first().name != 'management'
-        and not user.has_perm('change_contract', contract)
+        user.department != get_department('management')
+        and not get_checker(user).has_perm('change_contract', contract)
     ):
         console.print("[red]You are not allowed.")
         raise typer.Exit()
@@ -243,19 +400,18 @@ def change(
     contract_signed = contract.signed
     if fields_to_change:
         for key, value in fields_to_change.items():
-            if key == 'client':
-                remove_perm(
+            if key == 'client' and value.id != contract.client_id:
+                reassign_perm(
                     'change_contract',
-                    contract.client.contact,
-                    contract
+                    Contract.objects.filter(id=contract.id),
+                    value.contact
                 )
-                assign_perm('change_contract', value.contact, contract)
             setattr(contract, key, value)
-        contract.save()
-        console.print('[green]Contract successfully updated.')
+        changed = contract.save_dirty_fields()
+        print_changed('Contract', changed)
 
         # sentry capture contract signed
-        if fields_to_change.get('signed') is True and not contract_signed:
+        if 'signed' in changed and not contract_signed:
             capture_contract_signed(contract)
     else:
         console.print(
@@ -265,3 +421,32 @@ def change(
 
     table = create_table(contract)
     console.print(table)
+
+
+@app.command(name='import')
+def import_contracts(
+    file: ImportFile,
+    input_format: ImportFormat = None,
+    batch_size: BatchSize = BATCH_SIZE,
+):
+    """
+    Import contracts from a file.
+    Columns are client (full name), price, balance and signed.
+    Balance is the price and signed is false if omitted.
+    """
+    user = get_user()
+    if not user:
+        console.print('[red]Token has expired. Please log in again.')
+        raise typer.Exit()
+
+    imported, rejected = import_file(
+        file,
+        'contract',
+        user,
+        input_format,
+        batch_size
+    )
+    console.print(f'[green]{imported} contracts successfully imported.')
+    if rejected:
+        console.print(f'[red]{rejected} rows rejected.')
+        raise typer.Exit(1)
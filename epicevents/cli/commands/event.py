@@ -3,13 +3,31 @@ from typing_extensions import Annotated
 from datetime import datetime
 from uuid import UUID
 from django.core.exceptions import ObjectDoesNotExist
-from guardian.shortcuts import assign_perm, remove_perm
 from orm.models import Event, Contract
-from cli.utils.console import console
+from orm.departments import get_department
+from cli.utils.console import console, print_changed
 from cli.utils.callbacks import validate_callback
-from cli.utils.table import create_table
+from cli.utils.table import create_table, print_table
+from cli.utils.pagination import paginate
+from cli.utils.formats import OutputFormat, write_rows
+from cli.utils.options import (
+    Fields,
+    Format,
+    Limit,
+    Mine,
+    Page,
+    ImportFile,
+    ImportFormat,
+    BatchSize
+)
+from cli.utils.importer import import_file, BATCH_SIZE
 from cli.utils.prompt import prompt_for
 from cli.utils.user import get_user
+from cli.utils.permissions import (
+    get_checker,
+    filter_changeable,
+    reassign_perm
+)
 
 
 app = typer.Typer()
@@ -34,6 +52,11 @@ def view(
             help="Filter event assigned to me",
         )
     ] = False,
+    mine: Mine = False,
+    limit: Limit = None,
+    page: Page = 1,
+    output_format: Format = OutputFormat.table,
+    fields: Fields = None,
 ):
     """
     View list of all events.
@@ -54,10 +77,20 @@ def view(
         queryset = Event.objects.filter(**querydict)
     else:
         queryset = Event.objects.all()
+    if mine:
+        # management can change every event
+        queryset = filter_changeable(
+            user,
+            queryset,
+            'change_event',
+            all_groups=['management']
+        )
 
-    if queryset:
-        table = create_table(queryset)
-        console.print(table)
+    queryset = paginate(queryset, limit, page)
+    if output_format is not OutputFormat.table:
+        write_rows(queryset, output_format, columns=fields)
+    elif queryset.exists():
+        print_table(queryset, columns=fields)
     else:
         console.print('[red]No event found.')
 
@@ -248,8 +281,8 @@ def change(
         raise typer.Exit()
 
     if (
-        user.groups.first().name != 'management'
-        and not user.has_perm('change_event', event)
+        user.department != get_department('management')
+        and not get_checker(user).has_perm('change_event', event)
     ):
         console.print("[red]You are not allowed.")
         raise typer.Exit()
@@ -281,13 +314,15 @@ def change(
 
     if fields_to_change:
         for key, value in fields_to_change.items():
-            if key == 'contact':
-                if event.contact is not None:
-                    remove_perm('change_event', event.contact, event)
-                assign_perm('change_event', value, event)
+            if key == 'contact' and value.id != event.contact_id:
+                reassign_perm(
+                    'change_event',
+                    Event.objects.filter(id=event.id),
+                    value
+                )
             setattr(event, key, value)
-        event.save()
-        console.print('[green]Event successfully updated.')
+        changed = event.save_dirty_fields()
+        print_changed('Event', changed)
     else:
         console.print(
             '[orange3]Event has not changed.'
@@ -296,3 +331,32 @@ def change(
 
     table = create_table(event)
     console.print(table)
+
+
+@app.command(name='import')
+def import_events(
+    file: ImportFile,
+    input_format: ImportFormat = None,
+    batch_size: BatchSize = BATCH_SIZE,
+):
+    """
+    Import events from a file.
+    Columns are contract (id), name, start_date, end_date, location,
+    attendees and note.
+    """
+    user = get_user()
+    if not user:
+        console.print('[red]Token has expired. Please log in again.')
+        raise typer.Exit()
+
+    imported, rejected = import_file(
+        file,
+        'event',
+        user,
+        input_format,
+        batch_size
+    )
+    console.print(f'[green]{imported} events successfully imported.')
+    if rejected:
+        console.print(f'[red]{rejected} rows rejected.')
+        raise typer.Exit(1)
@@ -0,0 +1,248 @@
+"""Warm process mode for the CRM.
+
+The server keeps Django, the database connection and the Typer app
+loaded in one long-lived process and runs the commands forwarded by
+the client over a local Unix socket.
+
+The client must stay cheap to import: Django and the commands are only
+imported by the server.
+
+Messages are JSON objects, one per line:
+    client -> server : {"argv": [...], "width": int, "color": bool}
+                       {"input": str} or {"eof": true} to answer a prompt
+    server -> client : {"out": str}, {"err": str},
+                       {"prompt": str, "hide": bool}, {"exit": int}
+"""
+import io
+import os
+import sys
+import json
+import socket
+import shutil
+import traceback
+from getpass import getpass
+from pathlib import Path
+from contextlib import contextmanager, redirect_stdout, redirect_stderr
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+SOCKET = 'CLI_SOCKET'
+DEFAULT_SOCKET = BASE_DIR / '.epicevents.sock'
+
+
+def get_socket_path():
+    """Get the socket path from environment or the default one"""
+    return Path(os.environ.get(SOCKET) or DEFAULT_SOCKET)
+
+
+def send(stream, **message):
+    stream.write(json.dumps(message) + '\n')
+    stream.flush()
+
+
+def receive(stream):
+    line = stream.readline()
+    if not line:
+        raise EOFError()
+    return json.loads(line)
+
+
+class RemoteStream(io.TextIOBase):
+    """Text stream writing to the client through the socket"""
+
+    def __init__(self, stream, name, tty=False):
+        self._stream = stream
+        self._name = name
+        self._tty = tty
+
+    @property
+    def encoding(self):
+        return 'utf-8'
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        return self._tty
+
+    def write(self, text):
+        if not isinstance(text, str):
+            # behave like a text stream so click does not use it as binary
+            raise TypeError('write() argument must be str')
+        if text:
+            send(self._stream, **{self._name: text})
+        return len(text)
+
+
+# Client
+
+
+def forward(argv, path=None):
+    """Forward argv to the server and print its output.
+
+    returns:
+        the exit code of the command or None if no server is listening
+    """
+    path = path or get_socket_path()
+    if not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        # stale socket file, the server is not running
+        sock.close()
+        return None
+    with sock, sock.makefile('r', encoding='utf-8') as reader, \
+            sock.makefile('w', encoding='utf-8') as writer:
+        send(
+            writer,
+            argv=argv,
+            width=shutil.get_terminal_size().columns,
+            color=sys.stdout.isatty()
+        )
+        while True:
+            try:
+                message = receive(reader)
+            except EOFError:
+                return 1
+            if 'out' in message:
+                sys.stdout.write(message['out'])
+                sys.stdout.flush()
+            elif 'err' in message:
+                sys.stderr.write(message['err'])
+                sys.stderr.flush()
+            elif 'prompt' in message:
+                prompt = getpass if message['hide'] else input
+                try:
+                    send(writer, input=prompt(message['prompt']))
+                except (EOFError, KeyboardInterrupt):
+                    send(writer, eof=True)
+            elif 'exit' in message:
+                return message['exit']
+
+
+# Server
+
+
+@contextmanager
+def remote_session(reader, writer, width, color):
+    """Route the console, click output and prompts to the client"""
+    import click.termui
+    from django.conf import settings
+    from dotenv import dotenv_values
+    from rich.console import ColorSystem
+    from cli.utils.console import console
+
+    def prompt_func(hide):
+        def ask(prompt):
+            send(writer, prompt=prompt, hide=hide)
+            message = receive(reader)
+            if message.get('eof'):
+                raise EOFError()
+            return message['input']
+        return ask
+
+    # the token may have been renewed by another process since
+    # the last command
+    token = dotenv_values(settings.BASE_DIR / '.env').get('TOKEN')
+    if token:
+        os.environ['TOKEN'] = token
+    else:
+        os.environ.pop('TOKEN', None)
+
+    visible, hidden = (
+        click.termui.visible_prompt_func,
+        click.termui.hidden_prompt_func
+    )
+    click.termui.visible_prompt_func = prompt_func(hide=False)
+    click.termui.hidden_prompt_func = prompt_func(hide=True)
+    console.width = width
+    # colours are detected once when the console is created,
+    # use the ones of the client terminal instead
+    console._color_system = ColorSystem.EIGHT_BIT if color else None
+    try:
+        with redirect_stdout(RemoteStream(writer, 'out', tty=color)), \
+                redirect_stderr(RemoteStream(writer, 'err', tty=color)):
+            yield
+    finally:
+        click.termui.visible_prompt_func = visible
+        click.termui.hidden_prompt_func = hidden
+
+
+def run(command, argv):
+    """Run a command as epicevents.py would and return its exit code"""
+    from django.db import connection, close_old_connections
+    from epicevents import sentry
+
+    # as Django does around each request, close the connection if it
+    # is older than CONN_MAX_AGE and check it with CONN_HEALTH_CHECKS
+    close_old_connections()
+    try:
+        command.main(args=argv, prog_name='epicevents.py')
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except Exception as e:
+        sentry.capture_exception(e)
+        traceback.print_exc()
+        # start the next command with a fresh connection
+        connection.close()
+        return 1
+    finally:
+        sentry.flush()
+        close_old_connections()
+    return 0
+
+
+def handle(conn, command):
+    with conn.makefile('r', encoding='utf-8') as reader, \
+            conn.makefile('w', encoding='utf-8') as writer:
+        try:
+            request = receive(reader)
+        except (EOFError, ValueError):
+            return
+        with remote_session(
+            reader,
+            writer,
+            width=request.get('width', 80),
+            color=request.get('color', False)
+        ):
+            code = run(command, request.get('argv', []))
+        send(writer, exit=code)
+
+
+def serve(path=None, stdout=sys.stdout):
+    """Load the CLI once and run forwarded commands until interrupted"""
+    import typer
+    from epicevents import sentry
+    from cli.commands.cli import app
+
+    sentry.setup()
+    path = path or get_socket_path()
+    # build the click command tree only once
+    command = typer.main.get_command(app)
+    if path.exists():
+        path.unlink()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    os.chmod(path, 0o600)
+    server.listen()
+    stdout.write(f'Listening on {path}\n')
+    stdout.flush()
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    handle(conn, command)
+                except (BrokenPipeError, ConnectionResetError, EOFError):
+                    # client went away in the middle of a command
+                    pass
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
@@ -0,0 +1,101 @@
+"""Rows per second of client import, compared with the rows created
+one by one as client add does.
+
+Run from the epicevents folder:
+    python -m cli.tests.benchmarks.bench_bulk_import [ROWS]
+
+The default is 10 000 rows per run. Clients are added to the benchmark
+database, in the temporary folder, with new emails at each run.
+"""
+import sys
+import uuid
+import tempfile
+from pathlib import Path
+from cli.tests.benchmarks.utils import setup_django, measure, report
+
+
+REPEAT = 3
+
+
+def write_clients(path, count):
+    """Write count new clients to a CSV file"""
+    prefix = uuid.uuid4().hex[:8]
+    phone = int(prefix, 16) % 10 ** 8
+    with open(path, 'w') as file:
+        file.write('first_name,last_name,email,phone,compagny\n')
+        for number in range(count):
+            file.write(
+                f'import,{prefix}{number},{prefix}{number}@import.com,'
+                f'07{(phone + number) % 10 ** 8:08},'
+                f'import compagny {number % 100}\n'
+            )
+
+
+def add_one_by_one(path, user):
+    """Create each row as client add does"""
+    import csv
+    from guardian.shortcuts import assign_perm
+    from orm.models import Client, Compagny
+    from cli.utils.validators import validate_email, validate_phone
+
+    class Context:
+        info_name = 'add'
+        obj = None
+
+    with open(path, newline='') as file:
+        for row in csv.DictReader(file):
+            email = validate_email(row['email'], Context)
+            phone = validate_phone(row['phone'], Context)
+            compagny, created = Compagny.objects.get_or_create(
+                name=row['compagny']
+            )
+            client = Client.objects.create(
+                first_name=row['first_name'],
+                last_name=row['last_name'],
+                email=email,
+                phone=phone,
+                compagny=compagny,
+                contact=user
+            )
+            assign_perm('change_client', user, client)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    setup_django()
+
+    from django.contrib.auth.models import Group
+    from orm.models import User
+    from cli.utils import importer
+
+    user = User.objects.filter(email='benchmark@sales.com').first()
+    if user is None:
+        user = User.objects.create_user(
+            first_name='user',
+            last_name='benchmark',
+            email='benchmark@sales.com',
+            phone='0600000000',
+            password='password',
+            department=Group.objects.get(name='sales')
+        )
+
+    def import_file(path, user):
+        importer.import_file(path, 'client', user)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'clients.csv'
+        for name, func in [
+            ('one by one (client add)', add_one_by_one),
+            ('client import', import_file),
+        ]:
+            results[name] = []
+            for _ in range(REPEAT):
+                # new clients each time, the file is not measured
+                write_clients(path, count)
+                results[name] += measure(lambda: func(path, user), 1)
+    report(f'client import ({count} rows, {REPEAT} runs)', results, count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""collaborator view rows with a join on groups and with the
+department subquery.
+
+Run from the epicevents folder:
+    python -m cli.tests.benchmarks.bench_collaborators [COLLABORATORS]
+
+The default is 50 000 collaborators, one in five in two groups. They
+are created once in the benchmark database, in the temporary folder.
+"""
+import sys
+from cli.tests.benchmarks.utils import setup_django, measure, report
+
+
+REPEAT = 10
+BATCH_SIZE = 10000
+
+
+def create_collaborators(count):
+    from django.contrib.auth.models import Group
+    from orm.models import User
+
+    existing = User.objects.filter(email__endswith='@collaborator.com')
+    existing = existing.count()
+    if existing >= count:
+        return
+    print(f'Creating {count - existing} collaborators...')
+    groups = list(Group.objects.order_by('pk'))
+    Membership = User.groups.through
+    for start in range(existing, count, BATCH_SIZE):
+        users = User.objects.bulk_create([
+            User(
+                first_name='collaborator',
+                last_name=str(number),
+                email=f'{number}@collaborator.com',
+                phone=f'+331{number:08}',
+                password='!',
+            )
+            for number in range(start, min(start + BATCH_SIZE, count))
+        ])
+        memberships = []
+        for user in users:
+            number = int(user.last_name)
+            memberships.append(
+                Membership(user_id=user.id, group=groups[number % 3])
+            )
+            if number % 5 == 0:
+                memberships.append(
+                    Membership(user_id=user.id, group=groups[number % 3 - 1])
+                )
+        Membership.objects.bulk_create(memberships)
+
+
+def join_rows(queryset, fields):
+    """Rows as built by table_add_row before, a row per group"""
+    rows = []
+    for values_tuple in queryset.values_list(*fields, named=True):
+        values = []
+        previous_value = None
+        for key, value in values_tuple._asdict().items():
+            if '__first_name' in key:
+                previous_value = value
+                continue
+            if previous_value:
+                value = f'{previous_value} {value}'
+                previous_value = None
+            values.append(str(value))
+        rows.append(values)
+    return rows
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    setup_django()
+    create_collaborators(count)
+
+    from orm.models import User
+    from cli.utils.table import FIELDS, get_rows
+
+    queryset = User.objects.exclude(is_superuser=True)
+    join_fields = [
+        'groups__name' if field_name == 'department' else field_name
+        for field_name in FIELDS['user']
+    ]
+    rows = {
+        'join on groups (before)': lambda: join_rows(
+            queryset,
+            join_fields
+        ),
+        'department subquery (after)': lambda: list(
+            get_rows('User', queryset)
+        ),
+    }
+    for name, read in rows.items():
+        print(f'{name}: {len(read())} rows')
+    report(
+        f'collaborator view rows ({count} collaborators, {REPEAT} runs)',
+        {name: measure(read, REPEAT) for name, read in rows.items()}
+    )
+
+
+if __name__ == '__main__':
+    main()
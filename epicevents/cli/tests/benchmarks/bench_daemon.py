@@ -0,0 +1,68 @@
+"""Cold vs warm latency of a CLI command.
+
+Run from the epicevents folder, logged in for a representative run:
+    python -m cli.tests.benchmarks.bench_daemon [COMMAND ...]
+
+The default command is `client view`.
+"""
+import os
+import sys
+import time
+import tempfile
+import subprocess
+from pathlib import Path
+from cli.tests.benchmarks.utils import measure, report
+
+
+BASE_DIR = Path(__file__).resolve().parents[3]
+REPEAT = 20
+
+
+def run_command(argv, socket_path):
+    env = dict(os.environ, CLI_SOCKET=str(socket_path))
+    subprocess.run(
+        [sys.executable, 'epicevents.py', *argv],
+        cwd=BASE_DIR,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def start_server(socket_path):
+    server = subprocess.Popen(
+        [
+            sys.executable, 'manage.py', 'runcliserver',
+            '--socket', str(socket_path)
+        ],
+        cwd=BASE_DIR,
+        stdout=subprocess.DEVNULL,
+    )
+    while not socket_path.exists():
+        if server.poll() is not None:
+            raise RuntimeError('The server did not start')
+        time.sleep(0.05)
+    return server
+
+
+def main():
+    argv = sys.argv[1:] or ['client', 'view']
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = Path(tmp) / 'epicevents.sock'
+        # no server listening on this socket yet
+        cold = measure(lambda: run_command(argv, socket_path), REPEAT)
+        server = start_server(socket_path)
+        try:
+            warm = measure(lambda: run_command(argv, socket_path), REPEAT)
+        finally:
+            server.terminate()
+            server.wait()
+    report(
+        f"epicevents.py {' '.join(argv)} ({REPEAT} runs)",
+        {'cold process': cold, 'warm process': warm}
+    )
+
+
+if __name__ == '__main__':
+    main()
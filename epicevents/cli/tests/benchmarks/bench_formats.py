@@ -0,0 +1,47 @@
+"""Throughput of contract view in each output format.
+
+Run from the epicevents folder:
+    python -m cli.tests.benchmarks.bench_formats [ROWS]
+
+The default is 20 000 rows, read from the contracts of the benchmark
+database. Output is written to the null device.
+"""
+import os
+import sys
+from cli.tests.benchmarks.utils import (
+    setup_django,
+    create_contracts,
+    measure,
+    report
+)
+
+
+REPEAT = 3
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    setup_django()
+    create_contracts(rows)
+
+    from orm.models import Contract
+    from cli.utils.console import console
+    from cli.utils.table import print_table
+    from cli.utils.formats import OutputFormat, write_rows
+
+    queryset = Contract.objects.order_by('created', 'id')[:rows]
+    results = {}
+    with open(os.devnull, 'w') as null:
+        console.file = null
+        results['table (rich)'] = measure(
+            lambda: print_table(queryset), REPEAT
+        )
+        for output_format in list(OutputFormat)[1:]:
+            results[output_format.value] = measure(
+                lambda: write_rows(queryset, output_format, null), REPEAT
+            )
+    report(f'contract view, {rows} rows ({REPEAT} runs)', results, rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Client lookup by full name with a Concat annotation and with the
+indexed full_name column.
+
+Run from the epicevents folder:
+    python -m cli.tests.benchmarks.bench_full_name [CLIENTS]
+
+The default is 500 000 clients. They are created once in the benchmark
+database, in the temporary folder.
+"""
+import sys
+from cli.tests.benchmarks.utils import setup_django, measure, report
+
+
+REPEAT = 20
+BATCH_SIZE = 10000
+
+
+def create_clients(count):
+    from orm.models import Client, Compagny
+
+    existing = Client.objects.filter(email__endswith='@bench-client.com')
+    existing = existing.count()
+    if existing >= count:
+        return
+    print(f'Creating {count - existing} clients...')
+    compagny, created = Compagny.objects.get_or_create(name='benchmark')
+    for start in range(existing, count, BATCH_SIZE):
+        # bulk_create does not call save, full_name is set here
+        Client.objects.bulk_create([
+            Client(
+                first_name='client',
+                last_name=str(number),
+                full_name=f'client {number}',
+                email=f'{number}@bench-client.com',
+                phone=f'+339{number:08}',
+                compagny=compagny,
+            )
+            for number in range(start, min(start + BATCH_SIZE, count))
+        ])
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    setup_django()
+    create_clients(count)
+
+    from django.db.models import Value as V
+    from django.db.models.functions import Concat
+    from orm.models import Client
+
+    full_name = f'client {count // 2}'
+    report(
+        f'client lookup by full name ({count} clients, {REPEAT} runs)',
+        {
+            'Concat annotation (before)': measure(
+                lambda: Client.objects.annotate(
+                    concat_name=Concat('first_name', V(' '), 'last_name')
+                ).get(concat_name=full_name),
+                REPEAT
+            ),
+            'indexed full_name (after)': measure(
+                lambda: Client.objects.get(full_name=full_name),
+                REPEAT
+            ),
+        }
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Import time of the CLI for each sub command, based on -X importtime.
+
+Run from the epicevents folder:
+    python -m cli.tests.benchmarks.bench_import [--top N]
+
+Each scenario runs in a fresh interpreter after django.setup(), so the
+numbers only include what the CLI imports itself.
+"""
+import sys
+import argparse
+import subprocess
+from pathlib import Path
+from cli.commands.cli import COMMANDS
+
+
+BASE_DIR = Path(__file__).resolve().parents[3]
+REPEAT = 5
+
+SETUP = """
+import os
+import django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'epicevents.settings')
+django.setup()
+print('--- setup done ---', file=__import__('sys').stderr)
+"""
+
+SCENARIOS = {
+    '--help': 'from cli.commands.cli import app',
+    'all commands (eager)': (
+        'from cli.commands.cli import app\n'
+        'from cli.utils.callbacks import permissions_callback\n'
+        + ''.join(f'import {module}\n' for module, *_ in COMMANDS.values())
+    ),
+    **{
+        name: (
+            'from cli.commands.cli import app, load_command\n'
+            f'load_command({name!r})'
+        )
+        for name in COMMANDS
+    }
+}
+
+
+def import_times(code):
+    """Return {module: (self_us, cumulative_us)} imported by code"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', SETUP + code],
+        cwd=BASE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # ignore everything imported by django.setup()
+    lines = result.stderr.split('--- setup done ---')[-1].splitlines()
+    times = {}
+    for line in lines:
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--top', type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<25}{'modules':>10}{'import time':>15}")
+    for name, code in SCENARIOS.items():
+        # keep the fastest run to limit the noise
+        runs = [import_times(code) for _ in range(REPEAT)]
+        times = min(runs, key=lambda t: sum(s for s, _ in t.values()))
+        total = sum(self_us for self_us, _ in times.values())
+        print(f'{name:<25}{len(times):>10}{total / 1000:>13.1f}ms')
+        heaviest = sorted(times.items(), key=lambda t: -t[1][0])
+        for module, (self_us, _) in heaviest[:args.top]:
+            print(f'    {module:<40}{self_us / 1000:>8.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""contract view --mine, the contracts a collaborator can change, found
+by checking the permission of each row and in the query.
+
+Run from the epicevents folder:
+    python -m cli.tests.benchmarks.bench_mine [CONTRACTS]
+
+The default is 100 000 contracts shared by 10 sales collaborators,
+each one has the permission rows of their contracts. They are created
+once in the benchmark database, in the temporary folder.
+"""
+import sys
+from itertools import islice
+from cli.tests.benchmarks.utils import setup_django, measure, report
+
+
+REPEAT = 5
+CONTACTS = 10
+BATCH_SIZE = 10000
+PAGE_SIZE = 100
+
+
+def create_contracts(count):
+    """Create a client per contact and count contracts shared by them"""
+    from django.contrib.auth.models import Group
+    from guardian.shortcuts import assign_perm
+    from orm.models import User, Client, Compagny, Contract
+
+    compagny = Compagny.objects.get_or_create(name='benchmark')[0]
+    clients = []
+    for number in range(CONTACTS):
+        user = User.objects.filter(email=f'mine{number}@sales.com').first()
+        if user is None:
+            user = User.objects.create_user(
+                first_name='mine',
+                last_name=str(number),
+                email=f'mine{number}@sales.com',
+                phone=f'06888888{number:02}',
+                password='password',
+                department=Group.objects.get(name='sales')
+            )
+        client, created = Client.objects.get_or_create(
+            email=f'mine{number}@client.com',
+            defaults={
+                'first_name': 'mine',
+                'last_name': f'client {number}',
+                'phone': f'06777777{number:02}',
+                'compagny': compagny,
+                'contact': user,
+            }
+        )
+        clients.append(client)
+    queryset = Contract.objects.filter(client__in=clients)
+    existing = queryset.count()
+    if existing >= count:
+        return clients
+    print(f'Creating {count - existing} contracts...')
+    for start in range(existing, count, BATCH_SIZE):
+        contracts = Contract.objects.bulk_create([
+            Contract(
+                client=clients[number % CONTACTS],
+                price=1000,
+                balance=500
+            )
+            for number in range(start, min(start + BATCH_SIZE, count))
+        ])
+        for client in clients:
+            assign_perm(
+                'change_contract',
+                client.contact,
+                [c for c in contracts if c.client_id == client.id]
+            )
+    return clients
+
+
+def check_each_row(user, queryset):
+    """The ids of the contracts user can change, checked row by row
+    with the permissions prefetched a chunk at a time
+    """
+    from cli.utils.permissions import PermissionChecker
+
+    checker = PermissionChecker(user)
+    ids = set()
+    rows = queryset.only('id').iterator(chunk_size=2000)
+    while chunk := list(islice(rows, 2000)):
+        checker.prefetch_perms(chunk)
+        ids.update(
+            contract.id for contract in chunk
+            if checker.has_perm('change_contract', contract)
+        )
+    return ids
+
+
+def filtered_ids(user, queryset, mode):
+    from django.conf import settings
+    from cli.utils.permissions import filter_changeable
+
+    settings.OBJECT_PERMISSIONS = mode
+    try:
+        return set(
+            filter_changeable(
+                user,
+                queryset,
+                'change_contract'
+            ).values_list('id', flat=True)
+        )
+    finally:
+        settings.OBJECT_PERMISSIONS = 'guardian'
+
+
+def first_page(user, queryset):
+    """The first page of contract view --mine --page-size PAGE_SIZE"""
+    from cli.utils.pagination import paginate_by_cursor
+    from cli.utils.permissions import filter_changeable
+
+    page, cursor = paginate_by_cursor(
+        filter_changeable(user, queryset, 'change_contract'),
+        ('created', 'id'),
+        PAGE_SIZE
+    )
+    return list(page.values_list('id', flat=True))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    setup_django()
+    clients = create_contracts(count)
+
+    from orm.models import User, Contract
+
+    user = User.objects.prefetch_related('groups').get(
+        id=clients[0].contact_id
+    )
+    queryset = Contract.objects.filter(client__in=clients)
+    expected = check_each_row(user, queryset)
+    assert filtered_ids(user, queryset, 'guardian') == expected
+    assert filtered_ids(user, queryset, 'ownership') == expected
+
+    report(
+        f'contracts I can change ({queryset.count()} contracts, '
+        f'{len(expected)} mine, {REPEAT} runs)',
+        {
+            'each row checked (before)': measure(
+                lambda: check_each_row(user, queryset),
+                REPEAT
+            ),
+            'guardian rows in the query': measure(
+                lambda: filtered_ids(user, queryset, 'guardian'),
+                REPEAT
+            ),
+            'ownership in the query': measure(
+                lambda: filtered_ids(user, queryset, 'ownership'),
+                REPEAT
+            ),
+            f'first page of {PAGE_SIZE}': measure(
+                lambda: first_page(user, Contract.objects.all()),
+                REPEAT
+            ),
+        }
+    )
+
+
+if __name__ == '__main__':
+    main()
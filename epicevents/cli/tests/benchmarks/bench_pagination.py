@@ -0,0 +1,78 @@
+"""Latency of a contract view page at several positions, with OFFSET
+and with keyset (cursor) pagination.
+
+Run from the epicevents folder:
+    python -m cli.tests.benchmarks.bench_pagination [CONTRACTS]
+
+The default is 1 000 000 contracts. They are created once in the
+benchmark database, in the temporary folder.
+"""
+import sys
+from cli.tests.benchmarks.utils import (
+    setup_django,
+    create_contracts,
+    measure,
+    report
+)
+
+
+REPEAT = 20
+PAGE_SIZE = 50
+KEYS = ('created', 'id')
+
+
+def offset_page(position):
+    from orm.models import Contract
+    from cli.utils.pagination import paginate
+
+    page = position // PAGE_SIZE + 1
+    return lambda: list(
+        paginate(Contract.objects.order_by(*KEYS), PAGE_SIZE, page)
+    )
+
+
+def keyset_page(position):
+    from orm.models import Contract
+    from cli.utils.pagination import paginate_by_cursor, encode_cursor
+
+    cursor = None
+    if position:
+        # cursor printed by the previous page
+        cursor = encode_cursor(
+            Contract.objects.order_by(*KEYS).values_list(*KEYS)[position - 1]
+        )
+
+    def run():
+        page, next_cursor = paginate_by_cursor(
+            Contract.objects.all(),
+            KEYS,
+            PAGE_SIZE,
+            cursor
+        )
+        list(page)
+    return run
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    setup_django()
+    create_contracts(count)
+    positions = [0, count // 100, count // 2, count - PAGE_SIZE]
+    results = {}
+    for position in positions:
+        results[f'offset, row {position}'] = measure(
+            offset_page(position), REPEAT
+        )
+    for position in positions:
+        results[f'keyset, row {position}'] = measure(
+            keyset_page(position), REPEAT
+        )
+    report(
+        f'contract view page of {PAGE_SIZE} rows'
+        f' ({count} contracts, {REPEAT} runs)',
+        results
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""Object permission checks and writes with the guardian rows and with
+the ownership backend.
+
+Run from the epicevents folder:
+    python -m cli.tests.benchmarks.bench_permissions [OBJECTS]
+
+The default is 1 000 contracts checked and created per run. The
+contracts of bench_reassign are used, they are created once in the
+benchmark database, in the temporary folder.
+"""
+import sys
+from cli.tests.benchmarks.utils import setup_django, measure, report
+from cli.tests.benchmarks.bench_reassign import create_users, create_client
+
+
+REPEAT = 5
+
+
+def check_each(backend, user, contracts):
+    """Check each contract as user.has_perm does"""
+    return [
+        backend.has_perm(user, 'orm.change_contract', contract)
+        for contract in contracts
+    ]
+
+
+def check_prefetched(user, contracts):
+    """Check the contracts as the commands do"""
+    from cli.utils.permissions import PermissionChecker
+
+    checker = PermissionChecker(user)
+    checker.prefetch_perms(contracts)
+    return [
+        checker.has_perm('change_contract', contract)
+        for contract in contracts
+    ]
+
+
+def create_contracts(client, count):
+    """Create contracts as contract import does"""
+    from django.db import transaction
+    from orm.models import Contract
+    from cli.utils.permissions import assign_object_perm
+
+    with transaction.atomic():
+        contracts = Contract.objects.bulk_create([
+            Contract(client=client, price=1000, balance=500)
+            for _ in range(count)
+        ])
+        assign_object_perm('change_contract', client.contact, contracts)
+
+
+def with_mode(mode, func, *args):
+    """Call func with OBJECT_PERMISSIONS set to mode"""
+    from django.conf import settings
+
+    def call():
+        settings.OBJECT_PERMISSIONS = mode
+        try:
+            return func(*args)
+        finally:
+            settings.OBJECT_PERMISSIONS = 'guardian'
+    return call
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    setup_django()
+    users = create_users()
+    client = create_client(max(count, 10000), users[0])
+
+    from guardian.backends import ObjectPermissionBackend
+    from orm.models import Client
+    from orm.backends import OwnershipBackend
+    from cli.utils.permissions import reassign_perm
+
+    # the contact of the client has the rows
+    reassign_perm('change_contract', client.contracts.all(), client.contact)
+    user = client.contact
+    contracts = list(client.contracts.all()[:count])
+    write_client, created = Client.objects.get_or_create(
+        email='permissions@client.com',
+        defaults={
+            'first_name': 'client',
+            'last_name': 'permissions',
+            'phone': '0699999989',
+            'compagny': client.compagny,
+            'contact': user,
+        }
+    )
+
+    report(
+        f'permission checks ({count} contracts, {REPEAT} runs)',
+        {
+            'has_perm guardian': measure(
+                lambda: check_each(ObjectPermissionBackend(), user, contracts),
+                REPEAT
+            ),
+            'has_perm ownership': measure(
+                lambda: check_each(OwnershipBackend(), user, contracts),
+                REPEAT
+            ),
+            'prefetched guardian': measure(
+                with_mode('guardian', check_prefetched, user, contracts),
+                REPEAT
+            ),
+            'prefetched ownership': measure(
+                with_mode('ownership', check_prefetched, user, contracts),
+                REPEAT
+            ),
+        },
+        rows=count
+    )
+    report(
+        f'contract writes ({count} contracts, {REPEAT} runs)',
+        {
+            'guardian rows': measure(
+                with_mode('guardian', create_contracts, write_client, count),
+                REPEAT
+            ),
+            'ownership': measure(
+                with_mode('ownership', create_contracts, write_client, count),
+                REPEAT
+            ),
+        },
+        rows=count
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""Permissions moved to the new contact of a client, a remove_perm and
+an assign_perm per contract and in bulk with reassign_perm.
+
+Run from the epicevents folder:
+    python -m cli.tests.benchmarks.bench_reassign [CONTRACTS]
+
+The default is 10 000 contracts for the client. They are created once
+in the benchmark database, in the temporary folder.
+"""
+import sys
+from cli.tests.benchmarks.utils import setup_django, measure, report
+
+
+REPEAT = 3
+BATCH_SIZE = 10000
+
+
+def create_users():
+    from django.contrib.auth.models import Group
+    from orm.models import User
+
+    users = []
+    for number in range(2):
+        email = f'reassign{number}@sales.com'
+        user = User.objects.filter(email=email).first()
+        if user is None:
+            user = User.objects.create_user(
+                first_name='reassign',
+                last_name=str(number),
+                email=email,
+                phone=f'069999999{number}',
+                password='password',
+                department=Group.objects.get(name='sales')
+            )
+        users.append(user)
+    return users
+
+
+def create_client(count, contact):
+    """Create the client and its contracts with their permissions"""
+    from guardian.shortcuts import assign_perm
+    from orm.models import Client, Compagny, Contract
+
+    client, created = Client.objects.get_or_create(
+        email='reassign@client.com',
+        defaults={
+            'first_name': 'client',
+            'last_name': 'reassign',
+            'phone': '0699999990',
+            'compagny': Compagny.objects.get_or_create(name='benchmark')[0],
+            'contact': contact,
+        }
+    )
+    existing = client.contracts.count()
+    if existing < count:
+        print(f'Creating {count - existing} contracts...')
+        for start in range(existing, count, BATCH_SIZE):
+            contracts = Contract.objects.bulk_create([
+                Contract(client=client, price=1000, balance=500)
+                for _ in range(min(BATCH_SIZE, count - start))
+            ])
+            assign_perm('change_contract', contact, contracts)
+    return client
+
+
+def reassign_one_by_one(client, old, new):
+    """Permissions moved as client change did before"""
+    from guardian.shortcuts import assign_perm, remove_perm
+
+    remove_perm('change_client', old, client)
+    assign_perm('change_client', new, client)
+    if client.contracts.all().exists():
+        for contract in client.contracts.all():
+            remove_perm('change_contract', old, contract)
+            assign_perm('change_contract', new, contract)
+
+
+def reassign_in_bulk(client, old, new):
+    from django.db import transaction
+    from orm.models import Client
+    from cli.utils.permissions import reassign_perm
+
+    with transaction.atomic():
+        reassign_perm(
+            'change_client',
+            Client.objects.filter(id=client.id),
+            new
+        )
+        reassign_perm('change_contract', client.contracts.all(), new)
+
+
+def alternate(func, client, users):
+    """Move the permissions to the other user at each call"""
+    def call():
+        func(client, users[0], users[1])
+        users.reverse()
+    return call
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    setup_django()
+    users = create_users()
+    client = create_client(count, users[0])
+
+    from guardian.shortcuts import get_users_with_perms
+    from cli.utils.permissions import reassign_perm
+
+    # start from the permissions of the first user only
+    contracts = client.contracts.all()
+    reassign_perm('change_contract', contracts, users[0])
+
+    report(
+        f'client contact change ({contracts.count()} contracts, '
+        f'{REPEAT} runs)',
+        {
+            'one by one (before)': measure(
+                alternate(reassign_one_by_one, client, users),
+                REPEAT
+            ),
+            'reassign_perm (after)': measure(
+                alternate(reassign_in_bulk, client, users),
+                REPEAT
+            ),
+        },
+        rows=contracts.count()
+    )
+    # a single user has the permission after both methods
+    assert len(get_users_with_perms(contracts.first())) == 1
+
+
+if __name__ == '__main__':
+    main()
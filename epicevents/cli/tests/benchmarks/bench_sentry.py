@@ -0,0 +1,65 @@
+"""Startup latency of epicevents.py with each Sentry configuration.
+
+Run from the epicevents folder:
+    python -m cli.tests.benchmarks.bench_sentry [COMMAND ...]
+
+The default command is `--help`. The DSN points to a closed local port,
+no event is sent.
+"""
+import os
+import sys
+import subprocess
+from pathlib import Path
+from cli.tests.benchmarks.utils import measure, report
+
+
+BASE_DIR = Path(__file__).resolve().parents[3]
+REPEAT = 20
+DSN = 'http://public@127.0.0.1:9/1'
+
+CONFIGURATIONS = {
+    'no DSN': {'DSN': ''},
+    'DSN, lazy init': {'DSN': DSN},
+    'DSN, traces': {
+        'DSN': DSN,
+        'SENTRY_TRACES_SAMPLE_RATE': '1.0',
+    },
+    'DSN, traces and profiles': {
+        'DSN': DSN,
+        'SENTRY_TRACES_SAMPLE_RATE': '1.0',
+        'SENTRY_PROFILING': 'true',
+        'SENTRY_PROFILES_SAMPLE_RATE': '1.0',
+    },
+}
+
+
+def run_command(argv, variables):
+    env = {
+        **os.environ,
+        # always run in a new process
+        'CLI_SOCKET': str(BASE_DIR / 'no-server.sock'),
+        'SENTRY_TRACES_SAMPLE_RATE': '0.0',
+        'SENTRY_PROFILING': 'false',
+        **variables
+    }
+    subprocess.run(
+        [sys.executable, 'epicevents.py', *argv],
+        cwd=BASE_DIR,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def main():
+    argv = sys.argv[1:] or ['--help']
+    results = {
+        name: measure(lambda: run_command(argv, variables), REPEAT)
+        for name, variables in CONFIGURATIONS.items()
+    }
+    report(f"epicevents.py {' '.join(argv)} ({REPEAT} runs)", results)
+
+
+if __name__ == '__main__':
+    main()
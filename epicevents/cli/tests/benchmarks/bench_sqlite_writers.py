@@ -0,0 +1,103 @@
+"""Parallel writers on SQLite with its default pragmas and with the
+pragmas of settings.SQLITE_PRAGMAS (WAL, synchronous NORMAL, ...).
+
+Run from the epicevents folder:
+    python -m cli.tests.benchmarks.bench_sqlite_writers [WRITERS] [WRITES]
+
+The defaults are 8 writers of 200 transactions each. Each writer is
+a process, as each user runs its own CLI process. A new database is
+created in the temporary folder for each profile.
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import subprocess
+from pathlib import Path
+from cli.tests.benchmarks.utils import setup_django
+
+
+PROFILES = {
+    'default pragmas': {'SQLITE_TUNING': 'false'},
+    'tuned pragmas': {'SQLITE_TUNING': 'true'},
+}
+
+
+def migrate(database):
+    setup_django(database)
+
+
+def write(database, writes):
+    """Create writes compagnies, one transaction each, and print
+    the duration and the number of "database is locked" errors.
+    """
+    setup_django(database, migrate=False)
+    from django.db import transaction, OperationalError
+    from orm.models import Compagny
+
+    locked = 0
+    start = time.perf_counter()
+    for number in range(writes):
+        try:
+            with transaction.atomic():
+                Compagny.objects.create(name=f'{os.getpid()}-{number}')
+        except OperationalError:
+            locked += 1
+    print(json.dumps({
+        'duration': time.perf_counter() - start,
+        'locked': locked,
+    }))
+
+
+def run(mode, database, env, *args):
+    return subprocess.Popen(
+        [
+            sys.executable, '-m', 'cli.tests.benchmarks.bench_sqlite_writers',
+            mode, str(database), *map(str, args)
+        ],
+        env={**os.environ, **env},
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+
+def main():
+    writers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    writes = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    print(f'\n{writers} writers of {writes} transactions')
+    print(
+        f"{'':<30}{'wall':>12}{'writes/s':>12}"
+        f"{'max writer':>12}{'locked':>12}"
+    )
+    for name, env in PROFILES.items():
+        with tempfile.TemporaryDirectory() as directory:
+            database = Path(directory) / 'writers.sqlite3'
+            run('--migrate', database, env).wait()
+            start = time.perf_counter()
+            processes = [
+                run('--writer', database, env, writes)
+                for _ in range(writers)
+            ]
+            results = [
+                json.loads(process.communicate()[0])
+                for process in processes
+            ]
+            wall = time.perf_counter() - start
+        done = writers * writes - sum(result['locked'] for result in results)
+        print(
+            f'{name:<30}'
+            f'{wall * 1000:>10.0f}ms'
+            f'{done / wall:>12.0f}'
+            f"{max(result['duration'] for result in results) * 1000:>10.0f}ms"
+            f"{sum(result['locked'] for result in results):>12}"
+        )
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--migrate']:
+        migrate(sys.argv[2])
+    elif sys.argv[1:2] == ['--writer']:
+        write(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
@@ -0,0 +1,85 @@
+"""Contract summary computed in Python from the rows and by the
+database with SUM, COUNT and GROUP BY.
+
+Run from the epicevents folder:
+    python -m cli.tests.benchmarks.bench_summary [CONTRACTS]
+
+The default is 1 000 000 contracts. They are created once in the
+benchmark database, in the temporary folder.
+"""
+import sys
+from decimal import Decimal
+from cli.tests.benchmarks.utils import (
+    setup_django, create_contracts, measure, report
+)
+
+
+REPEAT = 5
+
+
+def python_totals(queryset):
+    """Totals as computed before, from every row"""
+    totals = {'contracts': 0, 'signed': 0, 'unpaid': 0,
+              'total': Decimal(0), 'outstanding': Decimal(0)}
+    for price, balance, signed in queryset.values_list(
+        'price', 'balance', 'signed'
+    ).iterator(chunk_size=2000):
+        totals['contracts'] += 1
+        totals['signed'] += signed
+        totals['unpaid'] += balance > 0
+        totals['total'] += price
+        totals['outstanding'] += balance
+    return totals
+
+
+def python_per_client(queryset):
+    sums = {}
+    for client, price, balance in queryset.values_list(
+        'client__full_name', 'price', 'balance'
+    ).iterator(chunk_size=2000):
+        total, outstanding = sums.get(client, (0, 0))
+        sums[client] = (total + price, outstanding + balance)
+    return sums
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    setup_django()
+    create_contracts(count)
+
+    from cli.commands.contract import SUMMARY_AGGREGATES, SUMMARY_GROUPS
+    from cli.commands.contract import SummaryBy
+    from orm.models import Contract
+
+    queryset = Contract.objects.all()
+    group_id, group_name = SUMMARY_GROUPS[SummaryBy.client]
+    report(
+        f'contract summary ({Contract.objects.count()} contracts, '
+        f'{REPEAT} runs)',
+        {
+            'totals in Python (before)': measure(
+                lambda: python_totals(queryset),
+                REPEAT
+            ),
+            'totals in database (after)': measure(
+                lambda: queryset.aggregate(**SUMMARY_AGGREGATES),
+                REPEAT
+            ),
+            'per client in Python': measure(
+                lambda: python_per_client(queryset),
+                REPEAT
+            ),
+            'per client in database': measure(
+                lambda: list(
+                    queryset.values(group_id, group_name)
+                    .annotate(**SUMMARY_AGGREGATES)
+                    .order_by('-outstanding')
+                ),
+                REPEAT
+            ),
+        }
+    )
+
+
+if __name__ == '__main__':
+    main()
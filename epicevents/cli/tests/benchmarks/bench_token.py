@@ -0,0 +1,90 @@
+"""Token decoding cost of a command and of a login, before and after
+the payload is cached.
+
+Run from the epicevents folder:
+    python -m cli.tests.benchmarks.bench_token
+
+No file is written, the token only lives in the environment.
+"""
+import os
+import jwt
+from datetime import datetime, timedelta, timezone
+from cli.utils.token import NewToken, Token
+from cli.tests.benchmarks.utils import measure, report
+
+
+REPEAT = 20
+CALLS = 1000
+PAYLOAD = {'user_id': 1, 'sub': 'john doe'}
+
+
+class OldToken(Token):
+    """Verify the signature, then decode the token again"""
+
+    @property
+    def decode(self):
+        key = os.environ.get(self.KEY)
+        if self._token_is_valid(self.token, key):
+            return self._decode_token(self.token, key)
+        raise jwt.ExpiredSignatureError()
+
+
+class OldNewToken(NewToken):
+    """Verify the existing token, then decode it to check its owner"""
+
+    def _create_token(self):
+        token = self._get_token_from_env()
+        if (
+            self._token_is_valid(token, self._key)
+            and self._is_user_token(token)
+        ):
+            return None
+
+
+def command(token_class, cold=True):
+    def run():
+        for _ in range(CALLS):
+            if cold:
+                Token._verified = (None, None)
+            token_class().decode
+    return run
+
+
+def login(token_class):
+    def run():
+        for _ in range(CALLS):
+            token_class(PAYLOAD)
+    return run
+
+
+def main():
+    os.environ.setdefault('SECRET_KEY', 'benchmark')
+    os.environ['TOKEN'] = jwt.encode(
+        {
+            **PAYLOAD,
+            'exp': datetime.now(tz=timezone.utc) + timedelta(hours=1)
+        },
+        os.environ['SECRET_KEY'],
+        algorithm='HS256'
+    )
+    report(
+        f'Token decoding per command ({CALLS} calls per run)',
+        {
+            'before': measure(command(OldToken), REPEAT),
+            'after': measure(command(Token), REPEAT),
+            'after, warm process': measure(
+                command(Token, cold=False), REPEAT
+            ),
+        }
+    )
+    report(
+        f'Existing token check at login ({CALLS} calls per run)',
+        {
+            'before': measure(login(OldNewToken), REPEAT),
+            'after': measure(login(NewToken), REPEAT),
+        }
+    )
+
+
+if __name__ == '__main__':
+    main()
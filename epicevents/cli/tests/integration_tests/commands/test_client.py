@@ -1,9 +1,14 @@
 import os
+import tempfile
+from pathlib import Path
 from unittest.mock import patch
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import Group
 from typer.testing import CliRunner
 from guardian.shortcuts import assign_perm
+from guardian.models import UserObjectPermission
 from cli.commands.cli import app
 from orm.models import User, Client, Compagny, Contract
 
@@ -111,7 +116,7 @@ class TestView(BaseTestCase):
         )
 
     def test_view_filter(self):
-        commands = ['-a']
+        commands = ['-a', '-m']
         for command in commands:
             result = self.runner.invoke(
                 app,
@@ -129,6 +134,80 @@ class TestView(BaseTestCase):
                         result.stdout
                     )
 
+    def test_view_mine(self):
+        client = self.create_client(self.user_sales)
+        client_2 = self.create_client_2(self.user_sales)
+        assign_perm('change_client', self.user_sales, client_2)
+        result = self.runner.invoke(
+            app,
+            ['client', 'view', '--mine']
+        )
+        self.assertNotIn(client.email, result.stdout)
+        self.assertIn(client_2.email, result.stdout)
+
+    def test_view_limit_page(self):
+        client = self.create_client(self.user_sales)
+        client_2 = self.create_client_2(self.user_sales)
+        result = self.runner.invoke(
+            app,
+            ['client', 'view', '--limit', '1', '--page', '2']
+        )
+        self.assertNotIn(client.email, result.stdout)
+        self.assertIn(client_2.email, result.stdout)
+
+    def test_view_page_out_of_range(self):
+        self.create_client(self.user_sales)
+        result = self.runner.invoke(
+            app,
+            ['client', 'view', '--limit', '1', '--page', '2']
+        )
+        self.assertIn('No client found.', result.stdout)
+
+    def test_view_format(self):
+        client = self.create_client(self.user_sales)
+        result = self.runner.invoke(
+            app,
+            ['client', 'view', '--format', 'csv']
+        )
+        self.assertEqual(
+            result.stdout.splitlines()[1].split(',')[3],
+            client.email
+        )
+
+    def test_view_format_no_client(self):
+        result = self.runner.invoke(
+            app,
+            ['client', 'view', '--format', 'jsonl']
+        )
+        self.assertEqual(result.stdout, '')
+
+    def test_view_fields(self):
+        client = self.create_client(self.user_sales)
+        result = self.runner.invoke(
+            app,
+            ['client', 'view', '--format', 'csv', '--fields', 'email,phone']
+        )
+        self.assertEqual(
+            result.stdout.splitlines(),
+            ['email,phone', f'{client.email},{client.phone}']
+        )
+
+    def test_view_unknown_fields(self):
+        result = self.runner.invoke(
+            app,
+            ['client', 'view', '--fields', 'email,unknown']
+        )
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn('Unknown fields: unknown.', result.stdout)
+
+    def test_view_page_without_limit(self):
+        result = self.runner.invoke(
+            app,
+            ['client', 'view', '--page', '2']
+        )
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn('--page can only be used with --limit.', result.stdout)
+
 
 class TestAdd(BaseTestCase):
     @classmethod
@@ -275,3 +354,163 @@ class TestChange(BaseTestCase):
             'Client successfully updated.',
             result.stdout
         )
+
+    @override_settings(OBJECT_PERMISSIONS='ownership')
+    def test_change_ownership_without_permission_row(self):
+        client = Client.objects.get(id=self.client_2.id)
+        result = self.runner.invoke(
+            app,
+            ['client', 'change', client.full_name, '-p'],
+            input='0620202021\n'
+        )
+        self.assertIn('Changed: phone.', result.stdout)
+        self.assertFalse(
+            UserObjectPermission.objects.filter(object_pk=str(client.id))
+        )
+
+    def test_change_contact_moves_permissions(self):
+        other = User.objects.create_user(
+            first_name='other',
+            last_name='sales',
+            email='other@sales.com',
+            phone='0622222222',
+            password='password',
+            department=Group.objects.get(name='sales')
+        )
+        client = Client.objects.get(full_name='client one')
+        contract = client.contracts.get()
+        assign_perm('change_contract', self.user_sales, contract)
+        result = self.runner.invoke(
+            app,
+            ['client', 'change', 'client one', '-c'],
+            input='other sales\n'
+        )
+        self.assertIn('Changed: contact.', result.stdout)
+        self.assertTrue(other.has_perm('change_client', client))
+        self.assertTrue(other.has_perm('change_contract', contract))
+        user_sales = User.objects.get(id=self.user_sales.id)
+        self.assertFalse(user_sales.has_perm('change_client', client))
+        self.assertFalse(user_sales.has_perm('change_contract', contract))
+
+    def test_change_updates_changed_columns(self):
+        with CaptureQueriesContext(connection) as context:
+            result = self.runner.invoke(
+                app,
+                ['client', 'change', 'client one', '-f', '-p'],
+                input='client\n0620202021\n'
+            )
+        self.assertIn('Changed: phone.', result.stdout)
+        updates = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "orm_client"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"phone"', updates[0])
+        self.assertIn('"updated"', updates[0])
+        self.assertNotIn('"first_name"', updates[0])
+        self.assertNotIn('"email"', updates[0])
+
+    def test_change_unchanged_values(self):
+        with CaptureQueriesContext(connection) as context:
+            result = self.runner.invoke(
+                app,
+                ['client', 'change', 'client one', '-f', '-l'],
+                input='client\none\n'
+            )
+        self.assertIn('Client has not changed.', result.stdout)
+        self.assertFalse([
+            query for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "orm_client"')
+        ])
+
+
+class TestImport(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user_sales = cls.create_user_sales()
+        cls.client_1 = cls.create_client(cls.user_sales)
+        cls.login('user@sales.com')
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def write_file(self, name, content):
+        path = self.directory / name
+        path.write_text(content)
+        return str(path)
+
+    def test_import_csv(self):
+        path = self.write_file(
+            'clients.csv',
+            'first_name,last_name,email,phone,compagny\n'
+            'john,doe,john@doe.COM,0612345678,test_compagny\n'
+            'jane,doe,jane@doe.com,0687654321,new_compagny\n'
+        )
+        result = self.runner.invoke(app, ['client', 'import', path])
+        self.assertEqual(result.exit_code, 0, result.stdout)
+        self.assertIn('2 clients successfully imported.', result.stdout)
+        client = Client.objects.get(full_name='john doe')
+        self.assertEqual(client.email, 'john@doe.com')
+        self.assertEqual(client.phone, '+33612345678')
+        self.assertEqual(client.contact, self.user_sales)
+        self.assertEqual(client.compagny.name, 'test_compagny')
+        self.assertTrue(self.user_sales.has_perm('change_client', client))
+        self.assertTrue(Compagny.objects.filter(name='new_compagny').exists())
+
+    def test_import_rejected_rows(self):
+        path = self.write_file(
+            'clients.jsonl',
+            '{"first_name": "john", "last_name": "doe", '
+            '"email": "invalid", "phone": "0612345678", "compagny": "c"}\n'
+            '{"first_name": "jane", "last_name": "doe", '
+            '"email": "client@one.com", "phone": "0612345678", '
+            '"compagny": "c"}\n'
+            '{"first_name": "jack", "last_name": "doe", '
+            '"email": "jack@doe.com", "phone": "0612345678", '
+            '"compagny": "c"}\n'
+            '{"first_name": "jim", "last_name": "doe", '
+            '"email": "jim@doe.com", "phone": "+33612345678", '
+            '"compagny": "c"}\n'
+            '{"first_name": "joe"}\n'
+            'not json\n'
+        )
+        result = self.runner.invoke(app, ['client', 'import', path])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('Line 1: Enter a valid email address.', result.stdout)
+        self.assertIn('Line 2: This email is already exists', result.stdout)
+        self.assertIn('Line 4: This phone is already exists', result.stdout)
+        self.assertIn('Line 5: Missing last_name, email', result.stdout)
+        self.assertIn('Line 6: Row must be an object', result.stdout)
+        self.assertIn('1 clients successfully imported.', result.stdout)
+        self.assertIn('5 rows rejected.', result.stdout)
+        self.assertTrue(Client.objects.filter(full_name='jack doe').exists())
+
+    def test_import_unknown_format(self):
+        path = self.write_file('clients.txt', '')
+        result = self.runner.invoke(app, ['client', 'import', path])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn('Unknown format of clients.txt', result.stdout)
+
+    def test_import_format_option(self):
+        path = self.write_file(
+            'clients.txt',
+            'first_name\tlast_name\temail\tphone\tcompagny\n'
+            'john\tdoe\tjohn@doe.com\t0612345678\ttest_compagny\n'
+        )
+        result = self.runner.invoke(
+            app,
+            ['client', 'import', path, '--format', 'tsv']
+        )
+        self.assertIn('1 clients successfully imported.', result.stdout)
+
+    @patch('cli.commands.client.get_user', return_value=None)
+    def test_import_token_expired(self, mock):
+        path = self.write_file('clients.csv', '')
+        result = self.runner.invoke(app, ['client', 'import', path])
+        self.assertIn(
+            self.token_expired(),
+            result.stdout
+        )
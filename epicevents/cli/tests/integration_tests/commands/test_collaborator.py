@@ -1,6 +1,8 @@
 import os
 from unittest.mock import patch
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import Group
 from typer.testing import CliRunner
 from cli.commands.cli import app
@@ -251,6 +253,61 @@ class TestChange(BaseTestCase):
             result.stdout
         )
 
+    def test_change_updates_changed_columns(self):
+        with CaptureQueriesContext(connection) as context:
+            result = self.runner.invoke(
+                app,
+                ['collaborator', 'change', 'user sales', '-p', '-d'],
+                input='0688888888\nsales\n'
+            )
+        self.assertIn('Changed: phone.', result.stdout)
+        updates = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "orm_user"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"phone"', updates[0])
+        self.assertNotIn('"password"', updates[0])
+        self.assertNotIn('"email"', updates[0])
+
+    def test_change_department(self):
+        result = self.runner.invoke(
+            app,
+            ['collaborator', 'change', 'user sales', '-d'],
+            input='support\n'
+        )
+        self.assertIn('Changed: department.', result.stdout)
+        self.assertEqual(
+            self.user_sales.groups.get().name,
+            'support'
+        )
+
+    def test_change_unchanged_values(self):
+        with CaptureQueriesContext(connection) as context:
+            result = self.runner.invoke(
+                app,
+                ['collaborator', 'change', 'user sales', '-e'],
+                input='user@sales.com\n'
+            )
+        self.assertIn('User has not changed.', result.stdout)
+        self.assertFalse([
+            query for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "orm_user"')
+        ])
+
+    def test_change_same_password(self):
+        with CaptureQueriesContext(connection) as context:
+            result = self.runner.invoke(
+                app,
+                ['collaborator', 'change', 'user sales', '-x'],
+                input='password\npassword\n'
+            )
+        self.assertIn('User has not changed.', result.stdout)
+        self.assertFalse([
+            query for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "orm_user"')
+        ])
+
 
 class TestDelete(BaseTestCase):
     @classmethod
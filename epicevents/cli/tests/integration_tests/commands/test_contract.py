@@ -1,6 +1,11 @@
 import os
+import tempfile
+from pathlib import Path
+from decimal import Decimal
 from unittest.mock import patch
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import Group
 from typer.testing import CliRunner
 from guardian.shortcuts import assign_perm
@@ -81,6 +86,15 @@ class TestView(BaseTestCase):
         super().setUpClass()
         cls.login('user@management.com')
 
+    def test_view_mine_management(self):
+        contracts = [self.create_contract() for _ in range(2)]
+        result = self.runner.invoke(
+            app,
+            ['contract', 'view', '--mine']
+        )
+        for contract in contracts:
+            self.assertIn(str(contract.id), result.stdout)
+
     @patch('cli.commands.contract.get_user', return_value=None)
     def test_view_token_expired(self, mock):
         result = self.runner.invoke(
@@ -152,6 +166,149 @@ class TestView(BaseTestCase):
                         result.stdout
                     )
 
+    def test_view_pages(self):
+        contracts = sorted(
+            [self.create_contract() for _ in range(3)],
+            key=lambda contract: (contract.created, contract.id)
+        )
+        result = self.runner.invoke(
+            app,
+            ['contract', 'view', '--page-size', '2']
+        )
+        self.assertIn(str(contracts[0].id), result.stdout)
+        self.assertIn(str(contracts[1].id), result.stdout)
+        self.assertNotIn(str(contracts[2].id), result.stdout)
+        cursor = result.stdout.split('--after ')[1].strip()
+        result = self.runner.invoke(
+            app,
+            ['contract', 'view', '--page-size', '2', '--after', cursor]
+        )
+        self.assertNotIn(str(contracts[0].id), result.stdout)
+        self.assertIn(str(contracts[2].id), result.stdout)
+        self.assertNotIn('--after', result.stdout)
+
+    def test_view_invalid_cursor(self):
+        result = self.runner.invoke(
+            app,
+            ['contract', 'view', '--after', 'invalid']
+        )
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn('Invalid cursor.', result.stdout)
+
+
+class TestSummary(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.client_2 = Client.objects.create(
+            first_name='client',
+            last_name='two',
+            email='client@two.com',
+            phone='0620202020',
+            compagny=cls.client_1.compagny,
+            contact=cls.user_management
+        )
+        for client, price, balance, signed in [
+            (cls.client_1, '100.10', '0', True),
+            (cls.client_1, '200.20', '50.05', True),
+            (cls.client_2, '0.30', '0.30', False),
+        ]:
+            Contract.objects.create(
+                client=client,
+                price=Decimal(price),
+                balance=Decimal(balance),
+                signed=signed,
+            )
+        cls.login('user@sales.com')
+
+    def get_row(self, output, first_cell):
+        for line in output.splitlines():
+            cells = [cell.strip() for cell in line.split('│')[1:-1]]
+            if cells and cells[0] == first_cell:
+                return cells[1:]
+        self.fail(f'No row {first_cell} in\n{output}')
+
+    def test_summary(self):
+        result = self.runner.invoke(app, ['contract', 'summary'])
+        self.assertEqual(
+            self.get_row(result.stdout, 'ALL'),
+            ['3', '2', '2', '300.60', '250.25', '50.35']
+        )
+        self.assertNotIn('Contracts per', result.stdout)
+
+    def test_summary_by_client(self):
+        result = self.runner.invoke(
+            app,
+            ['contract', 'summary', '--by', 'client']
+        )
+        self.assertEqual(
+            self.get_row(result.stdout, 'client one'),
+            ['2', '2', '1', '300.30', '250.25', '50.05']
+        )
+        self.assertEqual(
+            self.get_row(result.stdout, 'client two'),
+            ['1', '0', '1', '0.30', '0.00', '0.30']
+        )
+        # largest outstanding balance first
+        self.assertLess(
+            result.stdout.index('client one'),
+            result.stdout.index('client two')
+        )
+
+    def test_summary_by_contact_limit(self):
+        result = self.runner.invoke(
+            app,
+            ['contract', 'summary', '--by', 'contact', '--limit', '1']
+        )
+        self.assertEqual(
+            self.get_row(result.stdout, 'user sales'),
+            ['2', '2', '1', '300.30', '250.25', '50.05']
+        )
+        self.assertNotIn('user management', result.stdout)
+
+    def test_summary_assigned(self):
+        result = self.runner.invoke(
+            app,
+            ['contract', 'summary', '--assigned']
+        )
+        self.assertEqual(
+            self.get_row(result.stdout, 'ALL'),
+            ['2', '2', '1', '300.30', '250.25', '50.05']
+        )
+
+    def test_summary_aggregated_by_database(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.runner.invoke(
+                app,
+                ['contract', 'summary', '--by', 'client']
+            )
+        contract_queries = [
+            query['sql'] for query in queries
+            if Contract._meta.db_table in query['sql']
+        ]
+        self.assertEqual(len(contract_queries), 2)
+        self.assertIn('SUM(', contract_queries[0])
+        self.assertIn('GROUP BY', contract_queries[1])
+
+    @patch('cli.commands.contract.get_user', return_value=None)
+    def test_summary_token_expired(self, mock):
+        result = self.runner.invoke(app, ['contract', 'summary'])
+        self.assertIn(
+            self.token_expired(),
+            result.stdout
+        )
+
+
+class TestSummaryNoContract(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.login('user@sales.com')
+
+    def test_summary_no_contract(self):
+        result = self.runner.invoke(app, ['contract', 'summary'])
+        self.assertIn('No contract found.', result.stdout)
+
 
 class TestAdd(BaseTestCase):
     @classmethod
@@ -272,3 +429,104 @@ class TestChange(BaseTestCase):
             'Contract successfully updated.',
             result.stdout
         )
+
+    def test_change_updates_changed_columns(self):
+        with CaptureQueriesContext(connection) as context:
+            result = self.runner.invoke(
+                app,
+                ['contract', 'change', str(self.contract.id), '-s', '-p'],
+                input='y\n100\n'
+            )
+        self.assertIn('Changed: signed.', result.stdout)
+        updates = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "orm_contract"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"signed"', updates[0])
+        self.assertNotIn('"price"', updates[0])
+        self.assertNotIn('"client_id"', updates[0])
+
+    def test_change_unchanged_values(self):
+        with CaptureQueriesContext(connection) as context:
+            result = self.runner.invoke(
+                app,
+                ['contract', 'change', str(self.contract.id), '-s'],
+                input='n\n'
+            )
+        self.assertIn('Contract has not changed.', result.stdout)
+        self.assertFalse([
+            query for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "orm_contract"')
+        ])
+
+
+class TestImport(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.login('user@management.com')
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def write_file(self, name, content):
+        path = self.directory / name
+        path.write_text(content)
+        return str(path)
+
+    def test_import(self):
+        path = self.write_file(
+            'contracts.csv',
+            'client,price,balance,signed\n'
+            'client one,100.50,20,yes\n'
+            'client one,200,,\n'
+            'unknown client,100,,\n'
+            'client one,-1,,\n'
+            'client one,100,,maybe\n'
+        )
+        result = self.runner.invoke(app, ['contract', 'import', path])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('Line 4: Client not found', result.stdout)
+        self.assertIn(
+            'Line 5: Amount must be a positive number',
+            result.stdout
+        )
+        self.assertIn('Line 6: maybe is not a boolean', result.stdout)
+        self.assertIn('2 contracts successfully imported.', result.stdout)
+        contracts = Contract.objects.filter(client=self.client_1)
+        self.assertEqual(
+            sorted(contracts.values_list('price', 'balance', 'signed')),
+            [
+                (Decimal('100.50'), Decimal('20.00'), True),
+                (Decimal('200.00'), Decimal('200.00'), False),
+            ]
+        )
+        for contract in contracts:
+            self.assertTrue(
+                self.user_sales.has_perm('change_contract', contract)
+            )
+
+    @patch('cli.utils.importer.capture_contract_signed')
+    def test_import_captures_signed(self, mock):
+        path = self.write_file(
+            'contracts.csv',
+            'client,price,balance,signed\n'
+            'client one,100,,yes\n'
+            'client one,200,,no\n'
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            result = self.runner.invoke(app, ['contract', 'import', path])
+        self.assertIn('2 contracts successfully imported.', result.stdout)
+        mock.assert_called_once_with(
+            Contract.objects.get(client=self.client_1, signed=True)
+        )
+
+    def test_import_not_allowed(self):
+        self.login('user@sales.com')
+        self.addCleanup(self.login, 'user@management.com')
+        path = self.write_file('contracts.csv', '')
+        result = self.runner.invoke(app, ['contract', 'import', path])
+        self.assertIn(self.not_allowed(), result.stdout)
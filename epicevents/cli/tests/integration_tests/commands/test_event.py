@@ -1,7 +1,12 @@
 import os
-from datetime import datetime
+import json
+import tempfile
+from pathlib import Path
+from datetime import datetime, timedelta
 from unittest.mock import patch
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import Group
 from typer.testing import CliRunner
 from guardian.shortcuts import assign_perm
@@ -178,7 +183,7 @@ class TestView(BaseTestCase):
         )
 
     def test_view_filter(self):
-        commands = ['-a', '-n']
+        commands = ['-a', '-n', '-m']
         for command in commands:
             result = self.runner.invoke(
                 app,
@@ -310,15 +315,130 @@ class TestChange(BaseTestCase):
         )
 
     def test_change_start_date_without_end_date(self):
+        # an event to come, the start date cannot be in the past
+        start_date = datetime.now().replace(
+            minute=0,
+            second=0,
+            microsecond=0
+        ) + timedelta(days=30)
+        Event.objects.filter(id=self.event.id).update(
+            start_date=start_date,
+            end_date=start_date + timedelta(hours=8)
+        )
+        new_start_date = start_date + timedelta(hours=1)
         result = self.runner.invoke(
             app,
             ['event', 'change', str(self.event.contract.id), '-s'],
-            input=(
-                '10 01 2024 10\n'
-                '10 01 2024 18\n'
-            )
+            input=f"{new_start_date.strftime('%d %m %Y %H')}\n"
         )
         self.assertIn(
             'Event successfully updated.',
             result.stdout
         )
+        self.assertIn('Changed: start_date.', result.stdout)
+        self.assertEqual(
+            Event.objects.get(id=self.event.id).start_date,
+            new_start_date
+        )
+
+    def test_change_updates_changed_columns(self):
+        with CaptureQueriesContext(connection) as context:
+            result = self.runner.invoke(
+                app,
+                ['event', 'change', str(self.event.contract.id), '-o'],
+                input='new note\n'
+            )
+        self.assertIn('Changed: note.', result.stdout)
+        updates = [
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "orm_event"')
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"note"', updates[0])
+        self.assertNotIn('"start_date"', updates[0])
+        self.assertNotIn('"contract_id"', updates[0])
+
+    def test_change_unchanged_values(self):
+        with CaptureQueriesContext(connection) as context:
+            result = self.runner.invoke(
+                app,
+                ['event', 'change', str(self.event.contract.id), '-o'],
+                input='test event\n'
+            )
+        self.assertIn('Event has not changed.', result.stdout)
+        self.assertFalse([
+            query for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "orm_event"')
+        ])
+
+
+class TestImport(BaseTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.login('user@sales.com')
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def write_events(self, *contracts, start_date='10-01-2030 10:00'):
+        path = self.directory / 'events.jsonl'
+        with open(path, 'w') as file:
+            for contract in contracts:
+                file.write(json.dumps({
+                    'contract': str(contract),
+                    'name': 'imported event',
+                    'start_date': start_date,
+                    'end_date': '10-01-2030 18:00',
+                    'location': 'address',
+                    'attendees': 50,
+                }) + '\n')
+        return str(path)
+
+    def test_import(self):
+        path = self.write_events(
+            self.contract_signed.id,
+            self.contract_signed.id,
+            self.contract_not_signed.id,
+            'invalid',
+            'aaaff048-78c6-45e2-83c3-1c85e82099eb',
+        )
+        result = self.runner.invoke(app, ['event', 'import', path])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn(
+            'Line 2: Event with this Contract already exists.',
+            result.stdout
+        )
+        self.assertIn(
+            'Line 3: This contract has not yet been signed',
+            result.stdout
+        )
+        self.assertIn(
+            'Line 4: invalid is not a valid contract ID',
+            result.stdout
+        )
+        self.assertIn('Line 5: Contract not found', result.stdout)
+        self.assertIn('1 events successfully imported.', result.stdout)
+        event = Event.objects.get(contract=self.contract_signed)
+        self.assertEqual(event.start_date, datetime(2030, 1, 10, 10))
+        self.assertIsNone(event.contact)
+
+    def test_import_start_date_in_past(self):
+        path = self.write_events(
+            self.contract_signed_2.id,
+            start_date='10-01-2020 10:00'
+        )
+        result = self.runner.invoke(app, ['event', 'import', path])
+        self.assertIn(
+            'Line 1: Start date cannot be in the past',
+            result.stdout
+        )
+
+    def test_import_not_contact(self):
+        self.login('user@management.com')
+        self.addCleanup(self.login, 'user@sales.com')
+        path = self.write_events(self.contract_signed_2.id)
+        result = self.runner.invoke(app, ['event', 'import', path])
+        self.assertIn('You are not allowed.', result.stdout)
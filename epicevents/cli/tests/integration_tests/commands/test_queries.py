@@ -0,0 +1,192 @@
+import os
+import tempfile
+from pathlib import Path
+from datetime import datetime, timedelta
+from django.test import TestCase
+from django.contrib.auth.models import Group
+from typer.testing import CliRunner
+from guardian.shortcuts import assign_perm
+from cli.commands.cli import app
+from cli.utils.token import BaseToken
+from orm.models import User, Client, Compagny, Contract, Event
+from orm.departments import get_departments
+
+
+class TestQueries(TestCase):
+    """Pin the number of queries of each command"""
+    runner = CliRunner()
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # the token is only saved to environment if the file exists
+        BaseToken.create_env_file('', file_name='.env.test')
+        cls.user_management = cls.create_user('management', '0622222222')
+        cls.user_sales = cls.create_user('sales', '0611111111')
+        cls.user_support = cls.create_user('support', '0633333333')
+        compagny = Compagny.objects.create(name='test_compagny')
+        cls.client_1 = Client.objects.create(
+            first_name='client',
+            last_name='one',
+            email='client@one.com',
+            phone='0610101010',
+            compagny=compagny,
+            contact=cls.user_sales
+        )
+        assign_perm('change_client', cls.user_sales, cls.client_1)
+        cls.contract = Contract.objects.create(
+            client=cls.client_1,
+            price=100,
+            balance=100,
+            signed=True,
+        )
+        assign_perm('change_contract', cls.user_sales, cls.contract)
+        cls.contract_2 = Contract.objects.create(
+            client=cls.client_1,
+            price=100,
+            balance=100,
+            signed=True,
+        )
+        cls.event = Event.objects.create(
+            name='test event',
+            start_date=datetime(2024, 1, 10, hour=10),
+            end_date=datetime(2024, 1, 10, hour=18),
+            location='address',
+            attendees=80,
+            contract=cls.contract,
+            contact=cls.user_support,
+            note='test event',
+        )
+        assign_perm('change_event', cls.user_support, cls.event)
+
+    def setUp(self):
+        # the department groups are loaded once per process
+        get_departments()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        os.environ.pop('TOKEN', None)
+
+    @classmethod
+    def create_user(cls, department, phone):
+        return User.objects.create_user(
+            first_name='user',
+            last_name=department,
+            email=f'user@{department}.com',
+            phone=phone,
+            password='password',
+            department=Group.objects.get(name=department)
+        )
+
+    def invoke(self, email, queries, args, input=None):
+        self.runner.invoke(app, ['login'], input=f'{email}\npassword\n')
+        with self.assertNumQueries(queries):
+            result = self.runner.invoke(app, args, input=input)
+        self.assertEqual(result.exit_code, 0, result.stdout)
+        return result
+
+    def test_collaborator_view(self):
+        self.invoke('user@management.com', 5, ['collaborator', 'view'])
+
+    def test_collaborator_add(self):
+        self.invoke(
+            'user@management.com',
+            10,
+            ['collaborator', 'add'],
+            input=(
+                'first_name\n'
+                'last_name\n'
+                'new@user.com\n'
+                'password\n'
+                'password\n'
+                '0677777777\n'
+                'sales\n'
+            )
+        )
+
+    def test_client_view(self):
+        self.invoke('user@sales.com', 5, ['client', 'view'])
+
+    def test_client_add(self):
+        self.invoke(
+            'user@sales.com',
+            22,
+            ['client', 'add'],
+            input=(
+                'first_name\n'
+                'last_name\n'
+                'new@client.com\n'
+                '0677777777\n'
+                'new compagny\n'
+            )
+        )
+
+    def test_client_import(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'clients.csv'
+            path.write_text(
+                'first_name,last_name,email,phone,compagny\n'
+                + ''.join(
+                    f'client,{number},{number}@client.com,'
+                    f'067777777{number},new compagny\n'
+                    for number in range(10)
+                )
+            )
+            self.invoke('user@sales.com', 15, ['client', 'import', str(path)])
+
+    def test_client_change(self):
+        self.invoke(
+            'user@sales.com',
+            7,
+            ['client', 'change', 'client', 'one', '-f'],
+            input='new\n'
+        )
+
+    def test_contract_view(self):
+        self.invoke('user@management.com', 5, ['contract', 'view'])
+
+    def test_contract_summary(self):
+        self.invoke(
+            'user@support.com',
+            5,
+            ['contract', 'summary', '--by', 'contact']
+        )
+
+    def test_contract_change(self):
+        self.invoke(
+            'user@management.com',
+            6,
+            ['contract', 'change', str(self.contract.id), '-p'],
+            input='200\n'
+        )
+
+    def test_event_view(self):
+        self.invoke('user@support.com', 5, ['event', 'view'])
+
+    def test_event_add(self):
+        # dates to come, the start date cannot be in the past
+        start_date = datetime.now() + timedelta(days=30)
+        end_date = start_date + timedelta(days=1)
+        self.invoke(
+            'user@sales.com',
+            15,
+            ['event', 'add'],
+            input=(
+                f'{self.contract_2.id}\n'
+                'test event\n'
+                f"{start_date.strftime('%d %m %Y %H')}\n"
+                f"{end_date.strftime('%d %m %Y %H')}\n"
+                'test address\n'
+                '80\n'
+                'test note\n'
+            )
+        )
+
+    def test_event_change(self):
+        self.invoke(
+            'user@support.com',
+            8,
+            ['event', 'change', str(self.event.contract.id), '-n'],
+            input='new name\n'
+        )
@@ -0,0 +1,203 @@
+from unittest import skipUnless
+from datetime import datetime
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import Group
+from guardian.shortcuts import assign_perm
+from typer.testing import CliRunner
+from cli.commands.cli import app
+from cli.utils.token import BaseToken
+from orm.models import User, Client, Compagny, Contract, Event
+
+
+@skipUnless(connection.vendor == 'sqlite', 'EXPLAIN QUERY PLAN of SQLite')
+class TestQueryPlans(TestCase):
+    """Each view filter reads its table with an index"""
+    runner = CliRunner()
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # the token is only saved to environment if the file exists
+        BaseToken.create_env_file('', file_name='.env.test')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            first_name='user',
+            last_name='sales',
+            email='user@sales.com',
+            phone='0611111111',
+            password='password',
+            department=Group.objects.get(name='sales')
+        )
+        client = Client.objects.create(
+            first_name='client',
+            last_name='one',
+            email='client@one.com',
+            phone='0610101010',
+            compagny=Compagny.objects.create(name='test_compagny'),
+            contact=cls.user
+        )
+        contract = Contract.objects.create(
+            client=client,
+            price=100,
+            balance=100,
+            signed=True,
+        )
+        Contract.objects.create(
+            client=client,
+            price=100,
+            balance=0,
+            signed=False,
+        )
+        assign_perm('change_client', cls.user, client)
+        assign_perm('change_contract', cls.user, contract)
+        Event.objects.create(
+            name='test event',
+            start_date=datetime(2024, 1, 10, hour=10),
+            end_date=datetime(2024, 1, 10, hour=18),
+            location='address',
+            attendees=80,
+            contract=contract,
+            contact=None,
+        )
+
+    def setUp(self):
+        self.runner.invoke(
+            app,
+            ['login'],
+            input='user@sales.com\npassword\n'
+        )
+
+    def get_plans(self, args, table):
+        """Run the command and return the query plans on table"""
+        with CaptureQueriesContext(connection) as context:
+            result = self.runner.invoke(app, args)
+        self.assertEqual(result.exit_code, 0, result.stdout)
+        plans = []
+        with connection.cursor() as cursor:
+            for query in context.captured_queries:
+                if (
+                    not query['sql'].startswith('SELECT')
+                    or f'"{table}"' not in query['sql']
+                ):
+                    continue
+                cursor.execute('EXPLAIN QUERY PLAN ' + query['sql'])
+                plans.append([row[-1] for row in cursor.fetchall()])
+        self.assertTrue(plans)
+        return plans
+
+    def assertUsesIndex(self, args, table, index):
+        plans = self.get_plans(args, table)
+        for plan in plans:
+            with self.subTest(args=args, plan=plan):
+                self.assertNotIn(f'SCAN {table}', plan)
+        self.assertTrue(
+            any(index in line for plan in plans for line in plan),
+            f'{index} not used by {" ".join(args)}: {plans}'
+        )
+
+    def test_client_view_assigned(self):
+        self.assertUsesIndex(
+            ['client', 'view', '-a'],
+            'orm_client',
+            'orm_client_contact_id'
+        )
+
+    def test_contract_view_assigned(self):
+        self.assertUsesIndex(
+            ['contract', 'view', '-a'],
+            'orm_contract',
+            'orm_contract_client_id'
+        )
+
+    def test_contract_view_signed(self):
+        self.assertUsesIndex(
+            ['contract', 'view', '-s'],
+            'orm_contract',
+            'contract_signed_idx'
+        )
+
+    def test_contract_view_not_signed(self):
+        self.assertUsesIndex(
+            ['contract', 'view', '-n'],
+            'orm_contract',
+            'contract_not_signed_idx'
+        )
+
+    def test_contract_view_paid(self):
+        self.assertUsesIndex(
+            ['contract', 'view', '-p'],
+            'orm_contract',
+            'contract_paid_idx'
+        )
+
+    def test_contract_view_unpaid(self):
+        self.assertUsesIndex(
+            ['contract', 'view', '-u'],
+            'orm_contract',
+            'contract_unpaid_idx'
+        )
+
+    def test_event_view_no_contact(self):
+        self.assertUsesIndex(
+            ['event', 'view', '-n'],
+            'orm_event',
+            'orm_event_contact_id'
+        )
+
+    def test_event_view_assigned(self):
+        self.assertUsesIndex(
+            ['event', 'view', '-a'],
+            'orm_event',
+            'orm_event_contact_id'
+        )
+
+    def test_client_view_mine(self):
+        self.assertUsesIndex(
+            ['client', 'view', '-m'],
+            'orm_client',
+            'guardian_userobjectpermission_user_id_permission_id_object_pk'
+        )
+        self.assertUsesIndex(
+            ['client', 'view', '-m'],
+            'orm_client',
+            'SEARCH orm_client USING INTEGER PRIMARY KEY'
+        )
+
+    def test_contract_view_mine(self):
+        self.assertUsesIndex(
+            ['contract', 'view', '-m'],
+            'orm_contract',
+            'guardian_userobjectpermission_user_id_permission_id_object_pk'
+        )
+        self.assertUsesIndex(
+            ['contract', 'view', '-m'],
+            'orm_contract',
+            'sqlite_autoindex_orm_contract_1 (id=?)'
+        )
+
+    def test_event_view_mine(self):
+        self.assertUsesIndex(
+            ['event', 'view', '-m'],
+            'orm_event',
+            'guardian_userobjectpermission_user_id_permission_id_object_pk'
+        )
+
+    @override_settings(OBJECT_PERMISSIONS='ownership')
+    def test_client_view_mine_ownership(self):
+        self.assertUsesIndex(
+            ['client', 'view', '-m'],
+            'orm_client',
+            'orm_client_contact_id'
+        )
+
+    @override_settings(OBJECT_PERMISSIONS='ownership')
+    def test_contract_view_mine_ownership(self):
+        self.assertUsesIndex(
+            ['contract', 'view', '-m'],
+            'orm_contract',
+            'orm_contract_client_id'
+        )
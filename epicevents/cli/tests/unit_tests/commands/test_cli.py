@@ -0,0 +1,29 @@
+from importlib import import_module
+from unittest.mock import patch
+from django.test import SimpleTestCase
+from typer.testing import CliRunner
+from cli.commands.cli import app, COMMANDS
+
+
+class TestLazyGroup(SimpleTestCase):
+    runner = CliRunner()
+
+    @patch('cli.commands.cli.import_module')
+    def test_help_lists_commands_without_import(self, mock):
+        result = self.runner.invoke(app, ['--help'])
+        mock.assert_not_called()
+        for name, (module, help_text, check_permissions) in COMMANDS.items():
+            with self.subTest(name=name):
+                self.assertIn(name, result.stdout)
+                self.assertIn(help_text, result.stdout)
+
+    @patch('cli.commands.cli.import_module', side_effect=import_module)
+    def test_import_only_invoked_command(self, mock):
+        result = self.runner.invoke(app, ['login', '--help'])
+        mock.assert_called_once_with('cli.commands.login')
+        self.assertIn('--email', result.stdout)
+
+    def test_unknown_command(self):
+        result = self.runner.invoke(app, ['unknown'])
+        self.assertEqual(result.exit_code, 2)
+        self.assertIn("No such command 'unknown'", result.stdout)
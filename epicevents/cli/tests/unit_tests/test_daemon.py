@@ -0,0 +1,131 @@
+import io
+import socket
+import tempfile
+import threading
+import typer
+from pathlib import Path
+from contextlib import redirect_stdout
+from unittest.mock import patch
+from django.test import SimpleTestCase
+from cli.daemon import forward, handle, send, receive
+from cli.commands.cli import app as cli_app
+
+
+app = typer.Typer()
+
+
+@app.command()
+def greet(
+    name: str = typer.Option(..., prompt=True),
+    secret: str = typer.Option(..., prompt=True, hide_input=True),
+):
+    typer.echo(f'Hello {name} {len(secret)}')
+    raise typer.Exit(3)
+
+
+@patch('dotenv.dotenv_values', return_value={})
+class TestHandle(SimpleTestCase):
+    """Talk to the server side as the client would"""
+
+    def run_command(self, command, argv, answers=()):
+        server, client = socket.socketpair()
+        thread = threading.Thread(
+            target=handle,
+            args=(server, typer.main.get_command(command))
+        )
+        thread.start()
+        output = []
+        prompts = []
+        answers = iter(answers)
+        with client, client.makefile('r') as reader, \
+                client.makefile('w') as writer:
+            send(writer, argv=argv, width=80, color=False)
+            while True:
+                message = receive(reader)
+                if 'out' in message or 'err' in message:
+                    output.append(message.get('out') or message['err'])
+                elif 'prompt' in message:
+                    prompts.append(message['hide'])
+                    answer = next(answers, None)
+                    if answer is None:
+                        send(writer, eof=True)
+                    else:
+                        send(writer, input=answer)
+                elif 'exit' in message:
+                    break
+        thread.join()
+        server.close()
+        return message['exit'], ''.join(output), prompts
+
+    def test_prompts_and_exit_code(self, mock):
+        exit_code, output, prompts = self.run_command(
+            app,
+            [],
+            answers=['john', 'password']
+        )
+        self.assertEqual(exit_code, 3)
+        self.assertEqual(prompts, [False, True])
+        self.assertIn('Hello john 8', output)
+
+    def test_prompt_aborted(self, mock):
+        exit_code, output, prompts = self.run_command(app, [])
+        self.assertEqual(exit_code, 1)
+        self.assertIn('Aborted', output)
+
+    def test_help(self, mock):
+        exit_code, output, prompts = self.run_command(cli_app, ['--help'])
+        self.assertEqual(exit_code, 0)
+        self.assertIn('Collaborator commands.', output)
+
+    @patch('django.db.close_old_connections')
+    def test_old_connections_closed(self, mock_close, mock):
+        self.run_command(app, [], answers=['john', 'password'])
+        # before and after the command, as Django does for requests
+        self.assertEqual(mock_close.call_count, 2)
+
+
+class TestForward(SimpleTestCase):
+    """Talk to the client side as the server would"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / 'test.sock'
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(str(self.path))
+        self.server.listen()
+
+    def tearDown(self):
+        self.server.close()
+        self.tmp.cleanup()
+
+    def fake_server(self):
+        conn, _ = self.server.accept()
+        with conn, conn.makefile('r') as reader, \
+                conn.makefile('w') as writer:
+            self.request = receive(reader)
+            send(writer, out='Password:')
+            send(writer, prompt=' ', hide=True)
+            self.answer = receive(reader)
+            send(writer, exit=2)
+
+    @patch('cli.daemon.getpass', return_value='password')
+    def test_forward(self, mock):
+        thread = threading.Thread(target=self.fake_server)
+        thread.start()
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
+            exit_code = forward(['client', 'view'], self.path)
+        thread.join()
+        self.assertEqual(exit_code, 2)
+        self.assertEqual(self.request['argv'], ['client', 'view'])
+        self.assertEqual(self.answer, {'input': 'password'})
+        self.assertEqual(stdout.getvalue(), 'Password:')
+
+    def test_forward_no_server(self):
+        exit_code = forward([], Path(self.tmp.name) / 'missing.sock')
+        self.assertIsNone(exit_code)
+
+    def test_forward_stale_socket(self):
+        self.server.close()
+        exit_code = forward([], self.path)
+        self.assertIsNone(exit_code)
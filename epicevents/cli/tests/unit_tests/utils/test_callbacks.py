@@ -0,0 +1,40 @@
+import typer
+from django.test import TestCase
+from cli.utils.callbacks import fields_callback
+
+
+class Parent:
+    info_name = 'client'
+
+
+class Context:
+    def __init__(self):
+        self.parent = Parent()
+
+
+class TestFieldsCallback(TestCase):
+    def test_fields(self):
+        self.assertEqual(
+            fields_callback(Context(), 'email, phone'),
+            ['email', 'phone']
+        )
+
+    def test_no_fields(self):
+        self.assertIsNone(fields_callback(Context(), None))
+
+    def test_empty_fields(self):
+        with self.assertRaises(typer.BadParameter) as context:
+            fields_callback(Context(), ',')
+        self.assertIn('No fields given.', str(context.exception))
+        self.assertNotIn('Unknown fields', str(context.exception))
+
+    def test_repeated_fields(self):
+        self.assertEqual(
+            fields_callback(Context(), 'id,email,id'),
+            ['id', 'email']
+        )
+
+    def test_unknown_fields(self):
+        with self.assertRaises(typer.BadParameter) as context:
+            fields_callback(Context(), 'email,unknown')
+        self.assertIn('Unknown fields: unknown.', str(context.exception))
@@ -0,0 +1,82 @@
+import io
+import csv
+import json
+from django.test import TestCase
+from django.contrib.auth.models import Group
+from orm.models import User, Client, Compagny
+from cli.utils.formats import OutputFormat, write_rows
+
+
+class TestWriteRows(TestCase):
+    columns = [
+        'id',
+        'first_name',
+        'last_name',
+        'email',
+        'phone',
+        'compagny_name',
+        'contact_name',
+        'created',
+        'updated',
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(
+            first_name='user',
+            last_name='sales',
+            email='user@sales.com',
+            phone='0611111111',
+            password='password',
+            department=Group.objects.get(name='sales')
+        )
+        compagny = Compagny.objects.create(name='test, compagny')
+        for number in range(3):
+            Client.objects.create(
+                first_name='client',
+                last_name=f'number{number}',
+                email=f'client{number}@client.com',
+                phone=f'061010101{number}',
+                compagny=compagny,
+                contact=user
+            )
+
+    def write_rows(self, output_format):
+        stream = io.StringIO()
+        with self.assertNumQueries(1):
+            write_rows(Client.objects.all(), output_format, stream)
+        return stream.getvalue()
+
+    def test_json(self):
+        rows = json.loads(self.write_rows(OutputFormat.json))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(list(rows[0]), self.columns)
+        self.assertEqual(rows[0]['contact_name'], 'user sales')
+        self.assertEqual(rows[0]['compagny_name'], 'test, compagny')
+        self.assertIsInstance(rows[0]['id'], int)
+
+    def test_json_empty(self):
+        stream = io.StringIO()
+        write_rows(Client.objects.none(), OutputFormat.json, stream)
+        self.assertEqual(json.loads(stream.getvalue()), [])
+
+    def test_jsonl(self):
+        lines = self.write_rows(OutputFormat.jsonl).splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(
+            json.loads(lines[2])['email'],
+            'client2@client.com'
+        )
+
+    def test_csv(self):
+        rows = list(csv.reader(io.StringIO(
+            self.write_rows(OutputFormat.csv)
+        )))
+        self.assertEqual(rows[0], self.columns)
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[1][5], 'test, compagny')
+
+    def test_tsv(self):
+        lines = self.write_rows(OutputFormat.tsv).splitlines()
+        self.assertEqual(lines[0].split('\t'), self.columns)
+        self.assertEqual(lines[1].split('\t')[3], 'client0@client.com')
@@ -0,0 +1,137 @@
+import io
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+from django.test import TestCase, SimpleTestCase
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import Group
+from cli.utils.importer import (
+    InputFormat,
+    import_file,
+    get_format,
+    get_fields,
+    read_csv,
+    read_jsonl,
+)
+from orm.models import User, Client
+
+
+class TestReaders(SimpleTestCase):
+    def test_read_csv(self):
+        stream = io.StringIO(
+            'first_name,last_name\n'
+            'john,"multi\nline"\n'
+            'jane,doe\n'
+        )
+        self.assertEqual(
+            list(read_csv(stream)),
+            [
+                (3, {'first_name': 'john', 'last_name': 'multi\nline'}),
+                (4, {'first_name': 'jane', 'last_name': 'doe'}),
+            ]
+        )
+
+    def test_read_jsonl(self):
+        stream = io.StringIO('{"name": "one"}\n\nnot json\n[1]\n')
+        self.assertEqual(
+            list(read_jsonl(stream)),
+            [(1, {'name': 'one'}), (3, None), (4, [1])]
+        )
+
+    def test_get_format(self):
+        self.assertIs(get_format(Path('clients.CSV')), InputFormat.csv)
+        self.assertIs(get_format(Path('clients.jsonl')), InputFormat.jsonl)
+
+    def test_get_fields(self):
+        self.assertEqual(
+            get_fields({'name': ' one ', 'count': 2}, ['name', 'count']),
+            {'name': 'one', 'count': '2'}
+        )
+        self.assertEqual(
+            get_fields({'name': 'one'}, ['name'], ['note']),
+            {'name': 'one', 'note': ''}
+        )
+
+    def test_get_fields_invalid(self):
+        for row in [None, [1], {'name': ' '}, {'other': 'one'}]:
+            with self.subTest(row=row):
+                with self.assertRaises(Exception):
+                    get_fields(row, ['name'])
+
+
+class TestImportFile(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            first_name='user',
+            last_name='sales',
+            email='user@sales.com',
+            phone='0611111111',
+            password='password',
+            department=Group.objects.get(name='sales')
+        )
+
+    def write_clients(self, directory, count, start=0):
+        path = Path(directory) / 'clients.csv'
+        with open(path, 'w') as file:
+            file.write('first_name,last_name,email,phone,compagny\n')
+            for number in range(start, start + count):
+                file.write(
+                    f'client,{number},{number}@client.com,'
+                    f'06{number:08},compagny {number % 3}\n'
+                )
+        return path
+
+    def count_queries(self, count, start):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write_clients(directory, count, start)
+            with CaptureQueriesContext(connection) as queries:
+                imported, rejected = import_file(path, 'client', self.user)
+        self.assertEqual((imported, rejected), (count, 0))
+        return len(queries)
+
+    def test_queries_per_batch(self):
+        # create the compagnies
+        self.count_queries(5, start=0)
+        # the number of queries of a batch does not depend on its rows,
+        # as long as SQLite inserts them in a single query
+        self.assertEqual(
+            self.count_queries(5, start=5),
+            self.count_queries(60, start=10)
+        )
+
+    def test_batches(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write_clients(directory, 7)
+            imported, rejected = import_file(
+                path,
+                'client',
+                self.user,
+                batch_size=3
+            )
+        self.assertEqual((imported, rejected), (7, 0))
+        client = Client.objects.get(email='6@client.com')
+        self.assertEqual(client.full_name, 'client 6')
+        self.assertEqual(client.phone, '+33600000006')
+        self.assertEqual(client.contact, self.user)
+        self.assertTrue(self.user.has_perm('change_client', client))
+
+    def test_duplicates_across_batches(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = self.write_clients(directory, 4)
+            with open(path, 'a') as file:
+                file.write('client,copy,1@client.com,0699999999,other\n')
+            with patch('cli.utils.importer.console') as mock_console:
+                imported, rejected = import_file(
+                    path,
+                    'client',
+                    self.user,
+                    batch_size=2
+                )
+        self.assertEqual((imported, rejected), (4, 1))
+        mock_console.print.assert_called_once_with(
+            'Line 6: This email is already exists',
+            style='red',
+            markup=False
+        )
@@ -0,0 +1,124 @@
+import typer
+from datetime import date
+from django.test import TestCase
+from django.contrib.auth.models import Group
+from orm.models import User, Client, Compagny, Contract
+from cli.utils.pagination import (
+    paginate,
+    paginate_by_cursor,
+    encode_cursor,
+    decode_cursor
+)
+
+
+class TestPaginate(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for number in range(5):
+            User.objects.create_user(
+                first_name='user',
+                last_name=f'number{number}',
+                email=f'user{number}@sales.com',
+                phone=f'061111111{number}',
+                password='password',
+                department=Group.objects.get(name='sales')
+            )
+
+    def test_paginate(self):
+        queryset = paginate(User.objects.all(), limit=2, page=2)
+        self.assertEqual(
+            [user.email for user in queryset],
+            ['user2@sales.com', 'user3@sales.com']
+        )
+
+    def test_paginate_without_limit(self):
+        queryset = User.objects.all()
+        self.assertIs(paginate(queryset), queryset)
+        with self.assertRaises(typer.BadParameter):
+            paginate(queryset, page=2)
+
+
+class TestPaginateByCursor(TestCase):
+    keys = ('created', 'id')
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(
+            first_name='user',
+            last_name='sales',
+            email='user@sales.com',
+            phone='0611111111',
+            password='password',
+            department=Group.objects.get(name='sales')
+        )
+        client = Client.objects.create(
+            first_name='client',
+            last_name='one',
+            email='client@one.com',
+            phone='0610101010',
+            compagny=Compagny.objects.create(name='test_compagny'),
+            contact=user
+        )
+        for _ in range(5):
+            Contract.objects.create(client=client, price=100, balance=100)
+        # contracts created on two days
+        Contract.objects.filter(
+            id__in=Contract.objects.order_by('id')[:2].values('id')
+        ).update(created=date(2023, 12, 20))
+
+    def test_pages(self):
+        ids = []
+        cursor = None
+        for _ in range(3):
+            page, cursor = paginate_by_cursor(
+                Contract.objects.all(),
+                self.keys,
+                page_size=2,
+                after=cursor
+            )
+            ids += [contract.id for contract in page]
+        self.assertIsNone(cursor)
+        self.assertEqual(
+            ids,
+            list(
+                Contract.objects.order_by(*self.keys)
+                .values_list('id', flat=True)
+            )
+        )
+
+    def test_last_full_page_has_no_cursor(self):
+        page, cursor = paginate_by_cursor(
+            Contract.objects.all(),
+            self.keys,
+            page_size=5
+        )
+        self.assertEqual(len(page), 5)
+        self.assertIsNone(cursor)
+
+    def test_without_page_size(self):
+        queryset, cursor = paginate_by_cursor(
+            Contract.objects.all(),
+            self.keys
+        )
+        self.assertEqual(queryset.count(), 5)
+        self.assertIsNone(cursor)
+
+    def test_invalid_cursor_values(self):
+        with self.assertRaises(typer.BadParameter):
+            paginate_by_cursor(
+                Contract.objects.all(),
+                self.keys,
+                after=encode_cursor(['not a date', 'not an id'])
+            )
+
+
+class TestCursor(TestCase):
+    def test_encode_decode(self):
+        cursor = encode_cursor([date(2023, 12, 21), 1])
+        self.assertEqual(decode_cursor(cursor, 2), ['2023-12-21', '1'])
+
+    def test_decode_invalid_cursor(self):
+        for cursor in ['invalid', encode_cursor(['one']), 'e30=']:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(typer.BadParameter):
+                    decode_cursor(cursor, 2)
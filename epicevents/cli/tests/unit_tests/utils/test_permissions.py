@@ -0,0 +1,331 @@
+import click
+from django.test import TestCase, override_settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from guardian.shortcuts import assign_perm, get_users_with_perms
+from orm.models import Client, Compagny, Contract
+from cli.utils import permissions
+from cli.utils.permissions import (
+    PermissionChecker,
+    get_checker,
+    assign_object_perm,
+    filter_changeable,
+    reassign_perm
+)
+
+
+User = get_user_model()
+
+
+class TestPermissionChecker(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            first_name='user',
+            last_name='sales',
+            email='user@sales.com',
+            phone='0611111111',
+            password='password',
+            department=Group.objects.get(name='sales')
+        )
+        compagny = Compagny.objects.create(name='test_compagny')
+        cls.client_1 = Client.objects.create(
+            first_name='client',
+            last_name='one',
+            email='client@one.com',
+            phone='0610101010',
+            compagny=compagny,
+            contact=cls.user
+        )
+        cls.client_2 = Client.objects.create(
+            first_name='client',
+            last_name='two',
+            email='client@two.com',
+            phone='0620202020',
+            compagny=compagny,
+            contact=cls.user
+        )
+        cls.contract = Contract.objects.create(
+            client=cls.client_1,
+            price=100,
+            balance=100,
+        )
+        assign_perm('change_client', cls.user, cls.client_1)
+        assign_perm('change_contract', cls.user, cls.contract)
+
+    def setUp(self):
+        # remove the permission cache of the user
+        self.user = User.objects.get(id=self.user.id)
+
+    def test_global_perms_one_query(self):
+        checker = PermissionChecker(self.user)
+        with self.assertNumQueries(1):
+            self.assertTrue(checker.has_perm('orm.add_client'))
+            self.assertTrue(checker.has_perm('orm.view_event'))
+            self.assertFalse(checker.has_perm('orm.add_user'))
+
+    def test_global_perms_same_as_user(self):
+        checker = PermissionChecker(self.user)
+        self.assertEqual(checker.get_perms(), self.user.get_all_permissions())
+
+    def test_object_perms(self):
+        checker = PermissionChecker(self.user)
+        self.assertTrue(checker.has_perm('change_client', self.client_1))
+        self.assertTrue(checker.has_perm('orm.change_client', self.client_1))
+        self.assertFalse(checker.has_perm('change_client', self.client_2))
+        self.assertTrue(checker.has_perm('change_contract', self.contract))
+
+    def test_prefetch_perms_one_query(self):
+        checker = PermissionChecker(self.user)
+        objects = [self.client_1, self.client_2, self.contract]
+        with self.assertNumQueries(1):
+            checker.prefetch_perms(objects)
+            for obj in objects:
+                checker.get_object_perms(obj)
+
+    def test_group_object_perms(self):
+        group = Group.objects.get(name='sales')
+        assign_perm('change_client', group, self.client_2)
+        checker = PermissionChecker(self.user)
+        self.assertTrue(checker.has_perm('change_client', self.client_2))
+
+    def test_superuser(self):
+        self.user.is_superuser = True
+        checker = PermissionChecker(self.user)
+        with self.assertNumQueries(0):
+            self.assertTrue(checker.has_perm('orm.add_user'))
+            self.assertTrue(checker.has_perm('change_client', self.client_2))
+
+    def test_inactive_user(self):
+        self.user.is_active = False
+        checker = PermissionChecker(self.user)
+        self.assertFalse(checker.has_perm('orm.add_client'))
+        self.assertFalse(checker.has_perm('change_client', self.client_1))
+
+    @override_settings(OBJECT_PERMISSIONS='ownership')
+    def test_ownership_object_perms(self):
+        checker = PermissionChecker(self.user)
+        objects = [self.client_1, self.client_2, self.contract]
+        # the contacts of the clients of the contracts
+        with self.assertNumQueries(1):
+            checker.prefetch_perms(objects)
+        self.assertTrue(checker.has_perm('change_client', self.client_1))
+        self.assertTrue(checker.has_perm('change_client', self.client_2))
+        self.assertTrue(checker.has_perm('change_contract', self.contract))
+        self.assertFalse(checker.has_perm('change_contract', self.client_1))
+
+    @override_settings(OBJECT_PERMISSIONS='ownership')
+    def test_ownership_no_permission_row(self):
+        self.client_1.contact = None
+        checker = PermissionChecker(self.user)
+        self.assertFalse(checker.has_perm('change_client', self.client_1))
+
+    def test_get_checker_shared_by_command(self):
+        with click.Context(click.Command('test')):
+            checker = get_checker(self.user)
+            self.assertIs(get_checker(self.user), checker)
+
+
+class TestReassignPerm(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        group = Group.objects.get(name='sales')
+        cls.user = User.objects.create_user(
+            first_name='user',
+            last_name='sales',
+            email='user@sales.com',
+            phone='0611111111',
+            password='password',
+            department=group
+        )
+        cls.other = User.objects.create_user(
+            first_name='other',
+            last_name='sales',
+            email='other@sales.com',
+            phone='0622222222',
+            password='password',
+            department=group
+        )
+        cls.client_1 = Client.objects.create(
+            first_name='client',
+            last_name='one',
+            email='client@one.com',
+            phone='0610101010',
+            compagny=Compagny.objects.create(name='test_compagny'),
+            contact=cls.user
+        )
+        cls.contracts = [
+            Contract.objects.create(
+                client=cls.client_1,
+                price=100,
+                balance=100,
+            )
+            for _ in range(5)
+        ]
+        assign_perm('change_contract', cls.user, cls.contracts[:4])
+
+    def test_reassign(self):
+        reassign_perm('change_contract', Contract.objects.all(), self.other)
+        for contract in self.contracts:
+            self.assertEqual(
+                list(get_users_with_perms(contract)),
+                [self.other]
+            )
+
+    def test_reassign_keeps_existing_rows(self):
+        assign_perm('change_contract', self.other, self.contracts[0])
+        reassign_perm('change_contract', Contract.objects.all(), self.other)
+        self.assertEqual(
+            list(get_users_with_perms(self.contracts[0])),
+            [self.other]
+        )
+
+    def test_reassign_to_none(self):
+        reassign_perm('change_contract', Contract.objects.all(), None)
+        for contract in self.contracts:
+            self.assertFalse(get_users_with_perms(contract))
+
+    def test_reassign_only_queryset(self):
+        contract = Contract.objects.create(
+            client=self.client_1,
+            price=100,
+            balance=100,
+        )
+        assign_perm('change_contract', self.user, contract)
+        reassign_perm(
+            'change_contract',
+            Contract.objects.exclude(id=contract.id),
+            self.other
+        )
+        self.assertEqual(list(get_users_with_perms(contract)), [self.user])
+
+    def test_reassign_queries_per_chunk(self):
+        # permission, primary keys, then a delete and an insert per chunk
+        permissions.CHUNK_SIZE = 2
+        self.addCleanup(setattr, permissions, 'CHUNK_SIZE', 500)
+        with self.assertNumQueries(2 + 2 * 3 + 2):
+            reassign_perm(
+                'change_contract',
+                Contract.objects.all(),
+                self.other
+            )
+
+    def test_assign_object_perm(self):
+        contract = Contract.objects.create(
+            client=self.client_1,
+            price=100,
+            balance=100,
+        )
+        assign_object_perm('change_contract', self.other, contract)
+        self.assertEqual(list(get_users_with_perms(contract)), [self.other])
+
+    @override_settings(OBJECT_PERMISSIONS='ownership')
+    def test_ownership_no_write(self):
+        contract = Contract.objects.create(
+            client=self.client_1,
+            price=100,
+            balance=100,
+        )
+        with self.assertNumQueries(0):
+            assign_object_perm('change_contract', self.other, contract)
+            reassign_perm(
+                'change_contract',
+                Contract.objects.all(),
+                self.other
+            )
+        self.assertFalse(get_users_with_perms(contract))
+
+
+class TestFilterChangeable(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        group = Group.objects.get(name='sales')
+        cls.user = User.objects.create_user(
+            first_name='user',
+            last_name='sales',
+            email='user@sales.com',
+            phone='0611111111',
+            password='password',
+            department=group
+        )
+        other = User.objects.create_user(
+            first_name='other',
+            last_name='sales',
+            email='other@sales.com',
+            phone='0622222222',
+            password='password',
+            department=group
+        )
+        compagny = Compagny.objects.create(name='test_compagny')
+        cls.clients = [
+            Client.objects.create(
+                first_name='client',
+                last_name=str(number),
+                email=f'client@{number}.com',
+                phone=f'061010101{number}',
+                compagny=compagny,
+                contact=cls.user if number < 2 else other
+            )
+            for number in range(4)
+        ]
+        cls.contracts = [
+            Contract.objects.create(client=client, price=100, balance=100)
+            for client in cls.clients
+        ]
+        assign_perm('change_client', cls.user, cls.clients[0])
+        assign_perm('change_client', group, cls.clients[2])
+        assign_perm('change_contract', cls.user, cls.contracts[1])
+
+    def setUp(self):
+        # the groups are loaded with the user as get_user does
+        self.user = User.objects.prefetch_related('groups').get(
+            id=self.user.id
+        )
+
+    def filter(self, model, codename, **kwargs):
+        return set(
+            filter_changeable(
+                self.user,
+                model.objects.all(),
+                codename,
+                **kwargs
+            )
+        )
+
+    def test_user_and_group_rows(self):
+        with self.assertNumQueries(1):
+            clients = self.filter(Client, 'change_client')
+        self.assertEqual(clients, {self.clients[0], self.clients[2]})
+
+    def test_uuid_primary_key(self):
+        self.assertEqual(
+            self.filter(Contract, 'change_contract'),
+            {self.contracts[1]}
+        )
+
+    def test_other_permission(self):
+        assign_perm('view_client', self.user, self.clients[3])
+        self.assertNotIn(self.clients[3], self.filter(Client, 'change_client'))
+
+    def test_all_groups(self):
+        self.assertEqual(
+            self.filter(Contract, 'change_contract', all_groups=['sales']),
+            set(self.contracts)
+        )
+
+    def test_superuser(self):
+        self.user.is_superuser = True
+        self.assertEqual(
+            self.filter(Client, 'change_client'),
+            set(self.clients)
+        )
+
+    @override_settings(OBJECT_PERMISSIONS='ownership')
+    def test_ownership(self):
+        self.assertEqual(
+            self.filter(Client, 'change_client'),
+            set(self.clients[:2])
+        )
+        with self.assertNumQueries(1):
+            contracts = self.filter(Contract, 'change_contract')
+        self.assertEqual(contracts, set(self.contracts[:2]))
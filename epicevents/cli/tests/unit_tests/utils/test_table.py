@@ -0,0 +1,136 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import Group
+from orm.models import User
+from cli.utils.console import console
+from cli.utils.table import (
+    print_table,
+    fit_widths,
+    get_columns,
+    get_values,
+)
+
+
+class TestPrintTable(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for number in range(5):
+            User.objects.create_user(
+                first_name='user',
+                last_name=f'number{number}',
+                email=f'user{number}@sales.com',
+                phone=f'061111111{number}',
+                password='password',
+                department=Group.objects.get(name='sales')
+            )
+
+    def print_table(self, queryset, chunk_size, columns=None):
+        with console.capture() as capture:
+            print_table(queryset, chunk_size=chunk_size, columns=columns)
+        return capture.get()
+
+    def test_print_all_rows(self):
+        output = self.print_table(User.objects.all(), chunk_size=2)
+        for number in range(5):
+            self.assertIn(f'user{number}@sales.com', output)
+
+    def test_header_printed_once(self):
+        output = self.print_table(User.objects.all(), chunk_size=2)
+        self.assertEqual(output.count('EMAIL'), 1)
+        self.assertEqual(output.count('Users'), 1)
+
+    def test_rows_streamed_in_one_query(self):
+        with self.assertNumQueries(1):
+            self.print_table(User.objects.all(), chunk_size=2)
+
+    def test_projected_columns(self):
+        output = self.print_table(
+            User.objects.all(),
+            chunk_size=2,
+            columns=['email', 'department']
+        )
+        self.assertIn('DEPARTMENT', output)
+        self.assertNotIn('PHONE', output)
+        self.assertIn('user0@sales.com', output)
+        self.assertNotIn('0611111110', output)
+
+    def set_console_width(self, width):
+        self.addCleanup(setattr, console, 'width', console.width)
+        console.width = width
+
+    def test_narrow_console_not_cropped(self):
+        self.set_console_width(60)
+        output = self.print_table(User.objects.all(), chunk_size=2)
+        lines = [line.rstrip() for line in output.splitlines()]
+        # each line of the table ends with its right border
+        for line in lines[1:]:
+            self.assertLessEqual(len(line), 60)
+            self.assertIn(line[-1], '┓┃┩│┘┐')
+
+    def test_fit_widths(self):
+        self.set_console_width(60)
+        self.assertEqual(fit_widths([10, 20]), [10, 20])
+        self.assertIsNone(fit_widths([10, 20, 30]))
+
+
+class TestColumns(TestCase):
+    def test_get_columns(self):
+        self.assertEqual(
+            get_columns('Contract'),
+            [
+                'id',
+                'client_name',
+                'contact_name',
+                'price',
+                'balance',
+                'signed',
+                'created',
+                'updated',
+            ]
+        )
+        self.assertIn('department', get_columns('User'))
+
+    def test_only_needed_tables(self):
+        with CaptureQueriesContext(connection) as context:
+            list(get_values('User', User.objects.all(), columns=['email']))
+        self.assertNotIn('auth_group', context.captured_queries[0]['sql'])
+        with CaptureQueriesContext(connection) as context:
+            list(get_values('User', User.objects.all()))
+        self.assertIn('auth_group', context.captured_queries[0]['sql'])
+
+
+class TestDepartment(TestCase):
+    def test_one_row_per_user(self):
+        user = User.objects.create_user(
+            first_name='user',
+            last_name='sales',
+            email='user@sales.com',
+            phone='0611111111',
+            password='password',
+            department=Group.objects.get(name='sales')
+        )
+        # historical user in two groups
+        user.groups.add(Group.objects.get(name='support'))
+        rows = list(
+            get_values('User', User.objects.all(), columns=['department'])
+        )
+        self.assertEqual(rows, [[user.groups.first().name]])
+
+    def test_other_groups_ignored(self):
+        user = User.objects.create_user(
+            first_name='user',
+            last_name='sales',
+            email='user@sales.com',
+            phone='0611111111',
+            password='password',
+            department=Group.objects.get(name='sales')
+        )
+        # a group which is not a department, before the departments
+        user.groups.add(Group.objects.create(pk=0, name='staff'))
+        rows = list(
+            get_values('User', User.objects.all(), columns=['department'])
+        )
+        user.refresh_from_db()
+        self.assertEqual(rows, [['sales']])
+        self.assertEqual(user.department.name, 'sales')
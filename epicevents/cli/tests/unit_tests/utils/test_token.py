@@ -217,6 +217,12 @@ class TestNewToken(TestCase):
         token = new_token._create_token()
         self.assertIsNone(token)
 
+    def test_create_token_existing_token_decoded_once(self):
+        self.new_token._create_token()
+        with patch('jwt.decode', wraps=jwt.decode) as mock_decode:
+            self.new_token._create_token()
+        mock_decode.assert_called_once()
+
     def test_class_new_token(self):
         NewToken(self.payload, testing=True)
         self.assertTrue(os.environ.get('TOKEN', None))
@@ -254,3 +260,36 @@ class TestToken(TestCase):
             TokenNotFoundError,
             Token,
         )
+
+    @patch('cli.utils.token.BaseToken._is_token_in_env', return_value=False)
+    def test_decode_token_verified_once(self, mock):
+        payload = {
+            'user_id': 1,
+            'sub': 'john doe',
+            'exp': datetime.now(tz=timezone.utc) + timedelta(seconds=30)
+        }
+        NewToken(payload, testing=True)
+        Token._verified = (None, None)
+        with patch('jwt.decode', wraps=jwt.decode) as mock_decode:
+            token = Token()
+            token.decode
+            token.decode
+            # same token in the same process
+            Token().decode
+        mock_decode.assert_called_once()
+
+    @patch('cli.utils.token.time.time')
+    @patch('cli.utils.token.BaseToken._is_token_in_env', return_value=False)
+    def test_decode_verified_token_expired(self, mock, mock_time):
+        expiration = datetime.now(tz=timezone.utc) + timedelta(seconds=30)
+        payload = {
+            'user_id': 1,
+            'sub': 'john doe',
+            'exp': expiration
+        }
+        NewToken(payload, testing=True)
+        mock_time.return_value = expiration.timestamp() - 1
+        Token().decode
+        mock_time.return_value = expiration.timestamp()
+        with self.assertRaises(jwt.ExpiredSignatureError):
+            Token().decode
@@ -1,3 +1,4 @@
+import click
 from jwt.exceptions import ExpiredSignatureError
 from unittest.mock import patch, PropertyMock
 from django.test import TestCase
@@ -63,3 +64,19 @@ class TestGetUser(TestCase):
     def test_object_does_not_exist(self, mock_token_decode):
         user = get_user()
         self.assertEqual(user, None)
+
+    @patch(
+        'cli.utils.token.Token.decode',
+        new_callable=PropertyMock
+    )
+    def test_loaded_once_per_command(self, mock_token_decode):
+        mock_token_decode.return_value = {
+            'user_id': self.user.id
+        }
+        with click.Context(click.Command('test')):
+            # the user and its groups
+            with self.assertNumQueries(2):
+                user = get_user()
+                self.assertIs(get_user(), user)
+                self.assertEqual(user.groups.all()[0].name, 'sales')
+        mock_token_decode.assert_called_once()
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from decimal import Decimal
 import typer
 from unittest.mock import patch
 from django.test import TestCase
@@ -177,6 +178,30 @@ class TestValidatePassword(TestCase):
             )
 
 
+class TestValidateAmount(TestCase):
+    def test_amount_valid(self):
+        for value, amount in [
+            ('100', Decimal('100.00')),
+            ('19.99', Decimal('19.99')),
+            ('0,5', Decimal('0.50')),
+        ]:
+            with self.subTest(value=value):
+                self.assertEqual(
+                    validators.validate_amount(value, ctx=None),
+                    amount
+                )
+
+    def test_amount_invalid(self):
+        for value in ['abc', '-1', 'nan', 'inf', '10.001', '1e30']:
+            with self.subTest(value=value):
+                self.assertRaises(
+                    ValidationError,
+                    validators.validate_amount,
+                    value=value,
+                    ctx=None
+                )
+
+
 class TestFormatDate(TestCase):
     date_str_valid = '10 01 2024 10'
     date_str_invalid = 'invalid date'
@@ -479,6 +504,45 @@ class TestValidateUnique(ContextMixin, BaseTestCase):
             ctx=self.ctx
         )
 
+    def test_unique_email_current_value(self):
+        self.ctx.obj = self.user_sales
+        self.addCleanup(setattr, self.ctx, 'obj', Obj())
+        validators.validate_unique_email(self.user_sales.email, self.ctx)
+
+    def test_unique_values_one_query(self):
+        with self.assertNumQueries(1):
+            errors = validators.validate_unique_values(
+                'email',
+                [
+                    'new@email.com',
+                    self.user_sales.email,
+                    self.client_1.email,
+                    'new@email.com',
+                ]
+            )
+        self.assertEqual(
+            errors,
+            [
+                None,
+                'This email is already exists',
+                'This email is already exists',
+                'This email is already exists',
+            ]
+        )
+
+    def test_unique_values_allowed(self):
+        errors = validators.validate_unique_values(
+            'phone',
+            [self.user_sales.phone, self.client_1.phone],
+            allowed=[self.client_1.phone]
+        )
+        self.assertEqual(errors, ['This phone is already exists', None])
+
+    def test_unique_values_empty(self):
+        with self.assertNumQueries(0):
+            errors = validators.validate_unique_values('email', [])
+        self.assertEqual(errors, [])
+
     def test_unique_event_for_contract(self):
         Event.objects.create(
             name='event',
@@ -1,13 +1,23 @@
 import typer
 from cli.utils.console import console
 from cli.utils.user import get_user
+from cli.utils.permissions import get_checker
 from cli.utils.validators import validate
+from cli.utils.table import get_columns
+
+
+# permission action of the sub commands which are not named after one
+SUBCOMMAND_ACTIONS = {
+    'summary': 'view',
+    'import': 'add',
+}
 
 
 def permissions_callback(ctx: typer.Context):
     """Callback to check general permissions"""
     command_name = ctx.info_name
     subcommand = ctx.invoked_subcommand
+    action = SUBCOMMAND_ACTIONS.get(subcommand, subcommand)
 
     user = get_user()
 
@@ -16,7 +26,7 @@ def permissions_callback(ctx: typer.Context):
     if not user:
         console.print('[red]Token has expired. Please log in again.')
         exit()
-    if not user.has_perm(f'orm.{subcommand}_{command_name}'):
+    if not get_checker(user).has_perm(f'orm.{action}_{command_name}'):
         console.print('[red]You are not allowed.')
         exit()
 
@@ -38,3 +48,28 @@ def validate_callback(
             typer.style(error, fg=typer.colors.RED)
         )
     return value
+
+
+def fields_callback(ctx: typer.Context, value: str):
+    """Callback to validate the comma separated columns of --fields"""
+    if value is None:
+        return None
+    type_obj = ctx.parent.info_name
+    if type_obj == 'collaborator':
+        type_obj = 'user'
+    columns = get_columns(type_obj)
+    # a repeated field is shown once
+    fields = list(dict.fromkeys(
+        field.strip() for field in value.split(',') if field.strip()
+    ))
+    if not fields:
+        raise typer.BadParameter(
+            f"No fields given. Choose among {', '.join(columns)}."
+        )
+    unknown = [field for field in fields if field not in columns]
+    if unknown:
+        raise typer.BadParameter(
+            f"Unknown fields: {', '.join(unknown)}."
+            f" Choose among {', '.join(columns)}."
+        )
+    return fields
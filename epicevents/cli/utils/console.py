@@ -1,3 +1,12 @@
 from rich.console import Console
 
 console = Console()
+
+
+def print_changed(type_obj, changed):
+    """Print the fields changed by a change command"""
+    if changed:
+        console.print(f'[green]{type_obj} successfully updated.')
+        console.print(f"Changed: {', '.join(sorted(changed))}.")
+    else:
+        console.print(f'[orange3]{type_obj} has not changed.')
@@ -0,0 +1,59 @@
+import csv
+import sys
+from enum import Enum
+from django.core.serializers.json import DjangoJSONEncoder
+from cli.utils.table import get_columns, get_values
+
+
+class OutputFormat(str, Enum):
+    table = 'table'
+    json = 'json'
+    jsonl = 'jsonl'
+    csv = 'csv'
+    tsv = 'tsv'
+
+
+def write_rows(queryset, output_format, stream=None, columns=None):
+    """Write the rows of queryset to stream in output_format.
+    Rows are streamed from the database and written one by one,
+    without Rich. All columns are written if columns is None.
+    """
+    stream = stream or sys.stdout
+    type_obj = queryset.model.__name__
+    columns = columns or get_columns(type_obj)
+    rows = get_values(type_obj, queryset, columns=columns)
+    WRITERS[output_format](stream, columns, rows)
+
+
+def write_json(stream, columns, rows):
+    encoder = DjangoJSONEncoder()
+    stream.write('[')
+    separator = '\n'
+    for values in rows:
+        stream.write(separator + encoder.encode(dict(zip(columns, values))))
+        separator = ',\n'
+    stream.write('\n]\n')
+
+
+def write_jsonl(stream, columns, rows):
+    encoder = DjangoJSONEncoder()
+    for values in rows:
+        stream.write(encoder.encode(dict(zip(columns, values))) + '\n')
+
+
+def write_csv(stream, columns, rows, delimiter=','):
+    writer = csv.writer(stream, delimiter=delimiter, lineterminator='\n')
+    writer.writerow(columns)
+    writer.writerows(rows)
+
+
+def write_tsv(stream, columns, rows):
+    write_csv(stream, columns, rows, delimiter='\t')
+
+
+WRITERS = {
+    OutputFormat.json: write_json,
+    OutputFormat.jsonl: write_jsonl,
+    OutputFormat.csv: write_csv,
+    OutputFormat.tsv: write_tsv,
+}
@@ -0,0 +1,356 @@
+import csv
+import json
+import uuid
+import typer
+from enum import Enum
+from itertools import islice
+from datetime import datetime
+from django.db import transaction, IntegrityError
+from django.core.exceptions import ValidationError
+from orm.models import Client, Compagny, Contract, Event, set_full_name
+from cli.utils.console import console
+from cli.utils.permissions import assign_object_perm
+from cli.utils.sentry import capture_contract_signed
+from cli.utils.validators import (
+    format_email,
+    format_phone,
+    format_date,
+    validate_amount,
+    validate_unique_values
+)
+
+
+# rows validated and inserted in one transaction
+BATCH_SIZE = 500
+
+BOOLEANS = {
+    'true': True, 'yes': True, 'y': True, '1': True,
+    'false': False, 'no': False, 'n': False, '0': False, '': False,
+}
+
+
+class InputFormat(str, Enum):
+    csv = 'csv'
+    tsv = 'tsv'
+    jsonl = 'jsonl'
+
+
+def import_file(path, model_name, user, input_format=None,
+                batch_size=BATCH_SIZE):
+    """Import the rows of the file at path as model_name objects.
+    Rows are read batch_size at a time: each batch is validated with
+    a few set-based queries and its valid rows are inserted in one
+    transaction. Invalid rows are printed and skipped.
+
+    returns:
+        the number of imported and rejected rows
+    """
+    input_format = input_format or get_format(path)
+    clean, save = IMPORTERS[model_name]
+    imported = rejected = 0
+    with open(path, newline='', encoding='utf-8-sig') as stream:
+        rows = READERS[input_format](stream)
+        while batch := list(islice(rows, batch_size)):
+            items, errors = clean(batch, user)
+            if items:
+                try:
+                    with transaction.atomic():
+                        save([item for line, item in items], user)
+                except IntegrityError as error:
+                    errors += [(line, str(error)) for line, item in items]
+                    items = []
+            for line, message in sorted(errors):
+                console.print(
+                    f'Line {line}: {message}',
+                    style='red',
+                    markup=False
+                )
+            imported += len(items)
+            rejected += len(errors)
+    return imported, rejected
+
+
+def get_format(path):
+    """Get the input format from the suffix of path"""
+    try:
+        return InputFormat(path.suffix[1:].lower())
+    except ValueError:
+        raise typer.BadParameter(
+            f'Unknown format of {path.name}, use --format.'
+        )
+
+
+def read_csv(stream, delimiter=','):
+    """Yield the line number and the values of each row"""
+    reader = csv.DictReader(stream, delimiter=delimiter)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def read_tsv(stream):
+    yield from read_csv(stream, delimiter='\t')
+
+
+def read_jsonl(stream):
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield line_number, row
+
+
+READERS = {
+    InputFormat.csv: read_csv,
+    InputFormat.tsv: read_tsv,
+    InputFormat.jsonl: read_jsonl,
+}
+
+
+def get_fields(row, required, optional=()):
+    """Get the required and optional values of row as stripped strings"""
+    if not isinstance(row, dict):
+        raise ValidationError('Row must be an object')
+    fields = {
+        name: '' if row.get(name) is None else str(row[name]).strip()
+        for name in [*required, *optional]
+    }
+    missing = [name for name in required if not fields[name]]
+    if missing:
+        raise ValidationError(f"Missing {', '.join(missing)}")
+    return fields
+
+
+def get_message(error):
+    """Get the messages of a validation error on a single line"""
+    if hasattr(error, 'error_dict'):
+        return '; '.join(
+            f"{field}: {' '.join(messages)}"
+            for field, messages in error.message_dict.items()
+        )
+    return ' '.join(error.messages)
+
+
+def clean_rows(batch, clean_row, user):
+    """Validate each row of batch with clean_row.
+
+    returns:
+        the list of (line, item) of the valid rows
+        and the list of (line, message) of the others
+    """
+    items = []
+    errors = []
+    for line, row in batch:
+        try:
+            items.append((line, clean_row(row, user)))
+        except ValidationError as error:
+            errors.append((line, get_message(error)))
+    return items, errors
+
+
+def clean_client(row, user):
+    fields = get_fields(
+        row,
+        ['first_name', 'last_name', 'email', 'phone', 'compagny']
+    )
+    client = Client(
+        first_name=fields['first_name'],
+        last_name=fields['last_name'],
+        email=format_email(fields['email']),
+        phone=format_phone(fields['phone']),
+        contact=user,
+    )
+    set_full_name(client, {})
+    client.full_clean(exclude=['compagny', 'contact'], validate_unique=False)
+    Compagny(name=fields['compagny']).clean_fields()
+    return client, fields['compagny']
+
+
+def clean_clients(batch, user):
+    items, errors = clean_rows(batch, clean_client, user)
+    for field in ['email', 'phone']:
+        unique_errors = validate_unique_values(
+            field,
+            [getattr(client, field) for line, (client, name) in items]
+        )
+        errors += [
+            (line, error)
+            for (line, item), error in zip(items, unique_errors) if error
+        ]
+        items = [
+            (line, item)
+            for (line, item), error in zip(items, unique_errors)
+            if not error
+        ]
+    return items, errors
+
+
+def save_clients(items, user):
+    """Create the missing compagnies, the clients and the permissions
+    of their contact
+    """
+    names = {name for client, name in items}
+    compagnies = {
+        compagny.name: compagny
+        for compagny in Compagny.objects.filter(name__in=names)
+    }
+    missing = names - set(compagnies)
+    if missing:
+        Compagny.objects.bulk_create(
+            [Compagny(name=name) for name in missing],
+            ignore_conflicts=True
+        )
+        compagnies.update({
+            compagny.name: compagny
+            for compagny in Compagny.objects.filter(name__in=missing)
+        })
+    clients = []
+    for client, name in items:
+        client.compagny = compagnies[name]
+        clients.append(client)
+    Client.objects.bulk_create(clients)
+    assign_object_perm('change_client', user, clients)
+
+
+def clean_contract(row, user):
+    fields = get_fields(row, ['client', 'price'], ['balance', 'signed'])
+    price = validate_amount(fields['price'], None)
+    balance = price
+    if fields['balance']:
+        balance = validate_amount(fields['balance'], None)
+    signed = fields['signed'].lower()
+    if signed not in BOOLEANS:
+        raise ValidationError(f"{fields['signed']} is not a boolean")
+    contract = Contract(price=price, balance=balance, signed=BOOLEANS[signed])
+    contract.full_clean(exclude=['client'], validate_unique=False)
+    return contract, fields['client']
+
+
+def clean_contracts(batch, user):
+    items, errors = clean_rows(batch, clean_contract, user)
+    names = {name for line, (contract, name) in items}
+    clients = {}
+    homonyms = set()
+    for client in Client.objects.filter(
+        full_name__in=names
+    ).select_related('contact'):
+        if client.full_name in clients:
+            homonyms.add(client.full_name)
+        clients[client.full_name] = client
+    kept = []
+    for line, (contract, name) in items:
+        if name not in clients:
+            errors.append((line, 'Client not found'))
+        elif name in homonyms:
+            errors.append((line, f'Several clients are named {name}'))
+        else:
+            contract.client = clients[name]
+            kept.append((line, contract))
+    return kept, errors
+
+
+def save_contracts(contracts, user):
+    """Create the contracts and the permissions of the contacts
+    of their clients. The signed contracts are sent to sentry once
+    the batch is committed, as contract add does.
+    """
+    Contract.objects.bulk_create(contracts)
+    for contract in contracts:
+        if contract.signed:
+            transaction.on_commit(
+                lambda contract=contract: capture_contract_signed(contract)
+            )
+    per_contact = {}
+    for contract in contracts:
+        contact = contract.client.contact
+        if contact is not None:
+            per_contact.setdefault(contact, []).append(contract)
+    for contact, contact_contracts in per_contact.items():
+        assign_object_perm('change_contract', contact, contact_contracts)
+
+
+def clean_event(row, user):
+    fields = get_fields(
+        row,
+        ['contract', 'name', 'start_date', 'end_date', 'location',
+         'attendees'],
+        ['note']
+    )
+    try:
+        contract_id = uuid.UUID(fields['contract'])
+    except ValueError:
+        raise ValidationError(
+            f"{fields['contract']} is not a valid contract ID"
+        )
+    start_date = format_date(fields['start_date'])
+    end_date = format_date(fields['end_date'])
+    if datetime.now() > start_date:
+        raise ValidationError("Start date cannot be in the past")
+    if end_date < start_date:
+        raise ValidationError("End date cannot be earlier than start date")
+    try:
+        attendees = int(fields['attendees'])
+    except ValueError:
+        raise ValidationError(f"{fields['attendees']} is not a number")
+    event = Event(
+        name=fields['name'],
+        start_date=start_date,
+        end_date=end_date,
+        location=fields['location'],
+        attendees=attendees,
+        contract_id=contract_id,
+        contact=None,
+        note=fields['note'],
+    )
+    event.full_clean(exclude=['contract', 'contact'], validate_unique=False)
+    return event
+
+
+def clean_events(batch, user):
+    items, errors = clean_rows(batch, clean_event, user)
+    ids = [event.contract_id for line, event in items]
+    contracts = {
+        contract_id: (signed, contact_id)
+        for contract_id, signed, contact_id in Contract.objects.filter(
+            id__in=ids
+        ).values_list('id', 'signed', 'client__contact')
+    }
+    with_event = set(
+        Event.objects.filter(
+            contract__in=ids
+        ).values_list('contract', flat=True)
+    )
+    kept = []
+    for line, event in items:
+        if event.contract_id not in contracts:
+            errors.append((line, 'Contract not found'))
+            continue
+        signed, contact_id = contracts[event.contract_id]
+        if contact_id != user.id:
+            errors.append(
+                (line, "You are not the contact of this client's contract")
+            )
+        elif not signed:
+            errors.append((line, 'This contract has not yet been signed'))
+        elif event.contract_id in with_event:
+            errors.append(
+                (line, 'Event with this Contract already exists.')
+            )
+        else:
+            with_event.add(event.contract_id)
+            kept.append((line, event))
+    return kept, errors
+
+
+def save_events(events, user):
+    Event.objects.bulk_create(events)
+
+
+# model name: (validate a batch of rows, save the valid rows)
+IMPORTERS = {
+    'client': (clean_clients, save_clients),
+    'contract': (clean_contracts, save_contracts),
+    'event': (clean_events, save_events),
+}
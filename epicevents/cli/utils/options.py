@@ -0,0 +1,90 @@
+import typer
+from pathlib import Path
+from typing import Optional
+from typing_extensions import Annotated
+from cli.utils.formats import OutputFormat
+from cli.utils.importer import InputFormat
+from cli.utils.callbacks import fields_callback
+
+
+# options shared by the view commands
+Limit = Annotated[
+    Optional[int],
+    typer.Option(
+        "--limit",
+        min=1,
+        help="Maximum number of rows to show",
+    )
+]
+Page = Annotated[
+    int,
+    typer.Option(
+        "--page",
+        min=1,
+        help="Page of --limit rows to show",
+    )
+]
+PageSize = Annotated[
+    Optional[int],
+    typer.Option(
+        "--page-size",
+        min=1,
+        help="Number of rows per page",
+    )
+]
+After = Annotated[
+    Optional[str],
+    typer.Option(
+        "--after",
+        help="Cursor of the page to show, printed after the previous page",
+    )
+]
+Format = Annotated[
+    OutputFormat,
+    typer.Option(
+        "--format",
+        help="Output format, streamed without colors except table",
+    )
+]
+Mine = Annotated[
+    bool,
+    typer.Option(
+        "--mine",
+        "-m",
+        help="Filter the rows I can change",
+    )
+]
+Fields = Annotated[
+    Optional[str],
+    typer.Option(
+        "--fields",
+        help="Comma separated columns to show, e.g. id,email",
+        callback=fields_callback,
+    )
+]
+
+# options shared by the import commands
+ImportFile = Annotated[
+    Path,
+    typer.Argument(
+        exists=True,
+        dir_okay=False,
+        readable=True,
+        help="CSV, TSV or JSONL file, with a header for CSV and TSV",
+    )
+]
+ImportFormat = Annotated[
+    Optional[InputFormat],
+    typer.Option(
+        "--format",
+        help="Format of the file, found from its suffix by default",
+    )
+]
+BatchSize = Annotated[
+    int,
+    typer.Option(
+        "--batch-size",
+        min=1,
+        help="Number of rows validated and saved at once",
+    )
+]
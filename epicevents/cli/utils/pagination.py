@@ -0,0 +1,76 @@
+import json
+import typer
+import binascii
+from base64 import urlsafe_b64encode, urlsafe_b64decode
+from django.db.models import Q
+from django.core.exceptions import ValidationError
+
+
+def paginate(queryset, limit=None, page=1):
+    """Return the page of queryset with limit rows per page.
+    Queryset is ordered by primary key if it is not ordered.
+    """
+    if limit is None:
+        if page > 1:
+            raise typer.BadParameter('--page can only be used with --limit.')
+        return queryset
+    if not queryset.ordered:
+        queryset = queryset.order_by('pk')
+    start = (page - 1) * limit
+    return queryset[start:start + limit]
+
+
+def paginate_by_cursor(queryset, keys, page_size=None, after=None):
+    """Return the page of queryset following the cursor after
+    and the cursor of the next page, None if it is the last page.
+    keys must be unique together and indexed, each page then costs
+    the same whatever its position.
+    """
+    queryset = queryset.order_by(*keys)
+    if after is not None:
+        values = decode_cursor(after, len(keys))
+        try:
+            queryset = queryset.filter(get_after_filter(keys, values))
+        except ValidationError:
+            raise typer.BadParameter('Invalid cursor.')
+    if page_size is None:
+        return queryset, None
+    # read one more key to know if there is a next page
+    rows = list(queryset.values_list(*keys)[:page_size + 1])
+    next_cursor = None
+    if len(rows) > page_size:
+        next_cursor = encode_cursor(rows[page_size - 1])
+    return queryset[:page_size], next_cursor
+
+
+def get_after_filter(keys, values):
+    """Filter the rows after values in the order of keys.
+    (a, b) > (x, y) is written a >= x AND (a > x OR (a = x AND b > y))
+    so the database can use an index on keys.
+    """
+    after = Q()
+    for index, key in enumerate(keys):
+        equal = dict(zip(keys[:index], values[:index]))
+        after |= Q(**equal, **{f'{key}__gt': values[index]})
+    return Q(**{f'{keys[0]}__gte': values[0]}) & after
+
+
+def encode_cursor(values):
+    """Encode the key values of a row as an opaque cursor"""
+    data = json.dumps([str(value) for value in values])
+    return urlsafe_b64encode(data.encode()).decode()
+
+
+def decode_cursor(cursor, length):
+    """Decode the key values of a cursor"""
+    try:
+        values = json.loads(urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError):
+        raise typer.BadParameter('Invalid cursor.')
+    if (
+        not isinstance(values, list)
+        or len(values) != length
+        or not all(isinstance(value, str) for value in values)
+    ):
+        raise typer.BadParameter('Invalid cursor.')
+    return values
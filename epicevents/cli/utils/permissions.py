@@ -0,0 +1,213 @@
+import click
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q, Value, BigIntegerField, CharField, UUIDField
+from django.db.models.functions import Cast, Replace
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from guardian.shortcuts import assign_perm
+from guardian.utils import get_user_obj_perms_model, get_group_obj_perms_model
+from orm.backends import OWNERS, get_owned_perms
+
+
+# primary keys per IN lookup, below the 999 variables of old SQLite
+CHUNK_SIZE = 500
+
+
+class PermissionChecker:
+    """Check the global and object permissions of a user.
+    Global permissions are loaded with one query, object permissions
+    with one query for all the prefetched objects.
+    """
+
+    def __init__(self, user):
+        self.user = user
+        self._perms = None
+        self._object_perms = {}
+
+    def has_perm(self, perm, obj=None):
+        """Same as user.has_perm. Object permissions can be given
+        without app label.
+        """
+        if not self.user.is_active:
+            return False
+        if self.user.is_superuser:
+            return True
+        if obj is None:
+            return perm in self.get_perms()
+        codename = perm.split('.')[-1]
+        return codename in self.get_object_perms(obj)
+
+    def get_perms(self):
+        """Return the user and group permissions as 'app_label.codename'"""
+        if self._perms is None:
+            perms = Permission.objects.filter(
+                Q(user=self.user) | Q(group__user=self.user)
+            ).values_list('content_type__app_label', 'codename').distinct()
+            self._perms = {f'{app_label}.{codename}'
+                           for app_label, codename in perms}
+        return self._perms
+
+    def get_object_perms(self, obj):
+        """Return the codenames of the permissions of the user on obj"""
+        key = self._get_key(obj)
+        if key not in self._object_perms:
+            self.prefetch_perms([obj])
+        return self._object_perms[key]
+
+    def prefetch_perms(self, objects):
+        """Load the user and group permissions of objects in one query.
+        With ownership permissions, they are read from the objects and
+        at most one query per model.
+        """
+        objects = [
+            obj for obj in objects
+            if self._get_key(obj) not in self._object_perms
+        ]
+        if not objects:
+            return
+        if not uses_permission_rows():
+            for obj, perms in get_owned_perms(self.user, objects).items():
+                self._object_perms[self._get_key(obj)] = perms
+            return
+        filters = Q()
+        for content_type, pks in self._group_by_content_type(objects):
+            filters |= Q(content_type=content_type, object_pk__in=pks)
+        user_perms = get_user_obj_perms_model().objects.filter(
+            filters,
+            user=self.user
+        ).values_list('content_type', 'object_pk', 'permission__codename')
+        group_perms = get_group_obj_perms_model().objects.filter(
+            filters,
+            group__user=self.user
+        ).values_list('content_type', 'object_pk', 'permission__codename')
+        for obj in objects:
+            self._object_perms[self._get_key(obj)] = set()
+        for content_type, pk, codename in user_perms.union(group_perms):
+            self._object_perms[(content_type, pk)].add(codename)
+
+    @staticmethod
+    def _get_key(obj):
+        content_type = ContentType.objects.get_for_model(obj)
+        return content_type.id, str(obj.pk)
+
+    @staticmethod
+    def _group_by_content_type(objects):
+        groups = {}
+        for obj in objects:
+            content_type = ContentType.objects.get_for_model(obj)
+            groups.setdefault(content_type, []).append(str(obj.pk))
+        return groups.items()
+
+
+def get_checker(user):
+    """Get the permission checker of user.
+    The checker is shared by the command invocation.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is None:
+        return PermissionChecker(user)
+    checker = ctx.meta.get('checker')
+    if checker is None or checker.user != user:
+        checker = PermissionChecker(user)
+        ctx.meta['checker'] = checker
+    return checker
+
+
+def get_object_pk(model):
+    """Get the object_pk of the permission rows as the primary key
+    of model, so the rows can be compared with the primary key index
+    """
+    if isinstance(model._meta.pk, UUIDField):
+        if connection.features.has_native_uuid_field:
+            return Cast('object_pk', output_field=UUIDField())
+        # uuids are saved as 32 hex digits without dashes
+        return Replace(
+            'object_pk',
+            Value('-'),
+            Value(''),
+            output_field=CharField()
+        )
+    return Cast('object_pk', output_field=BigIntegerField())
+
+
+def filter_changeable(user, queryset, codename, all_groups=()):
+    """Filter the objects of queryset on which user has the object
+    permission codename, in the query of queryset: no permission is
+    checked row by row. The members of all_groups keep all the objects.
+    """
+    if user.is_superuser or (
+        user.department and user.department.name in all_groups
+    ):
+        return queryset
+    model = queryset.model
+    if not uses_permission_rows():
+        path = OWNERS[f'{model._meta.app_label}.{codename}']
+        return queryset.filter(**{path: user})
+    content_type = ContentType.objects.get_for_model(model)
+    filters = {
+        'content_type': content_type,
+        'permission__content_type': content_type,
+        'permission__codename': codename,
+    }
+    user_rows = get_user_obj_perms_model().objects.filter(
+        user=user,
+        **filters
+    ).values(obj_pk=get_object_pk(model))
+    group_rows = get_group_obj_perms_model().objects.filter(
+        group__in=user.groups.all(),
+        **filters
+    ).values(obj_pk=get_object_pk(model))
+    return queryset.filter(Q(pk__in=user_rows) | Q(pk__in=group_rows))
+
+
+def uses_permission_rows():
+    """Check that object permissions are guardian rows, not ownership"""
+    return settings.OBJECT_PERMISSIONS == 'guardian'
+
+
+def assign_object_perm(codename, user, obj):
+    """Same as guardian assign_perm, obj can be a list of objects.
+    Nothing is written with ownership permissions.
+    """
+    if uses_permission_rows() and user is not None:
+        assign_perm(codename, user, obj)
+
+
+def reassign_perm(codename, queryset, user):
+    """Give the object permission codename on the objects of queryset
+    to user only, user can be None to remove it.
+    The rows of the other users are deleted and the rows of user created
+    with a few bulk statements per CHUNK_SIZE objects, in one transaction,
+    instead of a remove_perm and an assign_perm per object.
+    Nothing is written with ownership permissions.
+    """
+    if not uses_permission_rows():
+        return
+    model = get_user_obj_perms_model()
+    content_type = ContentType.objects.get_for_model(queryset.model)
+    permission = Permission.objects.get(
+        content_type=content_type,
+        codename=codename
+    )
+    pks = [str(pk) for pk in queryset.values_list('pk', flat=True)]
+    with transaction.atomic():
+        for start in range(0, len(pks), CHUNK_SIZE):
+            chunk = pks[start:start + CHUNK_SIZE]
+            model.objects.filter(
+                permission=permission,
+                object_pk__in=chunk
+            ).exclude(user=user).delete()
+            if user is not None:
+                model.objects.bulk_create(
+                    [
+                        model(
+                            permission=permission,
+                            content_type=content_type,
+                            object_pk=pk,
+                            user=user
+                        )
+                        for pk in chunk
+                    ],
+                    ignore_conflicts=True
+                )
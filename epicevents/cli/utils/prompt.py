@@ -6,7 +6,7 @@ from cli.utils.validators import validate_value
 def prompt_for(field_name, ctx):
     new_value = None
     if field_name == 'department':
-        default = getattr(ctx.obj, 'groups').first()
+        default = ctx.obj.department
     else:
         default = getattr(ctx.obj, field_name)
     if isinstance(default, datetime):
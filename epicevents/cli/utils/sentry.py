@@ -1,21 +1,27 @@
-from sentry_sdk import set_context, capture_message
+from epicevents import sentry
+from epicevents.sentry import set_context, capture_message
+
+
+def get_department_name(user):
+    """Name of the department of user, 'admin' without one"""
+    return user.department.name if user.department else 'admin'
 
 
 def capture_user_creation(user, collaborator_created):
+    if not sentry.is_enabled():
+        return
     set_context(
         "User_created",
         {
             "by_user": {
                 "id": user.id,
                 "name": user.get_full_name() or user.email,
-                "department":
-                    user.groups.first().name
-                    if user.groups.exists() else 'admin'
+                "department": get_department_name(user)
             },
             "created_user": {
                 "id": collaborator_created.id,
                 "name": collaborator_created.get_full_name(),
-                "department": collaborator_created.groups.first().name
+                "department": get_department_name(collaborator_created)
             }
         }
     )
@@ -28,20 +34,20 @@ def capture_user_creation(user, collaborator_created):
 
 
 def capture_user_update(user, collaborator_updated, fields_changed):
+    if not sentry.is_enabled():
+        return
     set_context(
         "User_updated",
         {
             "by_user": {
                 "id": user.id,
                 "name": user.get_full_name() or user.email,
-                "department":
-                    user.groups.first().name
-                    if user.groups.exists() else 'admin'
+                "department": get_department_name(user)
             },
             "updated_user": {
                 "id": collaborator_updated.id,
                 "name": collaborator_updated.get_full_name(),
-                "department": collaborator_updated.groups.first().name
+                "department": get_department_name(collaborator_updated)
             },
             "fields_changed": fields_changed
         }
@@ -55,20 +61,20 @@ def capture_user_update(user, collaborator_updated, fields_changed):
 
 
 def capture_user_deleted(user, collaborator_deleted):
+    if not sentry.is_enabled():
+        return
     set_context(
         "User_deleted",
         {
             "by_user": {
                 "id": user.id,
                 "name": user.get_full_name() or user.email,
-                "department":
-                    user.groups.first().name
-                    if user.groups.exists() else 'admin'
+                "department": get_department_name(user)
             },
             "deleted_user": {
                 "id": collaborator_deleted.id,
                 "name": collaborator_deleted.get_full_name(),
-                "department": collaborator_deleted.groups.first().name
+                "department": get_department_name(collaborator_deleted)
             }
         }
     )
@@ -81,6 +87,8 @@ def capture_user_deleted(user, collaborator_deleted):
 
 
 def capture_contract_signed(contract):
+    if not sentry.is_enabled():
+        return
     set_context(
         "Contract", {
             "id": str(contract.id),
@@ -1,4 +1,13 @@
+from itertools import islice
 from rich.table import Table
+from django.db.models import OuterRef, Subquery
+from django.contrib.auth.models import Group
+from orm.departments import DEPARTMENTS
+from cli.utils.console import console
+
+
+# rows read from the database and printed at once
+CHUNK_SIZE = 500
 
 
 FIELDS = {
@@ -8,7 +17,7 @@ FIELDS = {
         'last_name',
         'email',
         'phone',
-        'groups__name',
+        'department',
         'created',
         'updated',
     ],
@@ -52,6 +61,20 @@ FIELDS = {
     ]
 }
 
+# fields of FIELDS computed with one value per row
+ANNOTATIONS = {
+    'user': {
+        # the first department group, as User.department, a join on
+        # groups would give a row per group
+        'department': Subquery(
+            Group.objects.filter(
+                user=OuterRef('pk'),
+                name__in=DEPARTMENTS
+            ).order_by('pk').values('name')[:1]
+        ),
+    },
+}
+
 
 def get_type(obj):
     """Get the type of the object as string"""
@@ -87,48 +110,137 @@ def create_table(queryset_or_obj):
     return table
 
 
-def table_add_column(table, type_obj):
-    """Create columns dynamically related to type_obj"""
+def table_add_column(table, type_obj, widths=None, columns=None):
+    """Create columns dynamically related to type_obj.
+    widths are the minimum widths of the columns.
+    """
+    for index, header in enumerate(get_headers(type_obj, columns)):
+        min_width = widths[index] if widths else None
+        if (
+            header == "ID" and type_obj == "Contract"
+            or header == "CONTRACT" and type_obj == "Event"
+        ):
+            min_width = max(min_width or 0, 36)
+        table.add_column(
+            header,
+            justify='center',
+            min_width=min_width,
+            overflow='fold'
+        )
+    return table
+
+
+def get_column_fields(type_obj):
+    """Map each column key related to type_obj to its fields.
+    First and last names of a relation are a single name column.
+    """
+    column_fields = {}
     previous_field = None
     for field_name in FIELDS[type_obj.lower()]:
         if '__first_name' in field_name:
             previous_field = field_name
             continue
-        elif field_name == 'groups__name':
-            field_name = 'department'
         if previous_field:
-            field_name = f"{field_name.split('__')[-2]} name"
+            key = f"{field_name.split('__')[-2]}_name"
+            column_fields[key] = [previous_field, field_name]
             previous_field = None
-        if (
-            field_name == "id" and type_obj == "Contract"
-            or field_name == "contract" and type_obj == "Event"
-        ):
-            table.add_column(
-                field_name.replace('__', ' ').replace('_', ' ').upper(),
-                justify='center',
-                min_width=36
-            )
         else:
-            table.add_column(
-                field_name.replace('__', ' ').replace('_', ' ').upper(),
-                justify='center',
-            )
-    return table
+            column_fields[field_name.replace('__', '_')] = [field_name]
+    return column_fields
+
+
+def get_columns(type_obj):
+    """Get the column keys related to type_obj"""
+    return list(get_column_fields(type_obj))
+
+
+def get_headers(type_obj, columns=None):
+    """Get the headers of columns, all columns if None"""
+    columns = columns or get_columns(type_obj)
+    return [key.replace('_', ' ').upper() for key in columns]
+
+
+def get_values(type_obj, queryset, chunk_size=CHUNK_SIZE, columns=None):
+    """Yield the values of columns for each row, all columns if None.
+    Only the fields of columns are selected, so only their joins are
+    made. Rows are read from the database chunk_size at a time.
+    """
+    column_fields = get_column_fields(type_obj)
+    columns = columns or list(column_fields)
+    fields = [
+        field_name
+        for key in columns
+        for field_name in column_fields[key]
+    ]
+    annotations = ANNOTATIONS.get(type_obj.lower(), {})
+    queryset = queryset.annotate(**{
+        field_name: annotations[field_name]
+        for field_name in fields if field_name in annotations
+    })
+    values_list = queryset.values_list(*fields)
+    for values_tuple in values_list.iterator(chunk_size=chunk_size):
+        values = []
+        row = iter(values_tuple)
+        for key in columns:
+            value = next(row)
+            if len(column_fields[key]) == 2:
+                last_name = next(row)
+                value = f'{value} {last_name}' if value else last_name
+            values.append(value)
+        yield values
+
+
+def get_rows(type_obj, queryset, chunk_size=CHUNK_SIZE, columns=None):
+    """Yield the values of each row as strings"""
+    for values in get_values(type_obj, queryset, chunk_size, columns):
+        yield [str(value) for value in values]
 
 
 def table_add_row(table, type_obj, queryset):
     """Create rows dynamically related to type_obj and queryset"""
-    fields = FIELDS[type_obj.lower()]
-    for values_tuple in queryset.values_list(*fields, named=True):
-        values = []
-        previous_value = None
-        for key, value in values_tuple._asdict().items():
-            if '__first_name' in key:
-                previous_value = value
-                continue
-            if previous_value:
-                value = f'{previous_value} {value}'
-                previous_value = None
-            values.append(str(value))
+    for values in get_rows(type_obj, queryset):
         table.add_row(*values)
     return table
+
+
+def fit_widths(widths):
+    """Keep widths while the table fits the console. A wider table gets
+    no minimum widths, rich then shrinks the columns and folds their
+    values instead of cropping the table.
+    """
+    # borders and padding, 3 characters per column and the right edge
+    if sum(widths) + 3 * len(widths) + 1 > console.width:
+        return None
+    return widths
+
+
+def print_table(queryset, chunk_size=CHUNK_SIZE, columns=None):
+    """Print the table of queryset chunk by chunk.
+    Each chunk is printed as soon as it is read, so the rows are
+    never all in memory. The header is only printed with the first
+    chunk and columns keep the widths of the previous chunks.
+    """
+    type_obj = queryset.model.__name__
+    rows = get_rows(type_obj, queryset, chunk_size, columns)
+    widths = [len(header) for header in get_headers(type_obj, columns)]
+    first = True
+    while chunk := list(islice(rows, chunk_size)):
+        for values in chunk:
+            widths = [
+                max(width, len(value))
+                for width, value in zip(widths, values)
+            ]
+        if first:
+            table = Table(title=type_obj + 's', header_style='blue')
+        else:
+            table = Table(show_header=False)
+        table = table_add_column(
+            table,
+            type_obj,
+            fit_widths(widths),
+            columns
+        )
+        for values in chunk:
+            table.add_row(*values)
+        console.print(table)
+        first = False
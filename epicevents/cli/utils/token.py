@@ -1,5 +1,6 @@
 import os
 import jwt
+import time
 from pathlib import Path
 from dotenv import set_key
 
@@ -96,6 +97,9 @@ class NewToken(BaseToken):
 
     def _is_user_token(self, token):
         payload = self._decode_token(token, self._key, raise_error=False)
+        return self._is_user_payload(payload)
+
+    def _is_user_payload(self, payload):
         if not payload:
             return False
         if (
@@ -108,10 +112,9 @@ class NewToken(BaseToken):
     def _create_token(self):
         if self._is_token_in_env():
             token = self._get_token_from_env()
-            if (
-                self._token_is_valid(token, self._key)
-                and self._is_user_token(token)
-            ):
+            # a single decode checks both validity and owner
+            payload = self._decode_token(token, self._key, raise_error=False)
+            if self._is_user_payload(payload):
                 return None
             else:
                 self._delete_token_from_env()
@@ -121,16 +124,36 @@ class NewToken(BaseToken):
 
 class Token(BaseToken):
     """Get the current saved token"""
+    # last verified token and its payload, reused by the warm process
+    _verified = (None, None)
 
     def __init__(self):
         self.token = self._get_token_from_env()
         if not self.token:
             raise TokenNotFoundError()
+        self._payload = None
 
     @property
     def decode(self):
-        """Decode token and return payload as dict"""
-        key = os.environ.get(self.KEY)
-        if self._token_is_valid(self.token, key):
-            return self._decode_token(self.token, key)
-        raise jwt.ExpiredSignatureError()
+        """Decode token and return payload as dict.
+        The signature is verified once, the payload is then cached.
+        """
+        if self._payload is None:
+            self._payload = self._verify()
+        return self._payload
+
+    def _verify(self):
+        key = self._get_secret_key()
+        verified, payload = Token._verified
+        if verified != (self.token, key):
+            payload = self._decode_token(self.token, key, raise_error=False)
+            if payload is None:
+                raise jwt.ExpiredSignatureError()
+            Token._verified = ((self.token, key), payload)
+        elif self._is_expired(payload):
+            raise jwt.ExpiredSignatureError()
+        return payload
+
+    @staticmethod
+    def _is_expired(payload):
+        return 'exp' in payload and payload['exp'] <= time.time()
@@ -1,3 +1,4 @@
+import click
 from jwt.exceptions import ExpiredSignatureError
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
@@ -8,12 +9,29 @@ User = get_user_model()
 
 
 def get_user():
-    """Get current authenticated user"""
+    """Get current authenticated user.
+    The user is loaded once per command invocation and shared by
+    the callbacks, the validators and the command itself.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None and 'user' in ctx.meta:
+        return ctx.meta['user']
+    user = load_user()
+    if ctx is not None:
+        # meta is shared by all the contexts of the invocation
+        ctx.meta['user'] = user
+    return user
+
+
+def load_user():
+    """Load the user of the saved token with its groups"""
     try:
         token = Token().decode
     except (ExpiredSignatureError, TokenNotFoundError):
         return None
     try:
-        return User.objects.get(id=token['user_id'])
+        return User.objects.prefetch_related('groups').get(
+            id=token['user_id']
+        )
     except ObjectDoesNotExist:
         return None
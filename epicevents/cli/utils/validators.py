@@ -1,12 +1,11 @@
 import re
 import typer
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
 from django.core.validators import EmailValidator
 from django.core.exceptions import ValidationError, ObjectDoesNotExist
-from django.db.models import Value as V
-from django.db.models.functions import Concat
-from django.contrib.auth.models import Group
 from orm.models import User, Client, Compagny, Contract, Event
+from orm.departments import get_department
 from orm.normalizers import normalize_phone, normalize_email
 from cli.utils.console import console
 
@@ -33,36 +32,50 @@ def validate(validator_name, value, ctx):
     return value, None
 
 
-def validate_unique_email(value, ctx):
-    email = None
-    if ctx.obj:
-        email = ctx.obj.email
-    if (
-        email != value
-        and (
-            User.objects.filter(email=value).exists()
-            or Client.objects.filter(email=value).exists()
-        )
-    ):
-        raise ValidationError(
-            "This email is already exists"
+def validate_unique_values(field, values, allowed=()):
+    """Check that values of field, email or phone, are used by no
+    collaborator nor client and are not repeated in values.
+    Both tables are checked in one query, whatever the number of values.
+
+    args:
+        field : 'email' or 'phone'
+        values : the values to check
+        allowed : values which may already exist, e.g. the current one
+
+    returns:
+        the error message of each value, None if it is unique
+    """
+    existing = set()
+    if values:
+        lookup = {f'{field}__in': values}
+        existing = set(
+            User.objects.filter(**lookup).values_list(field, flat=True).union(
+                Client.objects.filter(**lookup).values_list(field, flat=True)
+            )
         )
+    existing -= set(allowed)
+    errors = []
+    for value in values:
+        if value in existing:
+            errors.append(f"This {field} is already exists")
+        else:
+            errors.append(None)
+            existing.add(value)
+    return errors
+
+
+def validate_unique_email(value, ctx):
+    allowed = [ctx.obj.email] if ctx.obj else []
+    error, = validate_unique_values('email', [value], allowed)
+    if error:
+        raise ValidationError(error)
 
 
 def validate_unique_phone(value, ctx):
-    phone = None
-    if ctx.obj:
-        phone = ctx.obj.phone
-    if (
-        phone != value
-        and (
-            User.objects.filter(phone=value).exists()
-            or Client.objects.filter(phone=value).exists()
-        )
-    ):
-        raise ValidationError(
-            "This phone is already exists"
-        )
+    allowed = [ctx.obj.phone] if ctx.obj else []
+    error, = validate_unique_values('phone', [value], allowed)
+    if error:
+        raise ValidationError(error)
 
 
 def validate_unique_event_for_contract(value):
@@ -97,13 +110,7 @@ def validate_contract(value, ctx):
 
 def validate_client(value, ctx):
     try:
-        client = Client.objects.annotate(
-            full_name=Concat(
-                'first_name',
-                V(' '),
-                'last_name'
-            )
-        ).get(
+        client = Client.objects.get(
             full_name=value
         )
     except ObjectDoesNotExist:
@@ -119,13 +126,7 @@ def validate_contact(value, ctx):
     elif ctx.parent.info_name == 'event':
         group = 'support'
     try:
-        contact = User.objects.annotate(
-            full_name=Concat(
-                'first_name',
-                V(' '),
-                'last_name'
-            )
-        ).get(
+        contact = User.objects.get(
             full_name=value,
             groups__name=group
         )
@@ -196,6 +197,21 @@ def validate_end_date(value, ctx):
     return value
 
 
+def validate_amount(value, ctx):
+    """Validate a price or a balance with at most 2 decimals"""
+    try:
+        amount = Decimal(value.replace(',', '.'))
+    except InvalidOperation:
+        raise ValidationError(f"{value} is not a valid amount")
+    if not amount.is_finite() or amount < 0:
+        raise ValidationError("Amount must be a positive number")
+    if amount >= 10 ** 10:
+        raise ValidationError("Amount must be less than 10 000 000 000")
+    if amount != amount.quantize(Decimal('0.01')):
+        raise ValidationError("Amount can not have more than 2 decimals")
+    return amount.quantize(Decimal('0.01'))
+
+
 def validate_password(value, ctx):
     confirmation = typer.prompt("Repeat for confirmation")
     if value != confirmation:
@@ -205,22 +221,32 @@ def validate_password(value, ctx):
     return value
 
 
-def validate_email(value, ctx):
+def format_email(value):
+    """Check the format of an email and normalize it"""
     email_validator = EmailValidator()
     email_validator(value)
-    value = normalize_email(value)
-    if ctx.info_name != 'login':
-        validate_unique_email(value, ctx)
-    return value
+    return normalize_email(value)
 
 
-def validate_phone(value, ctx):
+def format_phone(value):
+    """Check the format of a phone number and normalize it"""
     phone_regex = r'^(?:(?:\+|00)33|0)\s*[1-9](?:[\s.-]*\d{2}){4}$'
     if not re.match(phone_regex, value):
         raise ValidationError(
             "Enter a valid phone number"
         )
-    value = normalize_phone(value)
+    return normalize_phone(value)
+
+
+def validate_email(value, ctx):
+    value = format_email(value)
+    if ctx.info_name != 'login':
+        validate_unique_email(value, ctx)
+    return value
+
+
+def validate_phone(value, ctx):
+    value = format_phone(value)
     validate_unique_phone(value, ctx)
     return value
 
@@ -231,7 +257,7 @@ def validate_department(value, ctx):
             "Invalid department."
             " Department must be 'management', 'sales' or 'support'"
         )
-    value = Group.objects.get(name=value)
+    value = get_department(value)
     return value
 
 
@@ -246,4 +272,6 @@ VALIDATORS = {
     'contract': validate_contract,
     'start_date': validate_start_date,
     'end_date': validate_end_date,
+    'price': validate_amount,
+    'balance': validate_amount,
 }
@@ -1,19 +1,30 @@
 import os
-import django
-import sentry_sdk
+import sys
+from cli.daemon import forward
 
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'epicevents.settings')
-django.setup()
+def main():
+    import django
 
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'epicevents.settings')
+    django.setup()
 
-if __name__ == '__main__':
+    from epicevents import sentry
     from cli.commands.cli import app
+    sentry.setup()
     # run the app and capture any exceptions to send to sentry
     try:
         app()
     except Exception as e:
-        sentry_sdk.capture_exception(e)
+        sentry.capture_exception(e)
         raise e
     finally:
-        sentry_sdk.flush()
+        sentry.flush()
+
+
+if __name__ == '__main__':
+    # forward the command to the warm process if it is running
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+    main()
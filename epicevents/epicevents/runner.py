@@ -2,8 +2,25 @@ import os
 from django.test.runner import DiscoverRunner
 
 
+# width of the consoles in the tests, whatever the terminal
+CONSOLE_WIDTH = 200
+
+
 class MyTestRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        from cli.utils.console import console
+
+        super().setup_test_environment(**kwargs)
+        # read by the consoles typer creates for its messages
+        self.columns = os.environ.get('COLUMNS')
+        os.environ['COLUMNS'] = str(CONSOLE_WIDTH)
+        console.width = CONSOLE_WIDTH
+
     def teardown_test_environment(self, **kwargs):
         super(MyTestRunner, self).teardown_test_environment(**kwargs)
+        if self.columns is None:
+            os.environ.pop('COLUMNS', None)
+        else:
+            os.environ['COLUMNS'] = self.columns
         if os.path.exists('.env.test'):
             os.remove('.env.test')
@@ -0,0 +1,58 @@
+"""Sentry SDK initialised on demand.
+
+Without DSN the SDK is never imported. Otherwise it is initialised at
+startup only when traces or profiles are sampled, and when the first
+event is captured in any other case.
+"""
+from django.conf import settings
+
+
+_initialized = False
+
+
+def is_enabled():
+    return bool(settings.SENTRY['dsn']) and not settings.TESTING
+
+
+def init():
+    """Initialise the SDK once. Return True if it is initialised"""
+    global _initialized
+    if not _initialized and is_enabled():
+        import sentry_sdk
+        sentry_sdk.init(**settings.SENTRY)
+        _initialized = True
+    return _initialized
+
+
+def setup():
+    """Initialise the SDK at startup if the command has to be traced"""
+    if (
+        settings.SENTRY['traces_sample_rate']
+        or settings.SENTRY['profiles_sample_rate']
+    ):
+        init()
+
+
+def set_context(key, value):
+    if init():
+        import sentry_sdk
+        sentry_sdk.set_context(key, value)
+
+
+def capture_message(message):
+    if init():
+        import sentry_sdk
+        sentry_sdk.capture_message(message)
+
+
+def capture_exception(error):
+    if init():
+        import sentry_sdk
+        sentry_sdk.capture_exception(error)
+
+
+def flush():
+    """Wait for the events to be sent, if the SDK has been initialised"""
+    if _initialized:
+        import sentry_sdk
+        sentry_sdk.flush(timeout=settings.SENTRY_FLUSH_TIMEOUT)
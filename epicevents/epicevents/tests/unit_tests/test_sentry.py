@@ -0,0 +1,82 @@
+from unittest.mock import patch
+from django.test import SimpleTestCase, override_settings
+from epicevents import sentry
+
+
+DSN = 'https://public@example.com/1'
+
+
+def sentry_settings(dsn=DSN, traces=0.0, profiles=0.0):
+    return override_settings(
+        TESTING=False,
+        SENTRY={
+            'dsn': dsn,
+            'traces_sample_rate': traces,
+            'profiles_sample_rate': profiles,
+        },
+        SENTRY_FLUSH_TIMEOUT=1.5,
+    )
+
+
+@patch('sentry_sdk.flush')
+@patch('sentry_sdk.capture_message')
+@patch('sentry_sdk.init')
+class TestSentry(SimpleTestCase):
+    def setUp(self):
+        sentry._initialized = False
+
+    def tearDown(self):
+        sentry._initialized = False
+
+    @sentry_settings(dsn=None)
+    def test_no_dsn(self, mock_init, mock_capture, mock_flush):
+        sentry.setup()
+        sentry.capture_message('message')
+        sentry.flush()
+        self.assertFalse(sentry.is_enabled())
+        mock_init.assert_not_called()
+        mock_capture.assert_not_called()
+        mock_flush.assert_not_called()
+
+    @sentry_settings()
+    def test_not_initialised_at_startup(self, mock_init, *mocks):
+        sentry.setup()
+        mock_init.assert_not_called()
+
+    @sentry_settings(traces=0.1)
+    def test_initialised_at_startup_when_traced(self, mock_init, *mocks):
+        sentry.setup()
+        mock_init.assert_called_once_with(
+            dsn=DSN,
+            traces_sample_rate=0.1,
+            profiles_sample_rate=0.0
+        )
+
+    @sentry_settings()
+    def test_initialised_once_on_capture(
+        self,
+        mock_init,
+        mock_capture,
+        mock_flush
+    ):
+        sentry.capture_message('first')
+        sentry.capture_message('second')
+        mock_init.assert_called_once()
+        self.assertEqual(mock_capture.call_count, 2)
+
+    @sentry_settings()
+    def test_flush_only_when_initialised(
+        self,
+        mock_init,
+        mock_capture,
+        mock_flush
+    ):
+        sentry.flush()
+        mock_flush.assert_not_called()
+        sentry.capture_message('message')
+        sentry.flush()
+        mock_flush.assert_called_once_with(timeout=1.5)
+
+    def test_disabled_while_testing(self, mock_init, *mocks):
+        sentry.capture_message('message')
+        mock_init.assert_not_called()
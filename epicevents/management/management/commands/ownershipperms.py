@@ -0,0 +1,101 @@
+from itertools import islice
+from django.db import transaction
+from django.conf import settings
+from django.contrib.auth.models import Permission
+from django.core.management.base import BaseCommand, CommandError
+from guardian.utils import get_user_obj_perms_model
+from orm.backends import OWNERS, compare_owner_rows
+
+
+BATCH_SIZE = 10000
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the guardian object permission rows with the contacts, "
+        "delete them after switching to OBJECT_PERMISSIONS=ownership "
+        "or create them back to switch to guardian"
+    )
+
+    def add_arguments(self, parser):
+        group = parser.add_mutually_exclusive_group()
+        group.add_argument(
+            "--delete",
+            action="store_true",
+            help="Delete the rows of the ownership permissions"
+        )
+        group.add_argument(
+            "--create",
+            action="store_true",
+            help="Create a row for the contact of each object"
+        )
+
+    def handle(self, *args, **options):
+        if options["delete"]:
+            # the guardian backend still reads the rows
+            if settings.OBJECT_PERMISSIONS != 'ownership':
+                raise CommandError(
+                    "The rows are still used. Set OBJECT_PERMISSIONS="
+                    "ownership before deleting them."
+                )
+            self.delete_rows()
+        elif options["create"]:
+            self.create_rows()
+        for perm, counts in compare_owner_rows().items():
+            matching, others, missing = counts
+            self.stdout.write(
+                f"{perm}: {matching} rows of the contact, "
+                f"{others} rows of another user, "
+                f"{missing} contacts without row"
+            )
+
+    def delete_rows(self):
+        deleted, _ = get_user_obj_perms_model().objects.filter(
+            permission__in=self.get_permissions().values()
+        ).delete()
+        self.stdout.write(f"{deleted} rows deleted.")
+
+    def create_rows(self):
+        """Create the missing rows of the contacts, the rows of the other
+        users are kept
+        """
+        model = get_user_obj_perms_model()
+        created = 0
+        with transaction.atomic():
+            for perm, permission in self.get_permissions().items():
+                path = OWNERS[perm]
+                owned_model = permission.content_type.model_class()
+                rows = model.objects.filter(permission=permission)
+                before = rows.count()
+                owners = owned_model.objects.filter(
+                    **{f'{path}__isnull': False}
+                ).values_list('pk', path).iterator(chunk_size=BATCH_SIZE)
+                while batch := list(islice(owners, BATCH_SIZE)):
+                    model.objects.bulk_create(
+                        [
+                            model(
+                                permission=permission,
+                                content_type=permission.content_type,
+                                object_pk=str(pk),
+                                user_id=owner
+                            )
+                            for pk, owner in batch
+                        ],
+                        ignore_conflicts=True
+                    )
+                # the existing rows are skipped by bulk_create
+                created += rows.count() - before
+        self.stdout.write(
+            f"{created} missing contact rows created, existing rows kept."
+        )
+
+    @staticmethod
+    def get_permissions():
+        """Get the Permission of each permission of OWNERS"""
+        permissions = {}
+        for perm in OWNERS:
+            app_label, codename = perm.split('.')
+            permissions[perm] = Permission.objects.select_related(
+                'content_type'
+            ).get(content_type__app_label=app_label, codename=codename)
+        return permissions
@@ -0,0 +1,29 @@
+import signal
+from pathlib import Path
+from django.core.management.base import BaseCommand
+from cli.daemon import serve, get_socket_path
+
+
+class Command(BaseCommand):
+    help = "Keep the CLI loaded and run the commands sent by epicevents.py"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--socket",
+            action="store",
+            help="Unix socket path (default: CLI_SOCKET or .epicevents.sock)"
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["socket"]) if options["socket"] else None
+        path = path or get_socket_path()
+        # remove the socket when the server is terminated
+        signal.signal(signal.SIGTERM, self.terminate)
+        try:
+            serve(path, stdout=self.stdout)
+        except KeyboardInterrupt:
+            self.stdout.write("\nServer stopped.")
+
+    @staticmethod
+    def terminate(signum, frame):
+        raise KeyboardInterrupt()
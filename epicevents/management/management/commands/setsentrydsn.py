@@ -2,11 +2,18 @@ import sys
 from pathlib import Path
 from dotenv import set_key
 from sentry_sdk.utils import Dsn, BadDsn
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+
+
+def sample_rate(value):
+    rate = float(value)
+    if not 0 <= rate <= 1:
+        raise ValueError()
+    return rate
 
 
 class Command(BaseCommand):
-    help = "Set Sentry DSN"
+    help = "Set Sentry DSN, sample rates and flush timeout"
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -14,10 +21,56 @@ class Command(BaseCommand):
             action="store",
             help="Set DSN for Sentry"
         )
+        parser.add_argument(
+            "--traces-sample-rate",
+            action="store",
+            help="Part of the commands traced, between 0.0 and 1.0"
+        )
+        parser.add_argument(
+            "--profiling",
+            action="store",
+            choices=["true", "false"],
+            help="Profile the traced commands"
+        )
+        parser.add_argument(
+            "--profiles-sample-rate",
+            action="store",
+            help="Part of the traced commands profiled, between 0.0 and 1.0"
+        )
+        parser.add_argument(
+            "--flush-timeout",
+            action="store",
+            help="Maximum time in seconds to send the events at exit"
+        )
 
     def handle(self, *args, **options):
+        values = {}
+        try:
+            if options["traces_sample_rate"] is not None:
+                values["SENTRY_TRACES_SAMPLE_RATE"] = sample_rate(
+                    options["traces_sample_rate"]
+                )
+            if options["profiles_sample_rate"] is not None:
+                values["SENTRY_PROFILES_SAMPLE_RATE"] = sample_rate(
+                    options["profiles_sample_rate"]
+                )
+            if options["flush_timeout"] is not None:
+                values["SENTRY_FLUSH_TIMEOUT"] = float(
+                    options["flush_timeout"]
+                )
+        except ValueError:
+            raise CommandError(
+                "Sample rates must be between 0.0 and 1.0"
+                " and flush timeout a number of seconds."
+            )
+        if options["profiling"] is not None:
+            values["SENTRY_PROFILING"] = options["profiling"]
+
         if options["dsn"]:
             dsn = options["dsn"]
+        elif values:
+            # only update the other settings
+            dsn = None
         else:
             try:
                 dsn = input("DSN : ")
@@ -25,15 +78,21 @@ class Command(BaseCommand):
                 self.stderr.write("\nOperation cancelled.")
                 sys.exit(1)
 
-        try:
-            Dsn(dsn)
-        except BadDsn as err:
-            self.stderr.write(f"{err}.")
-            sys.exit(1)
+        if dsn is not None:
+            try:
+                Dsn(dsn)
+            except BadDsn as err:
+                self.stderr.write(f"{err}.")
+                sys.exit(1)
+            values["DSN"] = dsn
 
         file_name = Path(".env")
         if not Path.is_file(file_name):
             with open(file_name, "w"):
                 pass
-        set_key(file_name, "DSN", dsn)
-        self.stdout.write("DSN successfully added.")
+        for key, value in values.items():
+            set_key(file_name, key, str(value))
+        if dsn is not None:
+            self.stdout.write("DSN successfully added.")
+        if set(values) - {"DSN"}:
+            self.stdout.write("Sentry settings successfully updated.")
@@ -0,0 +1,25 @@
+from django.db import transaction
+from django.core.management.base import BaseCommand
+from orm.signals import create_department_group, sync_base_permissions
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the department groups and give them the permissions "
+        "of settings.PERMISSIONS, without running the migrations"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Remove the permissions of the groups not in the settings"
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            create_department_group(sender=None)
+            added, removed = sync_base_permissions(prune=options["prune"])
+        self.stdout.write(
+            f"{added} permissions added, {removed} permissions removed."
+        )
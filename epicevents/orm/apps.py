@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 from django.db.models.signals import post_migrate
 
 
@@ -9,7 +10,9 @@ class OrmConfig(AppConfig):
     def ready(self):
         from orm.signals import (
             create_department_group,
-            set_base_permissions
+            set_base_permissions,
+            set_sqlite_pragmas
         )
+        connection_created.connect(set_sqlite_pragmas)
         post_migrate.connect(create_department_group, sender=self)
         post_migrate.connect(set_base_permissions, sender=self)
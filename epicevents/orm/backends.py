@@ -0,0 +1,118 @@
+from guardian.utils import get_user_obj_perms_model
+
+
+# object permission: path from the object to the user allowed to use it,
+# the contact of the client, of the client of the contract or of the event
+OWNERS = {
+    'orm.change_client': 'contact',
+    'orm.change_contract': 'client__contact',
+    'orm.change_event': 'contact',
+}
+
+
+def get_owner_paths(model):
+    """Get the object permissions of model and their owner path"""
+    app_label = model._meta.app_label
+    codename = f'change_{model._meta.model_name}'
+    return {
+        perm: path
+        for perm, path in OWNERS.items()
+        if perm.split('.') == [app_label, codename]
+    }
+
+
+def get_owner_ids(model, objects, path):
+    """Map the primary key of each object to the id of its owner.
+    A field of the objects costs no query, a path through a relation
+    one query for all the objects.
+    """
+    if '__' not in path:
+        attname = model._meta.get_field(path).attname
+        return {obj.pk: getattr(obj, attname) for obj in objects}
+    return dict(
+        model.objects.filter(
+            pk__in=[obj.pk for obj in objects]
+        ).values_list('pk', path)
+    )
+
+
+def get_owned_perms(user, objects):
+    """Map each object to the codenames of the object permissions
+    user gets from ownership
+    """
+    perms = {obj: set() for obj in objects}
+    models = {}
+    for obj in objects:
+        models.setdefault(obj._meta.model, []).append(obj)
+    for model, model_objects in models.items():
+        for perm, path in get_owner_paths(model).items():
+            owners = get_owner_ids(model, model_objects, path)
+            for obj in model_objects:
+                if owners.get(obj.pk) == user.id:
+                    perms[obj].add(perm.split('.')[-1])
+    return perms
+
+
+class OwnershipBackend:
+    """Object permissions given by the contact foreign keys.
+    Replaces guardian.backends.ObjectPermissionBackend: the contact
+    of a client, of the contracts of the client and of an event can
+    change them, no permission row is read or written.
+    """
+
+    def authenticate(self, request, **credentials):
+        return None
+
+    def get_all_permissions(self, user_obj, obj=None):
+        if obj is None or not user_obj.is_active:
+            return set()
+        app_label = obj._meta.app_label
+        return {
+            f'{app_label}.{codename}'
+            for codename in get_owned_perms(user_obj, [obj])[obj]
+        }
+
+    def has_perm(self, user_obj, perm, obj=None):
+        if obj is None:
+            return False
+        if '.' not in perm:
+            perm = f'{obj._meta.app_label}.{perm}'
+        return perm in self.get_all_permissions(user_obj, obj)
+
+
+def compare_owner_rows():
+    """Compare the guardian rows of the permissions of OWNERS with
+    the owners.
+
+    returns:
+        for each permission, the number of rows matching an owner,
+        of rows of another user and of owners without row
+    """
+    from django.contrib.auth.models import Permission
+
+    model = get_user_obj_perms_model()
+    results = {}
+    for perm, path in OWNERS.items():
+        app_label, codename = perm.split('.')
+        permission = Permission.objects.get(
+            content_type__app_label=app_label,
+            codename=codename
+        )
+        owned_model = permission.content_type.model_class()
+        owners = {
+            (str(pk), owner)
+            for pk, owner in owned_model.objects.filter(
+                **{f'{path}__isnull': False}
+            ).values_list('pk', path).iterator()
+        }
+        rows = set(
+            model.objects.filter(
+                permission=permission
+            ).values_list('object_pk', 'user').iterator()
+        )
+        results[perm] = (
+            len(rows & owners),
+            len(rows - owners),
+            len(owners - rows),
+        )
+    return results
@@ -0,0 +1,44 @@
+from django.contrib.auth.models import Group
+
+
+# groups of the collaborators, a group per department
+DEPARTMENTS = ['management', 'sales', 'support']
+
+# department groups by name, loaded once per process
+_groups = {}
+
+
+def get_departments():
+    """Get the department groups by name, read with one query the
+    first time then kept for the process
+    """
+    if len(_groups) < len(DEPARTMENTS):
+        _groups.update(
+            (group.name, group)
+            for group in Group.objects.filter(name__in=DEPARTMENTS)
+        )
+    return _groups
+
+
+def get_department(name):
+    """Get the group of the department name"""
+    return get_departments()[name]
+
+
+def clear_departments():
+    """Forget the loaded groups, they are read again on the next use"""
+    _groups.clear()
+
+
+def get_user_department(user):
+    """Get the department group of user, None for a user without one.
+    The groups prefetched with the user cost no query.
+    """
+    departments = get_departments()
+    ids = {group.id: group for group in departments.values()}
+    if 'groups' in getattr(user, '_prefetched_objects_cache', {}):
+        group_ids = [group.id for group in user.groups.all()]
+    else:
+        group_ids = user.groups.values_list('id', flat=True)
+    found = [ids[group_id] for group_id in group_ids if group_id in ids]
+    return min(found, key=lambda group: group.id, default=None)
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-17 06:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orm', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(fields=['created', 'id'], name='contract_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-17 07:05
+
+from django.db import migrations, models
+from django.db.models import Value as V
+from django.db.models.functions import Concat
+
+
+def set_full_names(apps, schema_editor):
+    for model_name in ['Client', 'User']:
+        model = apps.get_model('orm', model_name)
+        model.objects.update(
+            full_name=Concat('first_name', V(' '), 'last_name')
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orm', '0002_contract_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='full_name',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=101),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='full_name',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=101),
+        ),
+        migrations.RunPython(set_full_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.7 on 2026-10-17 07:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orm', '0003_full_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(condition=models.Q(('signed', True)), fields=['created', 'id'], name='contract_signed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(condition=models.Q(('signed', False)), fields=['created', 'id'], name='contract_not_signed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(condition=models.Q(('balance', 0)), fields=['created', 'id'], name='contract_paid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contract',
+            index=models.Index(condition=models.Q(('balance__gt', 0)), fields=['created', 'id'], name='contract_unpaid_idx'),
+        ),
+    ]
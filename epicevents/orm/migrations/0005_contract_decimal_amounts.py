@@ -0,0 +1,36 @@
+# Generated by Django 4.2.7 on 2026-10-17 07:15
+
+import django.core.validators
+from django.db import migrations, models
+from django.db.models.functions import Round
+
+
+def round_amounts(apps, schema_editor):
+    # SQLite keeps the float values, round them to the cent so that
+    # balances like 1e-13 are 0 for the paid filter and its index
+    Contract = apps.get_model('orm', 'Contract')
+    Contract.objects.update(
+        price=Round('price', 2),
+        balance=Round('balance', 2)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orm', '0004_contract_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='contract',
+            name='balance',
+            field=models.DecimalField(decimal_places=2, max_digits=12, validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+        migrations.AlterField(
+            model_name='contract',
+            name='price',
+            field=models.DecimalField(decimal_places=2, max_digits=12, validators=[django.core.validators.MinValueValidator(0)]),
+        ),
+        migrations.RunPython(round_amounts, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,135 @@
 import uuid
 from django.db import models
 from django.conf import settings
+from django.core.validators import MinValueValidator
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from orm.normalizers import normalize_phone
+from orm.departments import get_user_department
+
+
+def set_full_name(instance, kwargs):
+    """Set the full name of instance before saving it.
+    The full name is saved with the names when update_fields is given.
+    """
+    instance.full_name = f'{instance.first_name} {instance.last_name}'
+    update_fields = kwargs.get('update_fields')
+    if (
+        update_fields is not None
+        and {'first_name', 'last_name'} & set(update_fields)
+    ):
+        kwargs['update_fields'] = {*update_fields, 'full_name'}
+
+
+class DirtyFieldsMixin:
+    """Track the fields of a model changed since loaded or saved.
+    The values loaded from the database are kept to compare them with
+    the current values.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: value
+            for name, value in zip(field_names, values)
+            if value is not models.DEFERRED
+        }
+        return instance
+
+    def get_dirty_fields(self):
+        """Get the names of the fields changed since loaded or saved,
+        all the fields of a new instance. A deferred field is changed
+        once set.
+        """
+        fields = self._meta.concrete_fields
+        loaded = getattr(self, '_loaded_values', None)
+        if self._state.adding or loaded is None:
+            return {field.name for field in fields}
+        return {
+            field.name
+            for field in fields
+            if field.attname in self.__dict__ and (
+                field.attname not in loaded
+                or getattr(self, field.attname) != loaded[field.attname]
+            )
+        }
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.set_loaded_values(kwargs.get('update_fields'))
+
+    def save_dirty_fields(self, **kwargs):
+        """Save only the changed fields and the auto_now fields.
+        Nothing is written if no field changed.
+
+        returns:
+            the names of the changed fields
+        """
+        dirty = self.get_dirty_fields()
+        if dirty:
+            auto_now = {
+                field.name
+                for field in self._meta.concrete_fields
+                if getattr(field, 'auto_now', False)
+            }
+            self.save(update_fields=dirty | auto_now, **kwargs)
+        return dirty
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        self.set_loaded_values(fields)
+
+    def set_loaded_values(self, field_names=None):
+        """Keep the current values of field_names, all the fields if None,
+        as the values of the database
+        """
+        if field_names is None or not hasattr(self, '_loaded_values'):
+            self._loaded_values = {}
+        self._loaded_values.update({
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__ and (
+                field_names is None
+                or field.name in field_names
+                or field.attname in field_names
+            )
+        })
+
+
+class CleanChangedFieldsMixin(DirtyFieldsMixin):
+    """Validate the changed fields of a model before saving it.
+    The fields whose value did not change are neither cleaned nor
+    checked for uniqueness, so saving a single changed field costs
+    no validation query for the others. All the fields of a new
+    instance are validated.
+    """
+
+    def save(self, *args, validate_unique=True, **kwargs):
+        """Clean the changed fields then save the instance.
+        Only the fields of update_fields are cleaned when it is given.
+        validate_unique=False skips the unique checks of fields already
+        validated, by the CLI validators for instance.
+        """
+        fields = self._meta.concrete_fields
+        dirty = self.get_dirty_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            dirty = {
+                field.name
+                for field in fields
+                if field.name in dirty and (
+                    field.name in update_fields
+                    or field.attname in update_fields
+                )
+            }
+        self.full_clean(
+            exclude=[
+                field.name for field in fields if field.name not in dirty
+            ],
+            validate_unique=validate_unique
+        )
+        super().save(*args, **kwargs)
 
 
 class MyUserManager(BaseUserManager):
@@ -47,6 +174,7 @@ class MyUserManager(BaseUserManager):
             password=password
         )
         user.groups.add(department)
+        user.department = department
 
         return user
 
@@ -70,11 +198,18 @@ class MyUserManager(BaseUserManager):
         return user
 
 
-class User(AbstractUser):
+class User(DirtyFieldsMixin, AbstractUser):
     first_name = models.CharField(max_length=50)
     last_name = models.CharField(max_length=50)
     email = models.EmailField(max_length=62, unique=True)
     phone = models.CharField(max_length=20, unique=True)
+    # first and last names, indexed for the lookups by name
+    full_name = models.CharField(
+        max_length=101,
+        blank=True,
+        editable=False,
+        db_index=True
+    )
     created = models.DateField(auto_now_add=True)
     updated = models.DateField(auto_now=True)
     username = None
@@ -84,6 +219,27 @@ class User(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['phone']
 
+    def save(self, *args, **kwargs):
+        set_full_name(self, kwargs)
+        return super().save(*args, **kwargs)
+
+    @property
+    def department(self):
+        """Department group of the user, None for the admin.
+        Read once, set it after changing the groups.
+        """
+        if not hasattr(self, '_department'):
+            self._department = get_user_department(self)
+        return self._department
+
+    @department.setter
+    def department(self, group):
+        self._department = group
+
+    def refresh_from_db(self, using=None, fields=None):
+        self.__dict__.pop('_department', None)
+        super().refresh_from_db(using=using, fields=fields)
+
     def __str__(self):
         return self.get_full_name()
 
@@ -98,7 +254,7 @@ class Compagny(models.Model):
         return self.name
 
 
-class Client(models.Model):
+class Client(CleanChangedFieldsMixin, models.Model):
     first_name = models.CharField(max_length=50)
     last_name = models.CharField(max_length=50)
     email = models.EmailField(unique=True)
@@ -113,18 +269,25 @@ class Client(models.Model):
         on_delete=models.SET_NULL,
         null=True
     )
+    # first and last names, indexed for the lookups by name
+    full_name = models.CharField(
+        max_length=101,
+        blank=True,
+        editable=False,
+        db_index=True
+    )
     created = models.DateField(auto_now_add=True)
     updated = models.DateField(auto_now=True)
 
     def save(self, *args, **kwargs):
-        self.full_clean()
+        set_full_name(self, kwargs)
         return super().save(*args, **kwargs)
 
     def __str__(self):
         return f'{self.first_name} {self.last_name}'
 
 
-class Contract(models.Model):
+class Contract(CleanChangedFieldsMixin, models.Model):
     id = models.UUIDField(
         primary_key=True,
         unique=True,
@@ -136,23 +299,58 @@ class Contract(models.Model):
         on_delete=models.PROTECT,
         related_name='contracts'
     )
-    price = models.FloatField()
-    balance = models.FloatField()
+    price = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        validators=[MinValueValidator(0)]
+    )
+    balance = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        validators=[MinValueValidator(0)]
+    )
     signed = models.BooleanField(
         default=False,
     )
     created = models.DateField(auto_now_add=True)
     updated = models.DateField(auto_now=True)
 
-    def save(self, *args, **kwargs):
-        self.full_clean()
-        return super().save(*args, **kwargs)
+    class Meta:
+        indexes = [
+            # keyset pagination of contract view
+            models.Index(
+                fields=['created', 'id'],
+                name='contract_created_id_idx'
+            ),
+            # contract view filters, each partial index holds only
+            # the contracts of its filter in the order of the pages
+            models.Index(
+                fields=['created', 'id'],
+                condition=models.Q(signed=True),
+                name='contract_signed_idx'
+            ),
+            models.Index(
+                fields=['created', 'id'],
+                condition=models.Q(signed=False),
+                name='contract_not_signed_idx'
+            ),
+            models.Index(
+                fields=['created', 'id'],
+                condition=models.Q(balance=0),
+                name='contract_paid_idx'
+            ),
+            models.Index(
+                fields=['created', 'id'],
+                condition=models.Q(balance__gt=0),
+                name='contract_unpaid_idx'
+            ),
+        ]
 
     def __str__(self):
         return f'{self.id}'
 
 
-class Event(models.Model):
+class Event(CleanChangedFieldsMixin, models.Model):
     name = models.CharField(max_length=50)
     start_date = models.DateTimeField()
     end_date = models.DateTimeField()
@@ -173,7 +371,3 @@ class Event(models.Model):
     note = models.TextField(null=True, blank=True)
     created = models.DateField(auto_now_add=True)
     updated = models.DateField(auto_now=True)
-
-    def save(self, *args, **kwargs):
-        self.full_clean()
-        return super().save(*args, **kwargs)
@@ -1,26 +1,100 @@
-from django.contrib.auth.models import Group
+from django.contrib.auth.models import Group, Permission
 from django.conf import settings
-from guardian.shortcuts import assign_perm
+from django.db.models import Q
+from django.core.exceptions import ImproperlyConfigured
+from orm.departments import DEPARTMENTS, clear_departments
+
+
+# values allowed for the pragmas which are not numbers
+SQLITE_PRAGMA_CHOICES = {
+    'journal_mode': {'delete', 'truncate', 'persist', 'memory', 'wal', 'off'},
+    'synchronous': {'off', 'normal', 'full', 'extra'},
+    'temp_store': {'default', 'file', 'memory'},
+}
+
+
+def set_sqlite_pragmas(sender, connection, **kwargs):
+    """Set settings.SQLITE_PRAGMAS on each new SQLite connection"""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for pragma, value in settings.SQLITE_PRAGMAS.items():
+            if pragma in SQLITE_PRAGMA_CHOICES:
+                value = str(value).lower()
+                if value not in SQLITE_PRAGMA_CHOICES[pragma]:
+                    raise ImproperlyConfigured(
+                        f'Invalid SQLite {pragma}: {value}.'
+                    )
+            else:
+                value = int(value)
+            cursor.execute(f'PRAGMA {pragma} = {value}')
 
 
 def create_department_group(sender, **kwargs):
-    for department_name in [
-        'management',
-        'sales',
-        'support'
-    ]:
-        if not Group.objects.filter(
-            name=department_name
-        ).exists():
-            Group.objects.create(
-                name=department_name
-            )
+    """Create the missing department groups, they are loaded again
+    by the next get_departments
+    """
+    Group.objects.bulk_create(
+        [Group(name=name) for name in DEPARTMENTS],
+        ignore_conflicts=True
+    )
+    clear_departments()
 
 
 def set_base_permissions(sender, **kwargs):
-    groups = Group.objects.all()
-    for group in groups:
-        for codename in settings.PERMISSIONS[group.name]:
-            assign_perm('orm.' + codename, group)
-        for codename in settings.PERMISSIONS['all']:
-            assign_perm('orm.' + codename, group)
+    sync_base_permissions()
+
+
+def sync_base_permissions(prune=False):
+    """Give each department group its permissions of settings.PERMISSIONS.
+    The missing links are computed from the existing ones and created
+    with one query, nothing is written when they are all there.
+    With prune, the other permissions of the groups are removed.
+
+    returns:
+        the number of added and removed permissions
+    """
+    codenames = {
+        name: {*settings.PERMISSIONS[name], *settings.PERMISSIONS['all']}
+        for name in DEPARTMENTS
+    }
+    wanted = set().union(*codenames.values())
+    permissions = dict(
+        Permission.objects.filter(
+            content_type__app_label='orm',
+            codename__in=wanted
+        ).values_list('codename', 'id')
+    )
+    unknown = wanted - set(permissions)
+    if unknown:
+        raise ImproperlyConfigured(
+            f"Unknown permissions in PERMISSIONS: {', '.join(sorted(unknown))}"
+        )
+    groups = dict(
+        Group.objects.filter(name__in=DEPARTMENTS).values_list('id', 'name')
+    )
+    links = {
+        (group_id, permissions[codename])
+        for group_id, name in groups.items()
+        for codename in codenames[name]
+    }
+    Link = Group.permissions.through
+    existing = Link.objects.filter(group__in=groups)
+    existing_links = set(existing.values_list('group', 'permission'))
+    missing = links - existing_links
+    Link.objects.bulk_create(
+        [
+            Link(group_id=group_id, permission_id=permission_id)
+            for group_id, permission_id in missing
+        ],
+        ignore_conflicts=True
+    )
+    removed = 0
+    if prune:
+        others = Q()
+        for group_id, name in groups.items():
+            others |= Q(group=group_id) & ~Q(permission__in=[
+                permissions[codename] for codename in codenames[name]
+            ])
+        removed, _ = existing.filter(others).delete()
+    return len(missing), removed
@@ -0,0 +1,189 @@
+from io import StringIO
+from unittest.mock import patch
+from datetime import datetime
+from django.test import TestCase, override_settings
+from django.core.management import call_command, CommandError
+from django.contrib.auth.models import Group
+from guardian.shortcuts import assign_perm, get_users_with_perms
+from orm.models import User, Client, Compagny, Contract, Event
+from orm.backends import (
+    OWNERS,
+    OwnershipBackend,
+    compare_owner_rows,
+    get_owner_paths,
+)
+
+
+class BackendTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            first_name='user',
+            last_name='sales',
+            email='user@sales.com',
+            phone='0611111111',
+            password='password',
+            department=Group.objects.get(name='sales')
+        )
+        cls.support = User.objects.create_user(
+            first_name='user',
+            last_name='support',
+            email='user@support.com',
+            phone='0622222222',
+            password='password',
+            department=Group.objects.get(name='support')
+        )
+        compagny = Compagny.objects.create(name='test_compagny')
+        cls.client_1 = Client.objects.create(
+            first_name='client',
+            last_name='one',
+            email='client@one.com',
+            phone='0610101010',
+            compagny=compagny,
+            contact=cls.user
+        )
+        cls.client_2 = Client.objects.create(
+            first_name='client',
+            last_name='two',
+            email='client@two.com',
+            phone='0620202020',
+            compagny=compagny,
+            contact=cls.support
+        )
+        cls.contract = Contract.objects.create(
+            client=cls.client_1,
+            price=100,
+            balance=100,
+            signed=True
+        )
+        cls.event = Event.objects.create(
+            name='event',
+            start_date=datetime(2024, 1, 10, hour=10),
+            end_date=datetime(2024, 1, 10, hour=18),
+            location='location',
+            attendees=10,
+            contract=cls.contract,
+            contact=cls.support
+        )
+
+
+class TestOwnershipBackend(BackendTestCase):
+    backend = OwnershipBackend()
+
+    def test_contact_perms(self):
+        self.assertTrue(
+            self.backend.has_perm(
+                self.user,
+                'orm.change_client',
+                self.client_1
+            )
+        )
+        self.assertTrue(
+            self.backend.has_perm(self.user, 'change_contract', self.contract)
+        )
+        self.assertTrue(
+            self.backend.has_perm(self.support, 'change_event', self.event)
+        )
+
+    def test_other_user_perms(self):
+        self.assertFalse(
+            self.backend.has_perm(self.support, 'change_client', self.client_1)
+        )
+        self.assertFalse(
+            self.backend.has_perm(self.user, 'change_client', self.client_2)
+        )
+        self.assertFalse(
+            self.backend.has_perm(self.user, 'change_event', self.event)
+        )
+
+    def test_no_object(self):
+        self.assertFalse(self.backend.has_perm(self.user, 'orm.add_client'))
+        self.assertEqual(self.backend.get_all_permissions(self.user), set())
+
+    def test_inactive_user(self):
+        self.user.is_active = False
+        self.addCleanup(setattr, self.user, 'is_active', True)
+        self.assertFalse(
+            self.backend.has_perm(self.user, 'change_client', self.client_1)
+        )
+
+    def test_owner_paths_of_model_only(self):
+        with patch.dict(OWNERS, {'orm.change_subevent': 'contact'}):
+            self.assertEqual(
+                get_owner_paths(Event),
+                {'orm.change_event': 'contact'}
+            )
+
+    def test_no_permission_row_read(self):
+        with self.assertNumQueries(0):
+            self.backend.has_perm(self.user, 'change_client', self.client_1)
+        # the contact of the client of the contract
+        with self.assertNumQueries(1):
+            self.backend.has_perm(self.user, 'change_contract', self.contract)
+
+    def test_get_all_permissions(self):
+        self.assertEqual(
+            self.backend.get_all_permissions(self.user, self.contract),
+            {'orm.change_contract'}
+        )
+
+
+class TestOwnershipPermsCommand(BackendTestCase):
+    def call(self, *args):
+        stdout = StringIO()
+        call_command('ownershipperms', *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_compare(self):
+        assign_perm('change_client', self.user, self.client_1)
+        assign_perm('change_client', self.user, self.client_2)
+        self.assertEqual(
+            compare_owner_rows(),
+            {
+                'orm.change_client': (1, 1, 1),
+                'orm.change_contract': (0, 0, 1),
+                'orm.change_event': (0, 0, 1),
+            }
+        )
+        self.assertIn(
+            'orm.change_client: 1 rows of the contact, '
+            '1 rows of another user, 1 contacts without row',
+            self.call()
+        )
+
+    def test_create(self):
+        assign_perm('change_client', self.user, self.client_1)
+        self.call('--create')
+        self.assertEqual(
+            list(get_users_with_perms(self.contract)),
+            [self.user]
+        )
+        self.assertEqual(
+            list(get_users_with_perms(self.event)),
+            [self.support]
+        )
+        for counts in compare_owner_rows().values():
+            self.assertEqual(counts[1:], (0, 0))
+
+    def test_create_twice(self):
+        assign_perm('change_client', self.user, self.client_1)
+        self.assertIn(
+            '3 missing contact rows created', self.call('--create')
+        )
+        self.assertIn(
+            '0 missing contact rows created', self.call('--create')
+        )
+
+    def test_delete_with_guardian(self):
+        assign_perm('change_client', self.user, self.client_1)
+        with self.assertRaisesMessage(CommandError, 'OBJECT_PERMISSIONS'):
+            self.call('--delete')
+        self.assertTrue(get_users_with_perms(self.client_1))
+
+    @override_settings(OBJECT_PERMISSIONS='ownership')
+    def test_delete(self):
+        assign_perm('change_client', self.user, self.client_1)
+        assign_perm('change_client', self.user, self.client_2)
+        self.assertIn('2 rows deleted.', self.call('--delete'))
+        self.assertFalse(get_users_with_perms(self.client_1))
+        self.assertFalse(get_users_with_perms(self.client_2))
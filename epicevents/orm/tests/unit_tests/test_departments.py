@@ -0,0 +1,71 @@
+from django.test import TestCase
+from django.contrib.auth.models import Group
+from orm.models import User
+from orm.departments import (
+    DEPARTMENTS,
+    get_departments,
+    get_department,
+    clear_departments,
+)
+
+
+class TestDepartments(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            first_name='user',
+            last_name='sales',
+            email='user@sales.com',
+            phone='0611111111',
+            password='password',
+            department=Group.objects.get(name='sales')
+        )
+        cls.admin = User.objects.create_superuser(
+            email='admin@admin.com',
+            phone='0699999999',
+            password='password'
+        )
+
+    def tearDown(self):
+        # loaded again by the next test using them
+        clear_departments()
+
+    def test_departments_loaded_once(self):
+        clear_departments()
+        with self.assertNumQueries(1):
+            groups = get_departments()
+        self.assertEqual(sorted(groups), DEPARTMENTS)
+        with self.assertNumQueries(0):
+            group = get_department('sales')
+        self.assertEqual(group, Group.objects.get(name='sales'))
+
+    def test_unknown_department(self):
+        with self.assertRaises(KeyError):
+            get_department('unknown')
+
+    def test_department_from_prefetched_groups(self):
+        get_departments()
+        user = User.objects.prefetch_related('groups').get(id=self.user.id)
+        with self.assertNumQueries(0):
+            self.assertEqual(user.department, get_department('sales'))
+
+    def test_department_read_once(self):
+        get_departments()
+        user = User.objects.get(id=self.user.id)
+        with self.assertNumQueries(1):
+            self.assertEqual(user.department.name, 'sales')
+            self.assertEqual(user.department.name, 'sales')
+
+    def test_department_of_admin(self):
+        admin = User.objects.get(id=self.admin.id)
+        self.assertIsNone(admin.department)
+
+    def test_department_set_after_change(self):
+        user = User.objects.get(id=self.user.id)
+        support = get_department('support')
+        user.groups.set([support])
+        user.department = support
+        with self.assertNumQueries(0):
+            self.assertEqual(user.department, support)
+        user.refresh_from_db()
+        self.assertEqual(user.department, support)
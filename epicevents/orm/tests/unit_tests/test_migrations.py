@@ -0,0 +1,48 @@
+from io import StringIO
+from django.test import SimpleTestCase
+from django.db import connection
+from django.db.migrations.loader import MigrationLoader
+from django.core.management import call_command
+
+
+class TestMigrations(SimpleTestCase):
+    """Run the tests with DATABASE_URL set to check the migrations
+    on another backend.
+    """
+    # sqlmigrate only reads the database, SQLite cannot build the
+    # schema editor inside the transaction of a TestCase
+    databases = {'default'}
+
+    def test_no_missing_migration(self):
+        call_command(
+            'makemigrations',
+            'orm',
+            check=True,
+            dry_run=True,
+            stdout=StringIO()
+        )
+
+    def test_sql_of_each_migration(self):
+        loader = MigrationLoader(connection)
+        names = sorted(
+            name for app_label, name in loader.disk_migrations
+            if app_label == 'orm'
+        )
+        self.assertTrue(names)
+        for name in names:
+            for backwards in [False, True]:
+                with self.subTest(migration=name, backwards=backwards):
+                    stdout = StringIO()
+                    call_command(
+                        'sqlmigrate',
+                        'orm',
+                        name,
+                        backwards=backwards,
+                        stdout=stdout
+                    )
+                    self.assertTrue(stdout.getvalue())
+
+    def test_partial_indexes(self):
+        stdout = StringIO()
+        call_command('sqlmigrate', 'orm', '0004', stdout=stdout)
+        self.assertEqual(stdout.getvalue().count('WHERE'), 4)
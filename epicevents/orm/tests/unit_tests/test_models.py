@@ -1,6 +1,8 @@
+from datetime import datetime
 from django.test import TestCase
+from django.core.exceptions import ValidationError
 from django.contrib.auth.models import Group
-from orm.models import User
+from orm.models import User, Client, Compagny, Contract, Event
 
 
 class TestUserManager(TestCase):
@@ -109,3 +111,203 @@ class TestUserManager(TestCase):
         )
         self.assertEqual(user_count + 1, User.objects.count())
         self.assertTrue(user.is_superuser)
+
+
+class TestFullName(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='test@test.com',
+            first_name='first_name',
+            last_name='last_name',
+            phone='0611111111',
+            password='password',
+            department=Group.objects.get(name='sales')
+        )
+        cls.client_1 = Client.objects.create(
+            first_name='client',
+            last_name='one',
+            email='client@one.com',
+            phone='0610101010',
+            compagny=Compagny.objects.create(name='test_compagny'),
+            contact=cls.user
+        )
+
+    def test_full_name_set_on_create(self):
+        self.assertEqual(
+            User.objects.get(full_name='first_name last_name'),
+            self.user
+        )
+        self.assertEqual(
+            Client.objects.get(full_name='client one'),
+            self.client_1
+        )
+
+    def test_full_name_updated_on_save(self):
+        self.client_1.last_name = 'two'
+        self.client_1.save()
+        self.assertTrue(Client.objects.filter(full_name='client two'))
+
+    def test_full_name_saved_with_update_fields(self):
+        self.user.first_name = 'new'
+        self.user.save(update_fields=['first_name'])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.full_name, 'new last_name')
+
+
+class TestCleanChangedFields(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email='test@test.com',
+            first_name='first_name',
+            last_name='last_name',
+            phone='0611111111',
+            password='password',
+            department=Group.objects.get(name='sales')
+        )
+        cls.compagny = Compagny.objects.create(name='test_compagny')
+        cls.client_1 = Client.objects.create(
+            first_name='client',
+            last_name='one',
+            email='client@one.com',
+            phone='0610101010',
+            compagny=cls.compagny,
+            contact=cls.user
+        )
+        cls.contract = Contract.objects.create(
+            client=cls.client_1,
+            price=100,
+            balance=100,
+            signed=True
+        )
+        cls.event = Event.objects.create(
+            name='event',
+            start_date=datetime(2024, 1, 10, hour=10),
+            end_date=datetime(2024, 1, 10, hour=18),
+            location='location',
+            attendees=10,
+            contract=cls.contract,
+            contact=cls.user
+        )
+
+    def test_new_instance_all_fields_dirty(self):
+        client = Client(first_name='client', last_name='two')
+        self.assertIn('email', client.get_dirty_fields())
+        self.assertIn('compagny', client.get_dirty_fields())
+
+    def test_loaded_instance_no_dirty_field(self):
+        client = Client.objects.get(id=self.client_1.id)
+        self.assertEqual(client.get_dirty_fields(), set())
+        client.phone = '0620202020'
+        self.assertEqual(client.get_dirty_fields(), {'phone'})
+
+    def test_saved_instance_no_dirty_field(self):
+        client = Client.objects.get(id=self.client_1.id)
+        client.phone = '0620202020'
+        client.save()
+        self.assertEqual(client.get_dirty_fields(), set())
+
+    def test_deferred_field_dirty_once_set(self):
+        client = Client.objects.only('id').get(id=self.client_1.id)
+        self.assertEqual(client.get_dirty_fields(), set())
+        client.phone
+        self.assertEqual(client.get_dirty_fields(), set())
+        client.email = 'client@two.com'
+        self.assertEqual(client.get_dirty_fields(), {'email'})
+
+    def test_save_unchanged_no_validation_query(self):
+        client = Client.objects.get(id=self.client_1.id)
+        with self.assertNumQueries(1):
+            client.save()
+
+    def test_save_note_no_validation_query(self):
+        event = Event.objects.get(id=self.event.id)
+        event.note = 'note'
+        with self.assertNumQueries(1):
+            event.save(update_fields=['note'])
+        self.assertEqual(Event.objects.get(id=self.event.id).note, 'note')
+
+    def test_save_signed_no_validation_query(self):
+        contract = Contract.objects.get(id=self.contract.id)
+        contract.signed = False
+        with self.assertNumQueries(1):
+            contract.save(update_fields=['signed'])
+
+    def test_save_changed_unique_field(self):
+        client = Client.objects.get(id=self.client_1.id)
+        client.email = 'client@two.com'
+        # the unique check of email only
+        with self.assertNumQueries(2):
+            client.save()
+
+    def test_save_skip_unique_checks(self):
+        client = Client.objects.get(id=self.client_1.id)
+        client.email = 'client@two.com'
+        with self.assertNumQueries(1):
+            client.save(validate_unique=False)
+
+    def test_save_changed_foreign_key(self):
+        contract = Contract.objects.get(id=self.contract.id)
+        contract.client = Client.objects.create(
+            first_name='client',
+            last_name='two',
+            email='client@two.com',
+            phone='0620202020',
+            compagny=self.compagny,
+            contact=self.user
+        )
+        # the existence of the client
+        with self.assertNumQueries(2):
+            contract.save()
+
+    def test_save_validates_changed_fields(self):
+        client = Client.objects.get(id=self.client_1.id)
+        client.email = 'not an email'
+        with self.assertRaises(ValidationError):
+            client.save()
+
+    def test_save_validates_unique_changed_field(self):
+        client = Client.objects.create(
+            first_name='client',
+            last_name='two',
+            email='client@two.com',
+            phone='0620202020',
+            compagny=self.compagny,
+            contact=self.user
+        )
+        client.phone = self.client_1.phone
+        with self.assertRaises(ValidationError):
+            client.save()
+
+    def test_save_new_instance_validates_all_fields(self):
+        client = Client(
+            first_name='client',
+            last_name='two',
+            email=self.client_1.email,
+            phone='0620202020',
+            compagny=self.compagny,
+            contact=self.user
+        )
+        with self.assertRaises(ValidationError):
+            client.save()
+
+    def test_update_fields_only_cleaned(self):
+        contract = Contract.objects.get(id=self.contract.id)
+        contract.price = -1
+        contract.signed = False
+        contract.save(update_fields=['signed'])
+        self.assertEqual(contract.get_dirty_fields(), {'price'})
+
+    def test_save_dirty_fields_unchanged(self):
+        client = Client.objects.get(id=self.client_1.id)
+        client.phone = self.client_1.phone
+        with self.assertNumQueries(0):
+            self.assertEqual(client.save_dirty_fields(), set())
+
+    def test_save_dirty_fields_user(self):
+        user = User.objects.get(id=self.user.id)
+        user.last_name = 'new'
+        self.assertEqual(user.save_dirty_fields(), {'last_name'})
+        self.assertTrue(User.objects.filter(full_name='first_name new'))
+        self.assertEqual(user.get_dirty_fields(), set())
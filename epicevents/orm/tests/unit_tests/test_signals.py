@@ -0,0 +1,124 @@
+from io import StringIO
+from unittest import skipUnless
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.db import connection, connections
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.contrib.auth.models import Group, Permission
+from orm.signals import (
+    DEPARTMENTS,
+    create_department_group,
+    sync_base_permissions
+)
+
+
+@skipUnless(connection.vendor == 'sqlite', 'SQLite pragmas')
+class TestSqlitePragmas(TestCase):
+    def get_pragmas(self, *pragmas):
+        """Open a new connection and read pragmas"""
+        new_connection = connections.create_connection('default')
+        try:
+            with new_connection.cursor() as cursor:
+                values = []
+                for pragma in pragmas:
+                    cursor.execute(f'PRAGMA {pragma}')
+                    values.append(cursor.fetchone()[0])
+                return values
+        finally:
+            new_connection.close()
+
+    def test_default_pragmas(self):
+        self.assertEqual(
+            self.get_pragmas('synchronous', 'cache_size', 'temp_store'),
+            [1, -64000, 2]
+        )
+
+    @override_settings(SQLITE_PRAGMAS={
+        'synchronous': 'FULL',
+        'cache_size': -1000,
+        'temp_store': 'file',
+    })
+    def test_pragmas_from_settings(self):
+        self.assertEqual(
+            self.get_pragmas('synchronous', 'cache_size', 'temp_store'),
+            [2, -1000, 1]
+        )
+
+    @override_settings(SQLITE_PRAGMAS={})
+    def test_no_tuning(self):
+        self.assertEqual(
+            self.get_pragmas('synchronous', 'temp_store'),
+            [2, 0]
+        )
+
+    @override_settings(SQLITE_PRAGMAS={'synchronous': 'sometimes'})
+    def test_invalid_choice(self):
+        self.assertRaises(ImproperlyConfigured, self.get_pragmas)
+
+    @override_settings(SQLITE_PRAGMAS={'cache_size': '1; DROP TABLE x'})
+    def test_invalid_size(self):
+        self.assertRaises(ValueError, self.get_pragmas)
+
+
+class TestBasePermissions(TestCase):
+    def get_codenames(self, name):
+        return set(
+            Group.objects.get(name=name).permissions.values_list(
+                'codename',
+                flat=True
+            )
+        )
+
+    def test_department_groups(self):
+        create_department_group(sender=None)
+        self.assertEqual(
+            set(Group.objects.values_list('name', flat=True)),
+            set(DEPARTMENTS)
+        )
+
+    def test_permissions_from_settings(self):
+        for name in DEPARTMENTS:
+            with self.subTest(name=name):
+                self.assertEqual(
+                    self.get_codenames(name),
+                    {*settings.PERMISSIONS[name], *settings.PERMISSIONS['all']}
+                )
+
+    def test_sync_nothing_missing(self):
+        # permissions, groups and links are read, nothing is written
+        with self.assertNumQueries(3):
+            self.assertEqual(sync_base_permissions(), (0, 0))
+
+    def test_sync_missing_permission(self):
+        group = Group.objects.get(name='sales')
+        group.permissions.remove(
+            Permission.objects.get(codename='add_client')
+        )
+        self.assertEqual(sync_base_permissions(), (1, 0))
+        self.assertIn('add_client', self.get_codenames('sales'))
+
+    def test_sync_prune(self):
+        group = Group.objects.get(name='support')
+        group.permissions.add(
+            Permission.objects.get(codename='delete_user')
+        )
+        self.assertEqual(sync_base_permissions(), (0, 0))
+        self.assertEqual(sync_base_permissions(prune=True), (0, 1))
+        self.assertNotIn('delete_user', self.get_codenames('support'))
+        self.assertIn('change_event', self.get_codenames('support'))
+
+    def test_unknown_permission(self):
+        permissions = {**settings.PERMISSIONS, 'sales': ['unknown']}
+        with override_settings(PERMISSIONS=permissions):
+            with self.assertRaises(ImproperlyConfigured):
+                sync_base_permissions()
+
+    def test_command(self):
+        Group.objects.get(name='management').permissions.clear()
+        stdout = StringIO()
+        call_command('syncpermissions', stdout=stdout)
+        self.assertIn(
+            f"{len(self.get_codenames('management'))} permissions added",
+            stdout.getvalue()
+        )